@@ -6,22 +6,57 @@ This module exposes an Engine and a few helper functions to look up
 airports, runways, runway ends and navaids.
 """
 
+import functools
+import json
 import logging
 import os
-from collections.abc import Iterable, Iterator
+import time
+from collections.abc import Callable, Collection, Iterable, Iterator
 from contextlib import contextmanager
-from functools import lru_cache
 from typing import Any
-
-from sqlalchemy import create_engine, select
+from urllib.parse import quote
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    bindparam,
+    create_engine,
+    event,
+    func,
+    inspect,
+    select,
+    tuple_,
+    union_all,
+)
 from sqlalchemy.engine import Connection
 from sqlalchemy.engine import Engine as SAEngine
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.orm import Load, Session, sessionmaker, with_parent
 from sqlalchemy.util import LRUCache
 
-from aeroinfo.database.models.apt import Airport, Runway, RunwayEnd
+from aeroinfo.database.cache import (
+    MISSING,
+    LookupCache,
+    PartitionedCache,
+    estimate_size,
+)
+from aeroinfo.database.models.apt import (
+    Airport,
+    AirportRemark,
+    AttendanceSchedule,
+    Runway,
+    RunwayEnd,
+)
+from aeroinfo.database.models.imports import (  # noqa: F401 - registers its table
+    FacilityFingerprint,
+)
 from aeroinfo.database.models.nav import Navaid
+from aeroinfo.database.serializers import compile_fields, compile_rows
+from aeroinfo.database.shared_cache import (
+    DEFAULT_SLOT_SIZE,
+    DEFAULT_SLOTS,
+    SharedCache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +80,47 @@ def _env_int(name: str, default: int) -> int:
 _CACHE_ENABLED = _parse_bool(os.getenv("AEROINFO_CACHE_ENABLED"), default=True)
 _AIRPORT_CACHE_SIZE = _env_int("AEROINFO_CACHE_AIRPORT_SIZE", 512)
 _NAVAID_CACHE_SIZE = _env_int("AEROINFO_CACHE_NAVAID_SIZE", 512)
+# Optional byte budgets (estimated) and time to live in seconds; 0 disables.
+_AIRPORT_CACHE_BYTES = _env_int("AEROINFO_CACHE_AIRPORT_BYTES", 0)
+_NAVAID_CACHE_BYTES = _env_int("AEROINFO_CACHE_NAVAID_BYTES", 0)
+_CACHE_TTL = _env_int("AEROINFO_CACHE_TTL", 0)
 _CACHE_GENERATION = 0
+# Load only the columns to_dict() returns for the requested include groups.
+_PROJECT_COLUMNS = _parse_bool(os.getenv("AEROINFO_PROJECT_COLUMNS"), default=False)
+# File backing the cross-process payload cache, e.g. /dev/shm/aeroinfo.cache.
+_SHARED_CACHE_PATH = os.getenv("AEROINFO_SHARED_CACHE")
+_SHARED_CACHE_SLOTS = _env_int("AEROINFO_SHARED_CACHE_SLOTS", DEFAULT_SLOTS)
+_SHARED_CACHE_SLOT_SIZE = _env_int("AEROINFO_SHARED_CACHE_SLOT_SIZE", DEFAULT_SLOT_SIZE)
+_SQLITE_PROFILE = os.getenv("AEROINFO_SQLITE_PROFILE")
+# DB_RDBM value for a read-only snapshot written by aeroinfo/export_snapshot.py.
+SNAPSHOT_RDBM = "sqlite-snapshot"
+
+# Per-connection PRAGMAs for SQLite databases. "load" trades durability for
+# speed while an import builds a database nobody else is using: the rollback
+# journal lives in memory (so a failed import still rolls back, but a crash
+# mid-import can corrupt the file) and nothing is fsynced. "read" suits a
+# finished snapshot in WAL mode that is mostly read.
+_SQLITE_PROFILES: dict[str, dict[str, str | int]] = {
+    "load": {
+        "journal_mode": "MEMORY",
+        "synchronous": "OFF",
+        "cache_size": -262144,  # KiB, so 256 MiB
+        "temp_store": "MEMORY",
+        "mmap_size": 1 << 30,
+    },
+    "read": {
+        "synchronous": "NORMAL",
+        "cache_size": -65536,
+        "temp_store": "MEMORY",
+        "mmap_size": 1 << 30,
+    },
+    "snapshot": {
+        "query_only": "ON",
+        "cache_size": -65536,
+        "temp_store": "MEMORY",
+        "mmap_size": 1 << 30,
+    },
+}
 
 
 def get_db_url() -> str:
@@ -74,6 +149,12 @@ def get_db_url() -> str:
             )
             raise RuntimeError(msg)
         url = f"{db_rdbm}://{db_host}"
+    elif db_rdbm == SNAPSHOT_RDBM:
+        if not db_host:
+            msg = f"DB_RDBM={SNAPSHOT_RDBM} requires DB_HOST to be set to the snapshot file."
+            raise RuntimeError(msg)
+        # immutable=1 skips locking and change detection; the file never changes.
+        url = f"sqlite:///file:{quote(db_host)}?mode=ro&immutable=1&uri=true"
     else:
         missing = [
             name
@@ -102,8 +183,14 @@ def _create_engine_safely(overrides: dict[str, Any]) -> SAEngine:
         engine_kwargs = overrides.copy()
 
         compiled_cache_size = engine_kwargs.pop("compiled_cache_size", 0)
+        sqlite_profile = engine_kwargs.pop(
+            "sqlite_profile",
+            "snapshot" if os.getenv("DB_RDBM") == SNAPSHOT_RDBM else _SQLITE_PROFILE,
+        )
 
         engine = create_engine(url, future=True, **engine_kwargs)
+        if sqlite_profile and engine.dialect.name == "sqlite":
+            _apply_sqlite_profile(engine, sqlite_profile)
         if compiled_cache_size:
             engine = engine.execution_options(
                 compiled_cache=LRUCache(compiled_cache_size)
@@ -118,6 +205,49 @@ def _create_engine_safely(overrides: dict[str, Any]) -> SAEngine:
         ) from exc
 
 
+def _apply_sqlite_profile(engine: SAEngine, profile: str) -> None:
+    """Set the PRAGMAs of a ``_SQLITE_PROFILES`` entry on each new connection."""
+    try:
+        pragmas = _SQLITE_PROFILES[profile]
+    except KeyError:
+        msg = f"Unknown SQLite profile {profile!r}; expected one of: " + ", ".join(
+            _SQLITE_PROFILES
+        )
+        raise RuntimeError(msg) from None
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection: Any, _record: object) -> None:  # noqa: ANN401
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name} = {value}")
+        finally:
+            cursor.close()
+
+
+def optimize_sqlite(engine: SAEngine | None = None) -> None:
+    """
+    Prepare a freshly loaded SQLite database for readers.
+
+    Refreshes the planner statistics, rebuilds the file without the free
+    pages an import leaves behind and switches it to WAL mode, which
+    persists in the file. Does nothing for other databases.
+    """
+    target = engine if engine is not None else Engine
+    if target.dialect.name != "sqlite":
+        return
+    with target.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for statement in (
+            "ANALYZE",
+            "VACUUM",
+            "PRAGMA journal_mode = WAL",
+            "PRAGMA wal_checkpoint(TRUNCATE)",
+        ):
+            start = time.perf_counter()
+            conn.exec_driver_sql(statement)
+            logger.info("%s took %.1fs", statement, time.perf_counter() - start)
+
+
 class _LazyEngine:
     """
     Proxy object that lazily constructs a SQLAlchemy Engine on first use.
@@ -168,6 +298,12 @@ Engine = _LazyEngine()
 SessionLocal = sessionmaker(bind=Engine, expire_on_commit=False, future=True)
 
 
+def resolve_engine(engine: SAEngine | _LazyEngine | None = None) -> SAEngine:
+    """Return the SQLAlchemy Engine behind ``engine`` (default ``Engine``), creating it if needed."""
+    target = Engine if engine is None else engine
+    return target._ensure() if isinstance(target, _LazyEngine) else target
+
+
 def configure_engine(**overrides: object) -> None:
     """Reconfigure (or swap) the lazily created Engine."""
     Engine.configure(**overrides)
@@ -213,100 +349,400 @@ def _prepare_include(
     return include_flags, include_key
 
 
-def _fetch_airport(
-    session: Session, identifier: str, include_flags: frozenset[str]
-) -> Airport | None:
-    queryoptions = []
+# Collections each include flag eagerly loads with a model, and the model
+# they hold if to_dict() serializes it (with no include groups, so the held
+# model's own flags don't apply).
+_COLLECTIONS: dict[type, dict[str, tuple[Any, type | None]]] = {
+    Airport: {
+        "runways": (Airport.runways, Runway),
+        "remarks": (Airport.remarks, None),
+        "attendance": (Airport.attendance_schedules, None),
+    },
+    Runway: {"runway_ends": (Runway.runway_ends, RunwayEnd)},
+    RunwayEnd: {},
+}
+
+
+def _collection_paths(
+    model: type, include_flags: frozenset[str]
+) -> list[tuple[tuple[Any, ...], type | None]]:
+    """Return the relationship paths to eagerly load, and the models they hold."""
+    return [
+        ((collection,), target)
+        for flag, (collection, target) in _COLLECTIONS[model].items()
+        if flag in include_flags
+    ]
+
+
+def _project(load: Load, model: type, include_flags: frozenset[str]) -> Load:
+    """Restrict ``load`` to the columns ``model.to_dict(include)`` returns."""
+    names = set(compile_fields(model, include_flags).names)
+    mapper = inspect(model)
+    wanted, unwanted = [], []
+    for prop in mapper.column_attrs:
+        if prop.key in names:
+            wanted.append(getattr(model, prop.key))
+        elif not any(column.primary_key for column in prop.columns):
+            unwanted.append(getattr(model, prop.key))
+
+    # Statement cache keys are rebuilt from the options on every execution,
+    # at a cost proportional to the columns they name: name the fewer.
+    if len(wanted) <= len(unwanted):
+        return load.load_only(*wanted)
+    for attr in unwanted:
+        load = load.defer(attr)
+    return load
+
+
+@functools.cache
+def _build_options(
+    model: type, include_flags: frozenset[str], *, project: bool
+) -> tuple[Load, ...]:
+    # Built once per include set rather than per lookup.
+    queryoptions = [_project(Load(model), model, include_flags)] if project else []
+
+    # A single collection is joined into the lookup's own query. Joining two
+    # or more would return their cartesian product (runways x remarks x
+    # schedules) for SQLAlchemy to de-duplicate, so then each collection is
+    # loaded with one extra SELECT ... WHERE key IN (...) instead.
+    paths = _collection_paths(model, include_flags)
+    joined = len(paths) == 1
+    for path, target in paths:
+        load = Load(model)
+        for collection in path:
+            load = (
+                load.joinedload(collection) if joined else load.selectinload(collection)
+            )
+        if project and target is not None:
+            load = _project(load, target, frozenset())
+        queryoptions.append(load)
 
-    if "runways" in include_flags:
-        queryoptions.append(Load(Airport).joinedload(Airport.runways))
+    return tuple(queryoptions)
 
-    if "remarks" in include_flags:
-        queryoptions.append(Load(Airport).joinedload(Airport.remarks))
 
-    if "attendance" in include_flags:
-        queryoptions.append(Load(Airport).joinedload(Airport.attendance_schedules))
+def _load_options(model: type, include_flags: frozenset[str]) -> tuple[Load, ...]:
+    """Return the loader options for ``model`` lookups with these include flags."""
+    return _build_options(model, include_flags, project=_PROJECT_COLUMNS)
 
+
+def _airport_options(include_flags: frozenset[str]) -> tuple[Load, ...]:
+    return _load_options(Airport, include_flags)
+
+
+# Statement builders shared with the async helpers in aeroinfo.database.aio.
+
+
+def _airport_stmt(identifier: str, include_flags: frozenset[str]) -> Select:
     return (
-        session.query(Airport)
-        .filter((Airport.faa_id == identifier) | (Airport.icao_id == identifier))
+        select(Airport)
+        .where((Airport.faa_id == identifier) | (Airport.icao_id == identifier))
         .order_by(Airport.effective_date.desc())
-        .options(*queryoptions)
-        .first()
+        .options(*_airport_options(include_flags))
+        .limit(1)
     )
 
 
-def _fetch_navaid(
-    session: Session, identifier: str, facility_type: str
-) -> Navaid | None:
+def _airports_stmt(
+    identifiers: Collection[str], include_flags: frozenset[str]
+) -> Select:
+    """Select (identifier, newest Airport) for each FAA or ICAO identifier."""
+    matches = union_all(
+        select(
+            Airport.faa_id.label("identifier"),
+            Airport.facility_site_number,
+            Airport.effective_date,
+        ).where(Airport.faa_id.in_(identifiers)),
+        select(
+            Airport.icao_id.label("identifier"),
+            Airport.facility_site_number,
+            Airport.effective_date,
+        ).where(Airport.icao_id.in_(identifiers)),
+    ).subquery()
+    ranked = select(
+        matches.c.identifier,
+        matches.c.facility_site_number,
+        func.row_number()
+        .over(
+            partition_by=matches.c.identifier,
+            order_by=matches.c.effective_date.desc(),
+        )
+        .label("rank"),
+    ).subquery()
     return (
-        session.query(Navaid)
-        .filter(
+        select(ranked.c.identifier, Airport)
+        .join(Airport, Airport.facility_site_number == ranked.c.facility_site_number)
+        .where(ranked.c.rank == 1)
+        .options(*_airport_options(include_flags))
+    )
+
+
+def _navaid_stmt(identifier: str, facility_type: str) -> Select:
+    return (
+        select(Navaid)
+        .where(
             (Navaid.facility_id == identifier) & (Navaid.facility_type == facility_type)
         )
         .order_by(Navaid.effective_date.desc())
-        .first()
+        .limit(1)
     )
 
 
-if _CACHE_ENABLED and _AIRPORT_CACHE_SIZE > 0:
+def _navaids_stmt(keys: Collection[tuple[str, str]]) -> Select:
+    # (facility_id, facility_type) is the primary key, so there's at most
+    # one row per key and no need to rank by effective_date.
+    return select(Navaid).where(
+        tuple_(Navaid.facility_id, Navaid.facility_type).in_(list(keys))
+    )
 
-    @lru_cache(maxsize=_AIRPORT_CACHE_SIZE)
-    def _airport_cache_lookup(
-        identifier: str, include_key: tuple[str, ...], generation: int
-    ) -> Airport | None:
-        # `generation` is part of the cache key so callers can invalidate by
-        # bumping it; reference it here to satisfy linters.
-        _ = generation
-        include_flags = frozenset(include_key)
-        with session_scope() as session:
-            return _fetch_airport(session, identifier, include_flags)
 
+def _airport_site(airport: Airport | str) -> Any:  # noqa: ANN401
+    """Return an airport's site number, or a subquery resolving its identifier."""
+    if isinstance(airport, Airport):
+        return airport.facility_site_number
+    identifier = _normalize_identifier(airport)
+    return (
+        select(Airport.facility_site_number)
+        .where((Airport.faa_id == identifier) | (Airport.icao_id == identifier))
+        .order_by(Airport.effective_date.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
 
-else:  # pragma: no cover - exercised when caching disabled via env
 
-    def _airport_cache_lookup(
-        identifier: str, include_key: tuple[str, ...], generation: int
-    ) -> Airport | None:
-        _ = generation
-        include_flags = frozenset(include_key)
-        with session_scope() as session:
-            return _fetch_airport(session, identifier, include_flags)
+def _runway_named(column: Any, site: Any, name: str) -> ColumnElement[bool]:  # noqa: ANN401
+    """Match the runway called ``name`` or the one with an end called ``name``."""
+    name = _normalize_identifier(name)
+    by_end = select(RunwayEnd.runway_name).where(
+        RunwayEnd.facility_site_number == site, RunwayEnd.id == name
+    )
+    return (column == name) | column.in_(by_end)
+
+
+def _runway_stmt(
+    name: str, airport: Airport | str, include_flags: frozenset[str]
+) -> Select:
+    site = _airport_site(airport)
+    return (
+        select(Runway)
+        .where(Runway.facility_site_number == site)
+        .filter(_runway_named(Runway.name, site, name))
+        .options(*_load_options(Runway, include_flags))
+    )
+
+
+def _runway_end_stmt(
+    name: str,
+    runway: Runway | tuple[str, Airport | str],
+    include_flags: frozenset[str] = frozenset(),
+) -> Select:
+    if isinstance(runway, Runway):
+        criteria = with_parent(instance=runway, prop=Runway.runway_ends)
+    else:
+        runway_name, airport = runway
+        site = _airport_site(airport)
+        criteria = (RunwayEnd.facility_site_number == site) & _runway_named(
+            RunwayEnd.runway_name, site, runway_name
+        )
+    return (
+        select(RunwayEnd)
+        .where(criteria)
+        .filter(RunwayEnd.id == name.upper())
+        .options(*_load_options(RunwayEnd, include_flags))
+    )
+
+
+def _fetch_airport(
+    session: Session, identifier: str, include_flags: frozenset[str]
+) -> Airport | None:
+    stmt = _airport_stmt(identifier, include_flags)
+    return session.execute(stmt).unique().scalars().first()
+
+
+def _fetch_airports(
+    session: Session, identifiers: Collection[str], include_flags: frozenset[str]
+) -> dict[str, Airport]:
+    """Return the most recent Airport for each FAA or ICAO identifier found."""
+    stmt = _airports_stmt(identifiers, include_flags)
+    return {row.identifier: row.Airport for row in session.execute(stmt).unique()}
+
+
+def _fetch_navaid(
+    session: Session, identifier: str, facility_type: str
+) -> Navaid | None:
+    return session.execute(_navaid_stmt(identifier, facility_type)).scalars().first()
+
+
+def _fetch_navaids(
+    session: Session, keys: Collection[tuple[str, str]]
+) -> dict[tuple[str, str], Navaid]:
+    """Return the Navaid for each (identifier, facility type) found."""
+    return {
+        (navaid.facility_id, navaid.facility_type): navaid
+        for navaid in session.execute(_navaids_stmt(keys)).scalars()
+    }
+
+
+# Airports are partitioned by include key, since the same identifier loads
+# different data with different includes; navaids take no includes. The
+# partitions share the cache's limits.
+_airport_cache: PartitionedCache | None = None
+_navaid_cache: LookupCache | None = None
+# The limits configure_caches() last applied, and callbacks run after it so
+# caches kept elsewhere (the async ones in aeroinfo.database.aio) follow.
+_cache_settings: dict[str, Any] = {}
+_cache_listeners: list[Callable[[], None]] = []
+
+
+def configure_caches(
+    *,
+    airport_size: int = _AIRPORT_CACHE_SIZE,
+    navaid_size: int = _NAVAID_CACHE_SIZE,
+    airport_bytes: int = _AIRPORT_CACHE_BYTES,
+    navaid_bytes: int = _NAVAID_CACHE_BYTES,
+    ttl: float = _CACHE_TTL,
+    sizeof: Callable[[object], int] = estimate_size,
+) -> None:
+    """
+    Replace the lookup caches with empty ones using the given limits.
+
+    Sizes are entry counts (across all include combinations for airports)
+    and a size of 0 disables that cache. ``airport_bytes``/``navaid_bytes`` cap
+    the entries' estimated sizes, as measured by ``sizeof``, and ``ttl``
+    expires entries that many seconds after they were cached; 0 means no
+    limit. Defaults come from the AEROINFO_CACHE_* environment variables.
+    The async caches in ``aeroinfo.database.aio``, once imported, are
+    replaced with ones using the same limits.
+    """
+    global _airport_cache, _navaid_cache
+    _airport_cache = (
+        PartitionedCache(
+            airport_size,
+            max_bytes=airport_bytes or None,
+            ttl=ttl or None,
+            sizeof=sizeof,
+        )
+        if _CACHE_ENABLED and airport_size > 0
+        else None
+    )
+    _navaid_cache = (
+        LookupCache(
+            navaid_size, max_bytes=navaid_bytes or None, ttl=ttl or None, sizeof=sizeof
+        )
+        if _CACHE_ENABLED and navaid_size > 0
+        else None
+    )
+    _cache_settings.update(
+        airport_size=airport_size,
+        navaid_size=navaid_size,
+        airport_bytes=airport_bytes,
+        navaid_bytes=navaid_bytes,
+        ttl=ttl,
+        sizeof=sizeof,
+    )
+    for listener in _cache_listeners:
+        listener()
+
+
+configure_caches()
+
+
+_shared_cache: SharedCache | None = None
+
+
+def configure_shared_cache(
+    path: str | os.PathLike[str] | None = _SHARED_CACHE_PATH,
+    *,
+    slots: int = _SHARED_CACHE_SLOTS,
+    slot_size: int = _SHARED_CACHE_SLOT_SIZE,
+) -> None:
+    """
+    Use the cross-process payload cache in the file at ``path``.
+
+    Every process configured with the same file shares its entries and its
+    generation, so ``invalidate_caches()`` in one process (as run after an
+    import) invalidates the lookup caches of all of them. ``slots`` and
+    ``slot_size`` only apply when the file is created. A ``path`` of None
+    disables the shared cache. Defaults come from the AEROINFO_SHARED_CACHE*
+    environment variables.
+    """
+    global _shared_cache
+    if _shared_cache is not None:
+        _shared_cache.close()
+    _shared_cache = (
+        SharedCache(path, slots=slots, slot_size=slot_size)
+        if _CACHE_ENABLED and path
+        else None
+    )
+
+
+configure_shared_cache()
 
 
-if _CACHE_ENABLED and _NAVAID_CACHE_SIZE > 0:
+def _current_generation() -> tuple[int, int]:
+    """Return the generation cache keys are stamped with, local and shared."""
+    shared = _shared_cache.generation if _shared_cache is not None else 0
+    return (_CACHE_GENERATION, shared)
 
-    @lru_cache(maxsize=_NAVAID_CACHE_SIZE)
-    def _navaid_cache_lookup(
-        identifier: str, facility_type: str, generation: int
-    ) -> Navaid | None:
-        _ = generation
+
+def cache_stats() -> dict[str, dict[str, object] | None]:
+    """
+    Return entry counts, estimated bytes and counters for the lookup caches.
+
+    Each cache reports its hits, misses, coalesced waits, evictions and
+    expirations; the airport cache also breaks them down by include key.
+    The shared cache reports this process's hits, misses and stores. A
+    disabled cache is reported as None.
+    """
+    return {
+        "airport": _airport_cache.stats() if _airport_cache is not None else None,
+        "navaid": _navaid_cache.stats() if _navaid_cache is not None else None,
+        "shared": _shared_cache.stats() if _shared_cache is not None else None,
+    }
+
+
+def _airport_cache_lookup(
+    identifier: str, include_key: tuple[str, ...], generation: tuple[int, int]
+) -> Airport | None:
+    # `generation` is part of the cache key so a lookup that raced an
+    # import can't store its result under the new generation.
+    def fetch() -> Airport | None:
         with session_scope() as session:
-            return _fetch_navaid(session, identifier, facility_type)
+            return _fetch_airport(session, identifier, frozenset(include_key))
 
+    if _airport_cache is None:
+        return fetch()
+    cache = _airport_cache.partition(include_key)
+    return cache.get_or_fetch((identifier, generation), fetch)  # type: ignore[return-value]
 
-else:  # pragma: no cover - exercised when caching disabled via env
 
-    def _navaid_cache_lookup(
-        identifier: str, facility_type: str, generation: int
-    ) -> Navaid | None:
-        _ = generation
+def _navaid_cache_lookup(
+    identifier: str, facility_type: str, generation: tuple[int, int]
+) -> Navaid | None:
+    def fetch() -> Navaid | None:
         with session_scope() as session:
             return _fetch_navaid(session, identifier, facility_type)
 
+    if _navaid_cache is None:
+        return fetch()
+    key = (identifier, facility_type, generation)
+    return _navaid_cache.get_or_fetch(key, fetch)  # type: ignore[return-value]
+
 
 def invalidate_caches() -> None:
-    """Clear local LRU caches, typically after running an import."""
+    """
+    Clear the lookup caches, typically after running an import.
+
+    With a shared cache configured this also invalidates the caches of the
+    other processes using it.
+    """
     global _CACHE_GENERATION
     _CACHE_GENERATION += 1
+    if _shared_cache is not None:
+        _shared_cache.bump_generation()
 
-    cache_clear = getattr(_airport_cache_lookup, "cache_clear", None)
-    if callable(cache_clear):
-        cache_clear()
-
-    cache_clear = getattr(_navaid_cache_lookup, "cache_clear", None)
-    if callable(cache_clear):
-        cache_clear()
+    for cache in (_airport_cache, _navaid_cache):
+        if cache is not None:
+            cache.clear()
 
 
 def find_airport(
@@ -320,7 +756,9 @@ def find_airport(
     Return the most recent Airport matching FAA or ICAO identifier.
 
     The optional "include" iterable can request joined collections like
-    "runways" or "remarks".
+    "runways" or "remarks". With AEROINFO_PROJECT_COLUMNS=1, only the
+    columns ``to_dict(include)`` returns are loaded; other attributes then
+    load on access while the session is open.
     """
     include_flags, include_key = _prepare_include(include)
     identifier_key = _normalize_identifier(identifier)
@@ -329,7 +767,7 @@ def find_airport(
     )
 
     if should_cache:
-        return _airport_cache_lookup(identifier_key, include_key, _CACHE_GENERATION)
+        return _airport_cache_lookup(identifier_key, include_key, _current_generation())
 
     with session_scope(session) as active_session:
         return _fetch_airport(active_session, identifier_key, include_flags)
@@ -344,30 +782,14 @@ def find_runway(
 ) -> Runway | None:
     """Return a Runway by name for a given airport (object or identifier)."""
     include_flags, _ = _prepare_include(include)
-    queryoptions = []
 
-    if "runway_ends" in include_flags:
-        queryoptions.append(Load(Runway).joinedload(Runway.runway_ends))
+    if not isinstance(airport, Airport | str):
+        msg = "Expecting str or Airport"
+        raise TypeError(msg)
 
     with session_scope(session) as active_session:
-        if isinstance(airport, Airport):
-            _airport = airport
-        elif isinstance(airport, str):
-            _airport = find_airport(airport, session=active_session, use_cache=False)
-            if _airport is None:
-                return None
-        else:
-            msg = "Expecting str or Airport"
-            raise TypeError(msg)
-
-        stmt = (
-            select(Runway)
-            .where(with_parent(instance=_airport, prop=Airport.runways))
-            .filter(Runway.name.like("%" + name + "%"))
-            .options(*queryoptions)
-        )
-
-        return active_session.execute(stmt).scalars().first()
+        stmt = _runway_stmt(name, airport, include_flags)
+        return active_session.execute(stmt).unique().scalars().first()
 
 
 def find_runway_end(
@@ -378,42 +800,21 @@ def find_runway_end(
     session: Session | None = None,
 ) -> RunwayEnd | None:
     """Return a RunwayEnd by id for a given runway or (runway_name, airport)."""
-    _ = include
-    with session_scope(session) as active_session:
-        if isinstance(runway, Runway):
-            _runway = runway
-        elif isinstance(runway, tuple):
-            __runway, airport = runway
-
-            if not isinstance(__runway, str):
-                msg = "Expecting runway name as str in runway tuple"
-                raise TypeError(msg)
-
-            if isinstance(airport, Airport):
-                _airport = airport
-            elif isinstance(airport, str):
-                _airport = find_airport(
-                    airport, session=active_session, use_cache=False
-                )
-                if _airport is None:
-                    return None
-            else:
-                msg = "Expecting str or Airport in runway tuple"
-                raise TypeError(msg)
-
-            _runway = find_runway(__runway, _airport, session=active_session)
-            if _runway is None:
-                return None
-        else:
-            msg = "Expecting Runway or tuple"
+    include_flags, _ = _prepare_include(include)
+    if isinstance(runway, tuple):
+        runway_name, airport = runway
+        if not isinstance(runway_name, str):
+            msg = "Expecting runway name as str in runway tuple"
             raise TypeError(msg)
+        if not isinstance(airport, Airport | str):
+            msg = "Expecting str or Airport in runway tuple"
+            raise TypeError(msg)
+    elif not isinstance(runway, Runway):
+        msg = "Expecting Runway or tuple"
+        raise TypeError(msg)
 
-        stmt = (
-            select(RunwayEnd)
-            .where(with_parent(instance=_runway, prop=Runway.runway_ends))
-            .filter(RunwayEnd.id == name.upper())
-        )
-
+    with session_scope(session) as active_session:
+        stmt = _runway_end_stmt(name, runway, include_flags)
         return active_session.execute(stmt).scalars().first()
 
 
@@ -436,8 +837,216 @@ def find_navaid(
 
     if should_cache:
         return _navaid_cache_lookup(
-            identifier_key, facility_type_key, _CACHE_GENERATION
+            identifier_key, facility_type_key, _current_generation()
         )
 
     with session_scope(session) as active_session:
         return _fetch_navaid(active_session, identifier_key, facility_type_key)
+
+
+def find_airports(
+    identifiers: Iterable[str],
+    include: Iterable[str] | None = None,
+    *,
+    session: Session | None = None,
+    use_cache: bool | None = None,
+) -> dict[str, Airport | None]:
+    """
+    Return the most recent Airport for each FAA or ICAO identifier.
+
+    The result maps each identifier as given to its Airport, or None if
+    none matches. Cached airports are served from the cache; the rest are
+    fetched with a single query.
+    """
+    include_flags, include_key = _prepare_include(include)
+    keys = {identifier: _normalize_identifier(identifier) for identifier in identifiers}
+    should_cache = (
+        use_cache if use_cache is not None else (_CACHE_ENABLED and session is None)
+    )
+    generation = _current_generation()
+
+    cache = _airport_cache.partition(include_key) if _airport_cache else None
+    found: dict[str, Airport | None] = {}
+    if should_cache and cache is not None:
+        for key in set(keys.values()):
+            cached = cache.get((key, generation))
+            if cached is not MISSING:
+                found[key] = cached  # type: ignore[assignment]
+
+    misses = set(keys.values()) - found.keys()
+    if misses:
+        with session_scope(session) as active_session:
+            fetched = _fetch_airports(active_session, misses, include_flags)
+        for key in misses:
+            found[key] = fetched.get(key)
+            if should_cache and cache is not None:
+                cache.put((key, generation), found[key])
+
+    return {identifier: found[key] for identifier, key in keys.items()}
+
+
+def find_navaids(
+    navaids: Iterable[tuple[str, str]],
+    include: Iterable[str] | None = None,
+    *,
+    session: Session | None = None,
+    use_cache: bool | None = None,
+) -> dict[tuple[str, str], Navaid | None]:
+    """
+    Return the most recent Navaid for each (identifier, facility type).
+
+    The result maps each pair as given to its Navaid, or None if none
+    matches. Cached navaids are served from the cache; the rest are
+    fetched with a single query.
+    """
+    _prepare_include(include)
+
+    keys = {
+        navaid: (_normalize_identifier(navaid[0]), _normalize_facility_type(navaid[1]))
+        for navaid in navaids
+    }
+    should_cache = (
+        use_cache if use_cache is not None else (_CACHE_ENABLED and session is None)
+    )
+    generation = _current_generation()
+
+    found: dict[tuple[str, str], Navaid | None] = {}
+    if should_cache and _navaid_cache is not None:
+        for key in set(keys.values()):
+            cached = _navaid_cache.get((*key, generation))
+            if cached is not MISSING:
+                found[key] = cached  # type: ignore[assignment]
+
+    misses = set(keys.values()) - found.keys()
+    if misses:
+        with session_scope(session) as active_session:
+            fetched = _fetch_navaids(active_session, misses)
+        for key in misses:
+            found[key] = fetched.get(key)
+            if should_cache and _navaid_cache is not None:
+                _navaid_cache.put((*key, generation), found[key])
+
+    return {navaid: found[key] for navaid, key in keys.items()}
+
+
+@functools.cache
+def _airport_payload_stmts(include_flags: frozenset[str]) -> dict[str, Select]:
+    """
+    Return the statements that build an airport payload with these flags.
+
+    They're built once per include set, with the identifier and site number
+    as bind parameters, so SQLAlchemy computes each one's cache key once
+    rather than on every lookup.
+    """
+    identifier = bindparam("identifier")
+    site = bindparam("site")
+    stmts = {
+        "airport": select(
+            Airport.facility_site_number,
+            *compile_rows(Airport, include_flags).columns,
+        )
+        .where((Airport.faa_id == identifier) | (Airport.icao_id == identifier))
+        .order_by(Airport.effective_date.desc())
+        .limit(1)
+    }
+    if "runways" in include_flags:
+        stmts["runways"] = (
+            select(*compile_rows(Runway, frozenset()).columns)
+            .where(Runway.facility_site_number == site)
+            .order_by(Runway.name)
+        )
+    if "remarks" in include_flags:
+        stmts["remarks"] = (
+            select(AirportRemark.remark)
+            .where(AirportRemark.facility_site_number == site)
+            .order_by(AirportRemark.remark_element_name)
+        )
+    if "attendance" in include_flags:
+        stmts["attendance"] = (
+            select(AttendanceSchedule.attendance_schedule)
+            .where(AttendanceSchedule.facility_site_number == site)
+            .order_by(AttendanceSchedule.sequence_number)
+        )
+    return stmts
+
+
+def _airport_payload(
+    connection: Connection, identifier: str, include_flags: frozenset[str]
+) -> dict[str, object] | None:
+    stmts = _airport_payload_stmts(include_flags)
+    row = connection.execute(stmts["airport"], {"identifier": identifier}).first()
+    if row is None:
+        return None
+    site, *values = row
+    payload = compile_rows(Airport, include_flags).payload(values)
+
+    if "runways" in stmts:
+        runways = compile_rows(Runway, frozenset())
+        result = connection.execute(stmts["runways"], {"site": site})
+        payload["runways"] = [runways.payload(runway) for runway in result]
+    for key in ("remarks", "attendance"):
+        if key in stmts:
+            result = connection.execute(stmts[key], {"site": site})
+            payload[key] = result.scalars().all()
+
+    return payload
+
+
+def fetch_airport_payload(
+    identifier: str,
+    include: Iterable[str] | None = None,
+    *,
+    session: Session | None = None,
+    as_json: bool = False,
+) -> dict[str, object] | bytes | None:
+    """
+    Return the most recent airport's ``to_dict(include)`` payload, uncached.
+
+    The payload is built straight from the selected rows, without creating
+    Airport instances, so it suits read-only responses. With ``as_json``
+    it is returned JSON-encoded (compact, UTF-8). Returns None if no
+    airport matches.
+    """
+    include_flags, _ = _prepare_include(include)
+    identifier_key = _normalize_identifier(identifier)
+    with session_scope(session) as active_session:
+        payload = _airport_payload(
+            active_session.connection(), identifier_key, include_flags
+        )
+    if as_json and payload is not None:
+        return json.dumps(payload, separators=(",", ":")).encode()
+    return payload
+
+
+def find_airport_payload(
+    identifier: str,
+    include: Iterable[str] | None = None,
+    *,
+    use_cache: bool | None = None,
+) -> dict[str, object] | None:
+    """
+    Return ``find_airport(identifier, include).to_dict(include)``.
+
+    With a shared cache configured, the payload is served from it when any
+    process has built it since the last invalidation. Otherwise it is
+    built by ``fetch_airport_payload`` (and stored in the shared cache).
+    Returns None if no airport matches.
+    """
+    _, include_key = _prepare_include(include)
+    identifier_key = _normalize_identifier(identifier)
+    should_cache = use_cache if use_cache is not None else _CACHE_ENABLED
+    shared = _shared_cache if should_cache else None
+
+    if shared is not None:
+        # Read before the lookup, so a payload built from data an import
+        # replaced meanwhile isn't stored under the new generation.
+        generation = shared.generation
+        key = f"airport:{identifier_key}:{','.join(include_key)}"
+        payload = shared.get(key)
+        if payload is not MISSING:
+            return payload  # type: ignore[return-value]
+
+    payload = fetch_airport_payload(identifier_key, include_key)
+    if shared is not None:
+        shared.put(key, payload, generation)
+    return payload
@@ -0,0 +1,322 @@
+#!/usr/bin/env python
+"""
+Async equivalents of the lookup helpers in ``aeroinfo.database``.
+
+The helpers run on a SQLAlchemy AsyncEngine built from the same DB_*
+environment variables, with asyncpg for PostgreSQL and aiosqlite for
+SQLite (``pip install aeroinfo[async]``), and take the same ``include``
+flags as their synchronous counterparts.
+
+Airport and navaid lookups are cached like the synchronous ones, and
+concurrent lookups of the same key share one in-flight query instead of
+each running their own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import NoSuchModuleError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+import aeroinfo.database as db
+from aeroinfo.database.cache import MISSING, LookupCache
+from aeroinfo.database.models.apt import Airport, Runway, RunwayEnd
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Hashable, Iterable
+
+    from aeroinfo.database.models.nav import Navaid
+
+logger = logging.getLogger(__name__)
+
+# Async DBAPI driver used for each database backend.
+_ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def get_async_db_url() -> str:
+    """Return the database URL from ``get_db_url`` with its async driver."""
+    url = make_url(db.get_db_url())
+    backend = url.get_backend_name()
+    try:
+        driver = _ASYNC_DRIVERS[backend]
+    except KeyError:
+        msg = (
+            f"No async driver known for DB_RDBM backend '{backend}'; "
+            "expected one of: " + ", ".join(_ASYNC_DRIVERS)
+        )
+        raise RuntimeError(msg) from None
+    return url.set(drivername=f"{backend}+{driver}").render_as_string(
+        hide_password=False
+    )
+
+
+class _LazyAsyncEngine:
+    """Create the AsyncEngine on first use, like ``aeroinfo.database.Engine``."""
+
+    def __init__(self) -> None:
+        self._engine: AsyncEngine | None = None
+        self._overrides: dict[str, Any] = {}
+
+    def get(self) -> AsyncEngine:
+        if self._engine is None:
+            try:
+                self._engine = create_async_engine(
+                    get_async_db_url(), **self._overrides
+                )
+            except (ImportError, NoSuchModuleError) as exc:
+                msg = (
+                    "Async lookups need the asyncpg or aiosqlite driver; "
+                    "install aeroinfo[async]. Original error: " + str(exc)
+                )
+                raise RuntimeError(msg) from exc
+        return self._engine
+
+    def configure(self, **overrides: object) -> None:
+        self._overrides |= dict(overrides)
+        self._engine = None
+
+    async def dispose(self) -> None:
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+
+
+Engine = _LazyAsyncEngine()
+
+
+def configure_async_engine(**overrides: object) -> None:
+    """Reconfigure the AsyncEngine; await ``dispose_engine()`` first to close the old one."""
+    Engine.configure(**overrides)
+
+
+async def dispose_engine() -> None:
+    """Close the AsyncEngine's connections, for example at application shutdown."""
+    await Engine.dispose()
+
+
+def get_session() -> AsyncSession:
+    """Return a new AsyncSession bound to the shared AsyncEngine."""
+    return async_sessionmaker(Engine.get(), expire_on_commit=False)()
+
+
+@asynccontextmanager
+async def session_scope(
+    session: AsyncSession | None = None,
+) -> AsyncIterator[AsyncSession]:
+    """Provide an async context manager that shares or creates AsyncSessions."""
+    if session is not None:
+        yield session
+        return
+
+    async with get_session() as created:
+        yield created
+
+
+class CoalescingCache:
+    """
+    LRU cache of lookup results that coalesces concurrent misses.
+
+    The first lookup of a key that isn't cached starts a task to fetch it;
+    lookups of the same key arriving while that task runs wait for it
+    instead of fetching again. A waiter being cancelled doesn't cancel the
+    fetch the others are waiting on. Failed fetches aren't cached.
+    """
+
+    def __init__(self, maxsize: int, **options: object) -> None:
+        """Create a ``LookupCache(maxsize, **options)``; a maxsize of 0 disables it."""
+        self._cache = LookupCache(maxsize, **options) if maxsize > 0 else None  # type: ignore[arg-type]
+        self._inflight: dict[
+            tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Task[Any]
+        ] = {}
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:  # noqa: ANN401
+        """Return the result cached for ``key``, running ``fetch`` on a miss."""
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not MISSING:
+                return cached
+
+        # Tasks belong to one event loop, so coalesce per loop.
+        inflight_key = (asyncio.get_running_loop(), key)
+        task = self._inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[inflight_key] = task
+            task.add_done_callback(lambda done: self._finish(inflight_key, key, done))
+        return await asyncio.shield(task)
+
+    def _finish(
+        self,
+        inflight_key: tuple[asyncio.AbstractEventLoop, Hashable],
+        key: Hashable,
+        task: asyncio.Task[Any],
+    ) -> None:
+        del self._inflight[inflight_key]
+        if (
+            self._cache is not None
+            and not task.cancelled()
+            and task.exception() is None
+        ):
+            self._cache.put(key, task.result())
+
+    def clear(self) -> None:
+        """Drop every cached result; in-flight fetches are left to finish."""
+        if self._cache is not None:
+            self._cache.clear()
+
+
+_airport_cache: CoalescingCache
+_navaid_cache: CoalescingCache
+
+
+def _configure_caches() -> None:
+    """Replace the async caches with empty ones using the sync caches' limits."""
+    global _airport_cache, _navaid_cache
+    settings = db._cache_settings
+    _airport_cache = CoalescingCache(
+        settings["airport_size"] if db._CACHE_ENABLED else 0,
+        max_bytes=settings["airport_bytes"] or None,
+        ttl=settings["ttl"] or None,
+        sizeof=settings["sizeof"],
+    )
+    _navaid_cache = CoalescingCache(
+        settings["navaid_size"] if db._CACHE_ENABLED else 0,
+        max_bytes=settings["navaid_bytes"] or None,
+        ttl=settings["ttl"] or None,
+        sizeof=settings["sizeof"],
+    )
+
+
+_configure_caches()
+# Follow db.configure_caches() from now on.
+db._cache_listeners.append(_configure_caches)
+
+
+def invalidate_caches() -> None:
+    """Clear the async lookup caches."""
+    _airport_cache.clear()
+    _navaid_cache.clear()
+
+
+async def _fetch_airport(
+    identifier: str, include_flags: frozenset[str]
+) -> Airport | None:
+    async with session_scope() as session:
+        result = await session.execute(db._airport_stmt(identifier, include_flags))
+        return result.unique().scalars().first()
+
+
+async def _fetch_navaid(identifier: str, facility_type: str) -> Navaid | None:
+    async with session_scope() as session:
+        result = await session.execute(db._navaid_stmt(identifier, facility_type))
+        return result.scalars().first()
+
+
+async def find_airport(
+    identifier: str,
+    include: Iterable[str] | None = None,
+    *,
+    session: AsyncSession | None = None,
+    use_cache: bool | None = None,
+) -> Airport | None:
+    """Return the most recent Airport matching FAA or ICAO identifier."""
+    include_flags, include_key = db._prepare_include(include)
+    identifier_key = db._normalize_identifier(identifier)
+    should_cache = (
+        use_cache if use_cache is not None else (db._CACHE_ENABLED and session is None)
+    )
+
+    if should_cache:
+        # Keyed on the sync generation too, so invalidate_caches() there
+        # (as run after an import) retires these entries as well.
+        key = (identifier_key, include_key, db._current_generation())
+        return await _airport_cache.get(
+            key, lambda: _fetch_airport(identifier_key, include_flags)
+        )
+
+    async with session_scope(session) as active_session:
+        stmt = db._airport_stmt(identifier_key, include_flags)
+        return (await active_session.execute(stmt)).unique().scalars().first()
+
+
+async def find_runway(
+    name: str,
+    airport: Airport | str,
+    include: Iterable[str] | None = None,
+    *,
+    session: AsyncSession | None = None,
+) -> Runway | None:
+    """Return a Runway by name for a given airport (object or identifier)."""
+    include_flags, _ = db._prepare_include(include)
+
+    if not isinstance(airport, Airport | str):
+        msg = "Expecting str or Airport"
+        raise TypeError(msg)
+
+    async with session_scope(session) as active_session:
+        stmt = db._runway_stmt(name, airport, include_flags)
+        return (await active_session.execute(stmt)).unique().scalars().first()
+
+
+async def find_runway_end(
+    name: str,
+    runway: Runway | tuple[str, str] | tuple[str, Airport],
+    include: Iterable[str] | None = None,
+    *,
+    session: AsyncSession | None = None,
+) -> RunwayEnd | None:
+    """Return a RunwayEnd by id for a given runway or (runway_name, airport)."""
+    include_flags, _ = db._prepare_include(include)
+    if isinstance(runway, tuple):
+        runway_name, airport = runway
+        if not isinstance(runway_name, str):
+            msg = "Expecting runway name as str in runway tuple"
+            raise TypeError(msg)
+        if not isinstance(airport, Airport | str):
+            msg = "Expecting str or Airport in runway tuple"
+            raise TypeError(msg)
+    elif not isinstance(runway, Runway):
+        msg = "Expecting Runway or tuple"
+        raise TypeError(msg)
+
+    async with session_scope(session) as active_session:
+        stmt = db._runway_end_stmt(name, runway, include_flags)
+        return (await active_session.execute(stmt)).scalars().first()
+
+
+async def find_navaid(
+    identifier: str,
+    facility_type: str,
+    include: Iterable[str] | None = None,
+    *,
+    session: AsyncSession | None = None,
+    use_cache: bool | None = None,
+) -> Navaid | None:
+    """Return the most recent Navaid matching an identifier and facility type."""
+    db._prepare_include(include)
+
+    identifier_key = db._normalize_identifier(identifier)
+    facility_type_key = db._normalize_facility_type(facility_type)
+    should_cache = (
+        use_cache if use_cache is not None else (db._CACHE_ENABLED and session is None)
+    )
+
+    if should_cache:
+        key = (identifier_key, facility_type_key, db._current_generation())
+        return await _navaid_cache.get(
+            key, lambda: _fetch_navaid(identifier_key, facility_type_key)
+        )
+
+    async with session_scope(session) as active_session:
+        stmt = db._navaid_stmt(identifier_key, facility_type_key)
+        return (await active_session.execute(stmt)).scalars().first()
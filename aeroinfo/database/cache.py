@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+"""
+In-process cache for the lookup helpers.
+
+A small thread-safe LRU mapping. Unlike ``functools.lru_cache`` it can be
+checked for a key without computing the value, so batch lookups can serve
+their hits from it and query only for the misses, and it coalesces
+concurrent misses: while one thread fetches a key, other threads asking
+for it wait for that result instead of running the same query.
+
+Besides a maximum entry count, a cache can have a budget in (estimated)
+bytes, so a few airports loaded with all their runways and remarks don't
+hold as much memory as hundreds of bare ones, and a time to live.
+"""
+
+from __future__ import annotations
+
+import enum
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+# Returned by LookupCache.get for keys that aren't cached; None is a valid
+# cached value (a lookup that found nothing).
+MISSING = object()
+
+
+def estimate_size(value: object, _seen: set[int] | None = None) -> int:
+    """
+    Estimate the bytes ``value`` holds, following containers and objects.
+
+    For ORM instances only loaded attributes are in ``__dict__``, so eagerly
+    loaded collections count and unloaded ones don't. Objects reachable
+    more than once (back-references) and enum members, which are shared,
+    are counted once and not at all.
+    """
+    seen = set() if _seen is None else _seen
+    if id(value) in seen or isinstance(value, enum.Enum):
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if isinstance(value, list | tuple | set | frozenset):
+        size += sum(estimate_size(item, seen) for item in value)
+    elif isinstance(value, dict):
+        size += sum(
+            estimate_size(key, seen) + estimate_size(item, seen)
+            for key, item in value.items()
+        )
+    elif hasattr(value, "__dict__") and not isinstance(value, type):
+        size += sys.getsizeof(value.__dict__) + sum(
+            estimate_size(item, seen)
+            for name, item in value.__dict__.items()
+            if name != "_sa_instance_state"
+        )
+    return size
+
+
+class LookupCache:
+    """Least-recently-used cache of lookup results."""
+
+    def __init__(
+        self,
+        maxsize: int,
+        *,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        sizeof: Callable[[object], int] = estimate_size,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Create an empty cache holding at most ``maxsize`` entries.
+
+        With ``max_bytes`` set, least recently used entries are also evicted
+        while the entries' ``sizeof`` estimates add up to more than that.
+        With ``ttl`` set, entries expire that many seconds after being
+        stored.
+        """
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._sizeof = sizeof
+        self._clock = clock
+        # key -> (value, estimated bytes, expiry time or None)
+        self._entries: OrderedDict[Hashable, tuple[object, int, float | None]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._inflight: dict[Hashable, Future[object]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def _lookup(self, key: Hashable) -> object:
+        """Return the entry for ``key`` or ``MISSING``; the lock must be held."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        value, size, expires = entry
+        if expires is not None and self._clock() >= expires:
+            del self._entries[key]
+            self._bytes -= size
+            self.expirations += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key: Hashable, value: object, size: int) -> None:
+        """Store an entry and evict the oldest ones; the lock must be held."""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        expires = None if self.ttl is None else self._clock() + self.ttl
+        self._entries[key] = (value, size, expires)
+        self._bytes += size
+        while self._entries and (
+            len(self._entries) > self.maxsize
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, (_, evicted, _) = self._entries.popitem(last=False)
+            self._bytes -= evicted
+            self.evictions += 1
+
+    def _size(self, value: object) -> int:
+        return self._sizeof(value) if self.max_bytes is not None else 0
+
+    def get(self, key: Hashable) -> object:
+        """Return the value cached for ``key``, or ``MISSING``."""
+        with self._lock:
+            value = self._lookup(key)
+            if value is MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: object) -> None:
+        """Cache ``value`` for ``key``, evicting least recently used entries."""
+        size = self._size(value)
+        with self._lock:
+            self._store(key, value, size)
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], object]) -> object:
+        """
+        Return the value cached for ``key``, calling ``fetch`` on a miss.
+
+        Only one caller fetches a given key at a time; others missing on it
+        meanwhile wait for and share that result (or exception). Exceptions
+        aren't cached, so the next miss fetches again.
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not MISSING:
+                self.hits += 1
+                return value
+            flight = self._inflight.get(key)
+            if flight is None:
+                self.misses += 1
+                flight = self._inflight[key] = Future()
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            return flight.result()
+
+        try:
+            value = fetch()
+            size = self._size(value)
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[key]
+            flight.set_exception(exc)
+            raise
+        with self._lock:
+            self._store(key, value, size)
+            del self._inflight[key]
+        flight.set_result(value)
+        return value
+
+    def stats(self) -> dict[str, object]:
+        """Return the cache's size, limits and counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "maxsize": self.maxsize,
+                "max_bytes": self.max_bytes,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def clear(self) -> None:
+        """Drop every entry; fetches in flight still hand waiters their result."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+class PartitionedCache(LookupCache):
+    """
+    A LookupCache whose entries are grouped into named partitions.
+
+    Lookups that load different amounts of data (an airport with or without
+    its runways) go in different partitions so their keys can't collide, but
+    all partitions share the one entry and byte budget: the least recently
+    used entry is evicted whichever partition it's in, so the total stays
+    bounded however many partitions callers ask for.
+    """
+
+    def partition(self, name: Hashable) -> CachePartition:
+        """Return a view of the entries in partition ``name``."""
+        return CachePartition(self, name)
+
+    def stats(self) -> dict[str, object]:
+        """Return the cache's stats, with each partition's entries and bytes."""
+        totals = super().stats()
+        partitions: dict[Hashable, dict[str, int]] = {}
+        with self._lock:
+            for key, (_, size, _) in self._entries.items():
+                name, _ = cast("tuple[Hashable, Hashable]", key)
+                partition = partitions.setdefault(name, {"entries": 0, "bytes": 0})
+                partition["entries"] += 1
+                partition["bytes"] += size
+        totals["partitions"] = partitions
+        return totals
+
+
+class CachePartition:
+    """One partition of a PartitionedCache, looked up with its own keys."""
+
+    def __init__(self, cache: PartitionedCache, name: Hashable) -> None:
+        """Look up ``(name, key)`` in ``cache`` for every ``key``."""
+        self.cache = cache
+        self.name = name
+
+    def get(self, key: Hashable) -> object:
+        """Return the value cached for ``key``, or ``MISSING``."""
+        return self.cache.get((self.name, key))
+
+    def put(self, key: Hashable, value: object) -> None:
+        """Cache ``value`` for ``key``."""
+        self.cache.put((self.name, key), value)
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], object]) -> object:
+        """Return the value cached for ``key``, calling ``fetch`` on a miss."""
+        return self.cache.get_or_fetch((self.name, key), fetch)
@@ -8,6 +8,7 @@ datasets and are intentionally literal mappings to source values.
 """
 
 import enum
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
@@ -274,3 +275,14 @@ class VORReceiverCheckpointAirGroundCodeEnum(NASREnum):
     A = ("A", "AIR")
     G = ("G", "GROUND")
     G1 = ("G1", "GROUND ONE")
+
+
+@functools.cache
+def descriptions(enum_class: type[NASREnum]) -> dict[str, str]:
+    """
+    Map the member names of ``enum_class`` to their descriptions.
+
+    SQLAlchemy stores enum members by name, so this turns a raw column
+    value into its description without creating the enum member.
+    """
+    return {name: member.description for name, member in enum_class.__members__.items()}
@@ -8,8 +8,8 @@ the application.
 """
 
 import datetime
-import enum
 import logging
+from typing import ClassVar
 
 from sqlalchemy import Boolean, Date, Enum, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import (
@@ -21,6 +21,7 @@ from sqlalchemy.schema import ForeignKeyConstraint
 
 from aeroinfo.database import enums
 from aeroinfo.database.base import Base
+from aeroinfo.database.serializers import compile_fields, include_key
 
 logger = logging.getLogger(__name__)
 
@@ -389,25 +390,17 @@ class Airport(Base):
             f"<Airport(name='{self.name}', faa='{self.faa_id}', icao='{self.icao_id}')>"
         )
 
-    def to_dict(self, include: list[str] | None = None) -> dict[str, object]:
-        """
-        Return a dict representation of the airport.
-
-        The optional ``include`` list can be used to include additional groups
-        of attributes such as "demographic" or "runways".
-        """
-        _include = include or []
-
-        base_attrs = [
-            "facility_type",
-            "faa_id",
-            "icao_id",
-            "name",
-            "name_remark",
-            "effective_date",
-        ]
-
-        demo_attrs = [
+    # Attributes to_dict() always returns, and those of each include group.
+    _dict_attrs: ClassVar[tuple[str, ...]] = (
+        "facility_type",
+        "faa_id",
+        "icao_id",
+        "name",
+        "name_remark",
+        "effective_date",
+    )
+    _dict_groups: ClassVar[dict[str, tuple[str, ...]]] = {
+        "demographic": (
             "region",
             "field_office",
             "state_code",
@@ -417,9 +410,8 @@ class Airport(Base):
             "countys_state",
             "city",
             "city_remark",
-        ]
-
-        ownership_attrs = [
+        ),
+        "ownership": (
             "ownership_type",
             "ownership_type_remark",
             "facility_use",
@@ -440,9 +432,8 @@ class Airport(Base):
             "managers_city_state_zip_remark",
             "managers_phone",
             "managers_phone_remark",
-        ]
-
-        geo_attrs = [
+        ),
+        "geographic": (
             "latitude_dms",
             "latitude_dms_remark",
             "latitude_secs",
@@ -465,9 +456,8 @@ class Airport(Base):
             "direction_from_city",
             "land_area",
             "land_area_remark",
-        ]
-
-        faasrv_attrs = [
+        ),
+        "faaservices": (
             "boundary_artcc_id",
             "boundary_artcc_computer_id",
             "boundary_artcc_name",
@@ -486,9 +476,8 @@ class Airport(Base):
             "alternate_fss_toll_free_phone",
             "notam_facility",
             "notam_d_available",
-        ]
-
-        fedstatus_attrs = [
+        ),
+        "fedstatus": (
             "activation_date",
             "status",
             "arff_certification",
@@ -505,18 +494,16 @@ class Airport(Base):
             "military_civil_join_use_remark",
             "military_landing_rights",
             "military_landing_rights_remark",
-        ]
-
-        inspect_attrs = [
+        ),
+        "inspection": (
             "inspection_method",
             "agency_performing_inspection",
             "agency_performing_inspection_remark",
             "last_inspection_date",
             "last_inspection_date_remark",
             "last_information_request_complete_date",
-        ]
-
-        aptsrv_attrs = [
+        ),
+        "aptservices": (
             "fuel_available",
             "fuel_available_remark",
             "airframe_repair_service",
@@ -527,9 +514,8 @@ class Airport(Base):
             "bottled_oxygen_remark",
             "bulk_oxygen",
             "bulk_oxygen_remark",
-        ]
-
-        facilities_attrs = [
+        ),
+        "facilities": (
             "lighting_schedule",
             "lighting_schedule_remark",
             "beacon_schedule",
@@ -546,9 +532,8 @@ class Airport(Base):
             "noncommerical_landing_fee",
             "noncommerical_landing_fee_remark",
             "landing_facility_used_for_medical_purposes",
-        ]
-
-        basedacft_attrs = [
+        ),
+        "basedaircraft": (
             "based_general_aviation_single_engine_airplanes",
             "based_general_aviation_single_engine_airplanes_remark",
             "based_general_aviation_multi_engine_airplanes",
@@ -563,9 +548,8 @@ class Airport(Base):
             "based_military_aircraft_remark",
             "based_ultralight_aircraft",
             "based_ultralight_aircraft_remark",
-        ]
-
-        annops_attrs = [
+        ),
+        "annualops": (
             "annual_ops_commercial",
             "annual_ops_commercial_remark",
             "annual_ops_commuter",
@@ -577,9 +561,8 @@ class Airport(Base):
             "annual_ops_military",
             "annual_ops_military_remark",
             "annual_ops_end_of_measurement_period",
-        ]
-
-        addl_attrs = [
+        ),
+        "additional": (
             "position_source",
             "position_date",
             "elevation_source",
@@ -592,52 +575,18 @@ class Airport(Base):
             "wind_indicator",
             "wind_indicator_remark",
             "minimum_operational_network",
-        ]
-
-        if "demographic" in _include or "all" in _include:
-            base_attrs += demo_attrs
-
-        if "ownership" in _include or "all" in _include:
-            base_attrs += ownership_attrs
-
-        if "geographic" in _include or "all" in _include:
-            base_attrs += geo_attrs
-
-        if "faaservices" in _include or "all" in _include:
-            base_attrs += faasrv_attrs
-
-        if "fedstatus" in _include or "all" in _include:
-            base_attrs += fedstatus_attrs
-
-        if "inspection" in _include or "all" in _include:
-            base_attrs += inspect_attrs
-
-        if "aptservices" in _include or "all" in _include:
-            base_attrs += aptsrv_attrs
-
-        if "facilities" in _include or "all" in _include:
-            base_attrs += facilities_attrs
-
-        if "basedaircraft" in _include or "all" in _include:
-            base_attrs += basedacft_attrs
-
-        if "annualops" in _include or "all" in _include:
-            base_attrs += annops_attrs
-
-        if "additional" in _include or "all" in _include:
-            base_attrs += addl_attrs
-
-        result = {}
+        ),
+    }
 
-        for attr in base_attrs:
-            value = getattr(self, attr)
+    def to_dict(self, include: list[str] | None = None) -> dict[str, object]:
+        """
+        Return a dict representation of the airport.
 
-            if isinstance(value, enum.Enum):
-                result[attr] = getattr(value, "description", value.value)
-            elif isinstance(value, (datetime.date, datetime.datetime)):
-                result[attr] = value.isoformat()
-            else:
-                result[attr] = value
+        The optional ``include`` list can be used to include additional groups
+        of attributes such as "demographic" or "runways".
+        """
+        _include = include_key(include)
+        result = compile_fields(type(self), _include).serialize(self)
 
         if "runways" in _include:
             runways = list(self.runways)
@@ -730,32 +679,25 @@ class Runway(Base):
         """Short debug representation."""
         return f"<Runway(name='{self.name}', airport='{self.airport}')>"
 
-    def to_dict(self, include: list[str] | None = None) -> dict[str, object]:
-        """
-        Return a dict representation of the runway.
-
-        ``include`` may contain additional groups like "additional".
-        """
-        _include = include or []
-
-        base_attrs = [
-            "name",
-            "name_remark",
-            "length",
-            "length_remark",
-            "width",
-            "width_remark",
-            "surface_type_condition",
-            "surface_type_condition_remark",
-            "surface_treatment",
-            "surface_treatment_remark",
-            "pavement_classification_number",
-            "pavement_classification_number_remark",
-            "edge_light_intensity",
-            "edge_light_intensity_remark",
-        ]
-
-        addl_attrs = [
+    # Attributes to_dict() always returns, and those of each include group.
+    _dict_attrs: ClassVar[tuple[str, ...]] = (
+        "name",
+        "name_remark",
+        "length",
+        "length_remark",
+        "width",
+        "width_remark",
+        "surface_type_condition",
+        "surface_type_condition_remark",
+        "surface_treatment",
+        "surface_treatment_remark",
+        "pavement_classification_number",
+        "pavement_classification_number_remark",
+        "edge_light_intensity",
+        "edge_light_intensity_remark",
+    )
+    _dict_groups: ClassVar[dict[str, tuple[str, ...]]] = {
+        "additional": (
             "length_source",
             "length_source_date",
             "weight_bearing_capacity_single_wheel",
@@ -766,22 +708,17 @@ class Runway(Base):
             "weight_bearing_capacity_two_dual_wheels_tandem_remark",
             "weight_bearing_capacity_two_dual_wheels_double_tandem",
             "weight_bearing_capacity_two_dual_wheels_double_tandem_remark",
-        ]
-
-        if "additional" in _include or "all" in _include:
-            base_attrs += addl_attrs
-
-        result = {}
+        ),
+    }
 
-        for attr in base_attrs:
-            value = getattr(self, attr)
+    def to_dict(self, include: list[str] | None = None) -> dict[str, object]:
+        """
+        Return a dict representation of the runway.
 
-            if isinstance(value, enum.Enum):
-                result[attr] = getattr(value, "description", value.value)
-            elif isinstance(value, (datetime.date, datetime.datetime)):
-                result[attr] = value.isoformat()
-            else:
-                result[attr] = value
+        ``include`` may contain additional groups like "additional".
+        """
+        _include = include_key(include)
+        result = compile_fields(type(self), _include).serialize(self)
 
         if "runway_ends" in _include:
             runway_ends = list(self.runway_ends)
@@ -1066,24 +1003,21 @@ class RunwayEnd(Base):
         """Short debug representation."""
         return f"<Runway End(id='{self.id}', runway='{self.runway}')>"
 
-    def to_dict(self, include: list[str] | None = None) -> dict[str, object]:
-        """Return a dict representation of the runway end."""
-        _include = include or []
-
-        base_attrs = [
-            "id",
-            "id_remark",
-            "true_alignment",
-            "true_alignment_remark",
-            "approach_type",
-            "right_traffic",
-            "right_traffic_remark",
-            "markings_type",
-            "markings_remark",
-            "markings_condition",
-        ]
-
-        geo_attrs = [
+    # Attributes to_dict() always returns, and those of each include group.
+    _dict_attrs: ClassVar[tuple[str, ...]] = (
+        "id",
+        "id_remark",
+        "true_alignment",
+        "true_alignment_remark",
+        "approach_type",
+        "right_traffic",
+        "right_traffic_remark",
+        "markings_type",
+        "markings_remark",
+        "markings_condition",
+    )
+    _dict_groups: ClassVar[dict[str, tuple[str, ...]]] = {
+        "geographic": (
             "latitude_dms",
             "latitude_dms_remark",
             "latitude_secs",
@@ -1106,9 +1040,8 @@ class RunwayEnd(Base):
             "displaced_threshold_length",
             "displaced_threshold_length_remark",
             "touchdown_zone_elevation",
-        ]
-
-        lighting_attrs = [
+        ),
+        "lighting": (
             "visual_glide_slope_indicators",
             "visual_glide_slope_indicators_remark",
             "rvr_equipment",
@@ -1122,9 +1055,8 @@ class RunwayEnd(Base):
             "centerline_light_availability_remark",
             "touchdown_lights_availability",
             "touchdown_lights_availability_remark",
-        ]
-
-        obj_attrs = [
+        ),
+        "object": (
             "controlling_object_description",
             "controlling_object_description_remark",
             "controlling_object_marking",
@@ -1139,9 +1071,8 @@ class RunwayEnd(Base):
             "controlling_object_distance_from_runway_remark",
             "controlling_object_centerline_offset",
             "controlling_object_centerline_offset_remark",
-        ]
-
-        addl_attrs = [
+        ),
+        "additional": (
             "gradient",
             "gradient_remark",
             "gradient_direction",
@@ -1170,33 +1101,12 @@ class RunwayEnd(Base):
             "lahso_coords_source",
             "lahso_coords_date",
             "arresting_gear",
-        ]
-
-        if "geographic" in _include or "all" in _include:
-            base_attrs += geo_attrs
-
-        if "lighting" in _include or "all" in _include:
-            base_attrs += lighting_attrs
-
-        if "object" in _include or "all" in _include:
-            base_attrs += obj_attrs
-
-        if "additional" in _include or "all" in _include:
-            base_attrs += addl_attrs
-
-        result = {}
-
-        for attr in base_attrs:
-            value = getattr(self, attr)
-
-            if isinstance(value, enum.Enum):
-                result[attr] = getattr(value, "description", value.value)
-            elif isinstance(value, (datetime.date, datetime.datetime)):
-                result[attr] = value.isoformat()
-            else:
-                result[attr] = value
+        ),
+    }
 
-        return result
+    def to_dict(self, include: list[str] | None = None) -> dict[str, object]:
+        """Return a dict representation of the runway end."""
+        return compile_fields(type(self), include_key(include)).serialize(self)
 
 
 Index(
@@ -1215,6 +1125,13 @@ Index(
     RunwayEnd.runway_name,
     RunwayEnd.id,
 )
+# Resolves a runway end ID ("10C") to its runway ("10C/28C") at an airport.
+Index(
+    "ix_runway_ends_facility_id_name",
+    RunwayEnd.facility_site_number,
+    RunwayEnd.id,
+    RunwayEnd.runway_name,
+)
 
 
 class AirportRemark(Base):
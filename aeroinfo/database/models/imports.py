@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+"""Database models recording the state of previous NASR imports."""
+
+import logging
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from aeroinfo.database.base import Base
+
+logger = logging.getLogger(__name__)
+
+
+class FacilityFingerprint(Base):
+    """Hash of one facility's record group as of the last incremental import."""
+
+    __tablename__ = "facility_fingerprints"
+
+    # Which file the facility comes from: "APT" or "NAV".
+    source: Mapped[str] = mapped_column(String(8), primary_key=True)
+    # The facility's key columns joined with "|", e.g. "50009.*A" for an
+    # airport's site number or "JOT|VOR/DME" for a navaid.
+    facility_key: Mapped[str] = mapped_column(String(40), primary_key=True)
+    # Hex BLAKE2b digest of the facility's records, exactly as published.
+    digest: Mapped[str] = mapped_column(String(32))
+
+    def __repr__(self) -> str:
+        """Return a short representation of the FacilityFingerprint."""
+        return f"<FacilityFingerprint(source={self.source}, key={self.facility_key})>"
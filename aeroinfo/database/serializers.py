@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+"""
+Compiled field lists for the models' ``to_dict`` methods.
+
+A model lists the attributes ``to_dict`` always returns in ``_dict_attrs``
+and the attributes of each include group in ``_dict_groups``. For a given
+set of include groups, ``compile_fields`` works out once which attributes
+to return and how to convert each one, going by its column type: enum
+members become their description and dates their ISO format. Serializing
+an instance is then a single pass over that precompiled plan.
+
+``compile_rows`` does the same for selecting those columns as plain rows,
+for callers that want the ``to_dict`` payload without loading instances.
+"""
+
+from __future__ import annotations
+
+import datetime
+import enum
+import functools
+from operator import attrgetter, itemgetter
+from typing import TYPE_CHECKING
+
+from sqlalchemy import Date, DateTime, Enum, String, inspect, type_coerce
+
+from aeroinfo.database.enums import descriptions
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from sqlalchemy.sql.elements import ColumnElement
+
+# Include group that selects every group of a model.
+ALL = "all"
+
+
+def _describe(value: object) -> object:
+    # Instances built by the parsers (and pending ones) may hold the raw
+    # code string rather than an enum member; pass those through as is.
+    if not isinstance(value, enum.Enum):
+        return value
+    return getattr(value, "description", value.value)
+
+
+def _isoformat(value: datetime.date) -> str:
+    return value.isoformat()
+
+
+def _convert_any(value: object) -> object:
+    if isinstance(value, enum.Enum):
+        return _describe(value)
+    if isinstance(value, datetime.date | datetime.datetime):
+        return value.isoformat()
+    return value
+
+
+def _converter(model: type, attr: str) -> Callable[[object], object] | None:
+    """Return how to convert ``attr``'s values, or None to keep them as is."""
+    column = inspect(model).columns.get(attr)
+    if column is None:
+        return _convert_any
+    if isinstance(column.type, Enum) and column.type.enum_class is not None:
+        return _describe
+    if isinstance(column.type, Date | DateTime):
+        return _isoformat
+    return None
+
+
+class FieldPlan:
+    """The attributes ``to_dict`` returns for one model and set of groups."""
+
+    __slots__ = ("attributes", "converted", "loaded", "names")
+
+    def __init__(self, model: type, names: tuple[str, ...]) -> None:
+        """Compile the plan for returning ``names`` of ``model`` instances."""
+        self.names = names
+        # Column values an instance has loaded are in its __dict__; reading
+        # them from there skips the ORM's attribute descriptors. If any are
+        # missing (deferred, expired or never set), go through the
+        # attributes, which load or default them.
+        self.loaded = _tuple_getter(itemgetter, names)
+        self.attributes = _tuple_getter(attrgetter, names)
+        # Values are converted after the fact, which keeps the keys in order.
+        self.converted = tuple(
+            (name, convert)
+            for name in names
+            if (convert := _converter(model, name)) is not None
+        )
+
+    def serialize(self, instance: object) -> dict[str, object]:
+        """Return ``instance``'s attributes as a dict of plain values."""
+        try:
+            values = self.loaded(instance.__dict__)
+        except KeyError:
+            values = self.attributes(instance)
+        result = dict(zip(self.names, values, strict=True))
+        for name, convert in self.converted:
+            value = result[name]
+            if value is not None:
+                result[name] = convert(value)
+        return result
+
+
+def _tuple_getter(
+    getter: type[itemgetter] | type[attrgetter], names: tuple[str, ...]
+) -> Callable[[object], tuple[object, ...]]:
+    """Return ``getter(*names)``, made to return a tuple for a single name too."""
+    if len(names) == 1:
+        get_one = getter(names[0])
+        return lambda obj: (get_one(obj),)
+    return getter(*names)
+
+
+@functools.cache
+def compile_fields(model: type, include: frozenset[str]) -> FieldPlan:
+    """Return the cached plan for ``model`` with the ``include`` groups."""
+    names: list[str] = list(model._dict_attrs)  # type: ignore[attr-defined]
+    for group, attrs in model._dict_groups.items():  # type: ignore[attr-defined]
+        if group in include or ALL in include:
+            names += attrs
+    return FieldPlan(model, tuple(names))
+
+
+class RowPlan:
+    """The columns to select for one model's ``to_dict`` payload, and their conversions."""
+
+    __slots__ = ("columns", "converted", "names")
+
+    def __init__(self, model: type, names: tuple[str, ...]) -> None:
+        """Compile the plan for selecting ``names`` of ``model``."""
+        self.names = names
+        columns: list[ColumnElement[object]] = []
+        converted: list[tuple[str, Callable[[object], object]]] = []
+        mapper_columns = inspect(model).columns
+        for name in names:
+            column = mapper_columns[name]
+            if isinstance(column.type, Enum) and column.type.enum_class is not None:
+                # Fetch the stored member name as is and look it up, rather
+                # than have SQLAlchemy build the enum member first.
+                columns.append(type_coerce(column, String).label(name))
+                described = descriptions(column.type.enum_class)
+                converted.append((name, lambda value, d=described: d.get(value, value)))
+                continue
+            if isinstance(column.type, Date | DateTime):
+                converted.append((name, _isoformat))
+            columns.append(column.label(name))
+        self.columns = tuple(columns)
+        self.converted = tuple(converted)
+
+    def payload(self, row: Sequence[object]) -> dict[str, object]:
+        """Return a row of ``columns`` as the ``to_dict`` payload."""
+        result = dict(zip(self.names, row, strict=True))
+        for name, convert in self.converted:
+            value = result[name]
+            if value is not None:
+                result[name] = convert(value)
+        return result
+
+
+@functools.cache
+def compile_rows(model: type, include: frozenset[str]) -> RowPlan:
+    """Return the cached row plan for ``model`` with the ``include`` groups."""
+    return RowPlan(model, compile_fields(model, include).names)
+
+
+def include_key(include: Iterable[str] | None) -> frozenset[str]:
+    """Return the include groups as the hashable key ``compile_fields`` takes."""
+    return frozenset(include) if include else frozenset()
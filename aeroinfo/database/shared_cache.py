@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+"""
+Lookup cache shared by every process on a host, in a memory-mapped file.
+
+Worker processes (gunicorn and the like) each keep their own in-process
+caches, which start cold in every worker and are only invalidated in the
+process that ran an import. This cache keeps serialized (JSON) payloads in
+one file, ideally on tmpfs such as ``/dev/shm``, that all of them map.
+
+The file starts with a header holding a generation stamp, followed by a
+fixed number of fixed-size slots. A key hashes to one slot; a newer entry
+for another key with the same slot replaces the old one. Each entry
+records the generation it was written under and only counts as a hit
+while that is still the header's, so bumping the stamp invalidates the
+cache in every process at once. Readers and writers serialize on an
+``flock`` of the file, so the cache needs a POSIX platform; elsewhere
+this module still imports, but creating a ``SharedCache`` raises.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from aeroinfo.database.cache import MISSING
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not POSIX
+    _HAVE_FLOCK = False
+else:
+    _HAVE_FLOCK = True
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_MAGIC = b"AEROSHC1"
+# magic, generation, slot count, slot size
+_HEADER = struct.Struct("<8sQII")
+_HEADER_SIZE = 64
+# key digest, generation, payload length
+_SLOT_HEADER = struct.Struct("<16sQI")
+_GENERATION_OFFSET = 8
+
+DEFAULT_SLOTS = 2048
+DEFAULT_SLOT_SIZE = 32 * 1024
+
+
+class SharedCache:
+    """Fixed-size, generation-stamped payload cache in a shared file."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        slots: int = DEFAULT_SLOTS,
+        slot_size: int = DEFAULT_SLOT_SIZE,
+    ) -> None:
+        """
+        Use the cache file at ``path``, creating it if it doesn't exist.
+
+        ``slots`` and ``slot_size`` only apply when creating the file; an
+        existing file keeps the layout recorded in its header. Payloads
+        that don't fit in a slot aren't cached.
+        """
+        if not _HAVE_FLOCK:
+            msg = "The shared cache needs fcntl file locks (POSIX only)"
+            raise RuntimeError(msg)
+        self.path = Path(path)
+        self._requested = (slots, slot_size)
+        self._lock = threading.Lock()
+        self._pid: int | None = None
+        self._fd = -1
+        self._map: mmap.mmap | None = None
+        self.slots = 0
+        self.slot_size = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.oversize = 0
+
+    def _open(self) -> mmap.mmap:
+        """Map the file, once per process (a forked child opens its own)."""
+        if self._map is not None and self._pid == os.getpid():
+            return self._map
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(fd).st_size < _HEADER_SIZE:
+                slots, slot_size = self._requested
+                os.ftruncate(fd, _HEADER_SIZE + slots * slot_size)
+                os.pwrite(fd, _HEADER.pack(_MAGIC, 1, slots, slot_size), 0)
+            magic, _, slots, slot_size = _HEADER.unpack(os.pread(fd, _HEADER.size, 0))
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        if magic != _MAGIC:
+            os.close(fd)
+            msg = f"{self.path} is not an aeroinfo shared cache file"
+            raise RuntimeError(msg)
+        self._fd = fd
+        self._pid = os.getpid()
+        self.slots, self.slot_size = slots, slot_size
+        self._map = mmap.mmap(fd, _HEADER_SIZE + slots * slot_size)
+        return self._map
+
+    @contextmanager
+    def _locked(self, operation: int) -> Iterator[mmap.mmap]:
+        # flock excludes other processes; the thread lock, threads sharing
+        # this process's file descriptor.
+        with self._lock:
+            mapped = self._open()
+            fcntl.flock(self._fd, operation)
+            try:
+                yield mapped
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @property
+    def generation(self) -> int:
+        """Return the generation entries must have been written under."""
+        with self._lock:
+            mapped = self._open()
+        return struct.unpack_from("<Q", mapped, _GENERATION_OFFSET)[0]
+
+    def bump_generation(self) -> int:
+        """Invalidate every entry, in every process, and return the new generation."""
+        with self._locked(fcntl.LOCK_EX) as mapped:
+            generation = struct.unpack_from("<Q", mapped, _GENERATION_OFFSET)[0] + 1
+            struct.pack_into("<Q", mapped, _GENERATION_OFFSET, generation)
+            return generation
+
+    def _slot(self, digest: bytes) -> int:
+        index = int.from_bytes(digest[:8], "little") % self.slots
+        return _HEADER_SIZE + index * self.slot_size
+
+    def get(self, key: str) -> object:
+        """Return the payload cached for ``key`` this generation, or ``MISSING``."""
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        with self._locked(fcntl.LOCK_SH) as mapped:
+            generation = struct.unpack_from("<Q", mapped, _GENERATION_OFFSET)[0]
+            offset = self._slot(digest)
+            stored, written, length = _SLOT_HEADER.unpack_from(mapped, offset)
+            data = None
+            if stored == digest and written == generation:
+                start = offset + _SLOT_HEADER.size
+                data = mapped[start : start + length]
+            if data is None:
+                self.misses += 1
+                return MISSING
+            self.hits += 1
+        return json.loads(data)
+
+    def put(self, key: str, payload: object, generation: int) -> bool:
+        """
+        Cache ``payload`` for ``key`` if ``generation`` is still current.
+
+        Pass the generation read before fetching the payload, so data read
+        before an invalidation isn't stored after it. Returns whether the
+        payload was stored.
+        """
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        data = json.dumps(payload, separators=(",", ":")).encode()
+        with self._locked(fcntl.LOCK_EX) as mapped:
+            if len(data) > self.slot_size - _SLOT_HEADER.size:
+                self.oversize += 1
+                return False
+            if struct.unpack_from("<Q", mapped, _GENERATION_OFFSET)[0] != generation:
+                return False
+            offset = self._slot(digest)
+            _SLOT_HEADER.pack_into(mapped, offset, digest, generation, len(data))
+            start = offset + _SLOT_HEADER.size
+            mapped[start : start + len(data)] = data
+            self.stores += 1
+        return True
+
+    def stats(self) -> dict[str, object]:
+        """Return this process's counters and the shared file's layout."""
+        generation = self.generation
+        return {
+            "path": str(self.path),
+            "generation": generation,
+            "slots": self.slots,
+            "slot_size": self.slot_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "oversize": self.oversize,
+        }
+
+    def close(self) -> None:
+        """Unmap the file; it stays for other processes and the next open."""
+        with self._lock:
+            if self._map is not None and self._pid == os.getpid():
+                self._map.close()
+                os.close(self._fd)
+            self._map = None
+            self._pid = None
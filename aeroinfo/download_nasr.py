@@ -8,9 +8,14 @@ edition zip and extract it locally.
 
 import argparse
 import datetime
+import hashlib
+import json
 import logging
 import tempfile
+import threading
 import zipfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
@@ -21,6 +26,15 @@ zip_file_finder = "https://external-api.faa.gov/apra/nfdc/nasr/chart"
 
 edition_date: str | None = None
 
+# Parallel range requests per download, and the smallest range worth one.
+DOWNLOAD_SEGMENTS = 4
+MIN_SEGMENT_SIZE = 1024 * 1024
+# Read/write buffer, and how much to write between state file checkpoints.
+DOWNLOAD_BUFFER_SIZE = 1024 * 1024
+CHECKPOINT_BYTES = 8 * 1024 * 1024
+# Attempts per segment before giving up; each one resumes where it stopped.
+SEGMENT_ATTEMPTS = 5
+
 logger = logging.getLogger(__name__)
 
 retry_strategy = Retry(total=60, backoff_factor=1.0)
@@ -45,11 +59,111 @@ def get_download_url(edition: str = "current") -> str:
     return r.json()["edition"][0]["product"]["url"]
 
 
-def download_nasr_zip(zip_url: str, path: str | None = None) -> str:
+def _load_state(state_path: Path, url: str, size: int, validator: str | None) -> dict:
+    """Return saved download state if it is for this exact remote file."""
+    try:
+        state = json.loads(state_path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if (state.get("url"), state.get("size"), state.get("validator")) != (
+        url,
+        size,
+        validator,
+    ):
+        logger.info("Ignoring stale download state in %s", state_path)
+        return {}
+    return state
+
+
+def _save_state(state_path: Path, state: dict) -> None:
+    """Write ``state`` atomically so an interrupted run never leaves it torn."""
+    tmp_path = state_path.with_name(state_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(state))
+    tmp_path.replace(state_path)
+
+
+def _split(size: int, segments: int) -> list[list[int]]:
+    """Split ``size`` bytes into [start, end, done] segments (end inclusive)."""
+    step = max(-(-size // segments), MIN_SEGMENT_SIZE)
+    return [[start, min(start + step, size) - 1, 0] for start in range(0, size, step)]
+
+
+def _fetch_segment(
+    url: str,
+    part_path: Path,
+    segment: list[int],
+    checkpoint: Callable[[list[int], int], None],
+) -> None:
+    """
+    Download the rest of one [start, end, done] segment into ``part_path``.
+
+    ``done`` only counts bytes that have been flushed to the file, so the
+    state file never claims data that an interrupted run didn't write.
+    """
+    start, end, _ = segment
+    for attempt in range(1, SEGMENT_ATTEMPTS + 1):
+        offset = start + segment[2]
+        if offset > end:
+            return
+        headers = {"Range": f"bytes={offset}-{end}"}
+        try:
+            with (
+                http.get(url, headers=headers, timeout=30, stream=True) as r,
+                part_path.open("r+b") as f,
+            ):
+                r.raise_for_status()
+                if r.status_code != requests.codes.partial_content:
+                    msg = f"Server ignored the range request for {url}"
+                    raise RuntimeError(msg)
+                f.seek(offset)
+                written = 0
+                for chunk in r.iter_content(chunk_size=DOWNLOAD_BUFFER_SIZE):
+                    f.write(chunk)
+                    written += len(chunk)
+                    if written >= CHECKPOINT_BYTES:
+                        f.flush()
+                        checkpoint(segment, written)
+                        written = 0
+                f.flush()
+                checkpoint(segment, written)
+        except requests.RequestException:
+            if attempt == SEGMENT_ATTEMPTS:
+                raise
+            logger.warning(
+                "Segment %s-%s interrupted at %s; retrying",
+                start,
+                end,
+                start + segment[2],
+            )
+    if start + segment[2] <= end:
+        msg = f"Segment {start}-{end} of {url} ended early"
+        raise RuntimeError(msg)
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(DOWNLOAD_BUFFER_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def download_nasr_zip(
+    zip_url: str,
+    path: str | None = None,
+    *,
+    segments: int = DOWNLOAD_SEGMENTS,
+    sha256: str | None = None,
+) -> str:
     """
     Download the NASR zip file and return the local path to the file.
 
-    If ``path`` is omitted a temporary directory is used.
+    If ``path`` is omitted a temporary directory is used. When the server
+    supports range requests the file is fetched in ``segments`` parallel
+    ranges into ``<zip>.part``, with progress kept in ``<zip>.state.json``
+    so an interrupted download resumes where it stopped. The finished file's
+    size is checked against the server's, and its SHA-256 against
+    ``sha256`` when given; a mismatch raises RuntimeError.
     """
     base_download_dir = Path(path) if path else Path(tempfile.mkdtemp())
 
@@ -61,12 +175,68 @@ def download_nasr_zip(zip_url: str, path: str | None = None) -> str:
 
     zip_name = zip_url.split("/")[-1]
     full_path = download_dir / zip_name
+    part_path = full_path.with_name(zip_name + ".part")
+    state_path = full_path.with_name(zip_name + ".state.json")
+
+    head = http.head(zip_url, timeout=10, allow_redirects=True)
+    head.raise_for_status()
+    size = int(head.headers.get("Content-Length", 0))
+    ranged = head.headers.get("Accept-Ranges", "").lower() == "bytes" and size > 0
 
     logger.info("Downloading zip file %s to %s", zip_url, str(full_path))
-    with full_path.open("wb") as f, http.get(zip_url, timeout=10, stream=True) as r:
-        f.writelines(r.iter_content(chunk_size=4096))
+    if ranged:
+        validator = head.headers.get("ETag") or head.headers.get("Last-Modified")
+        state = _load_state(state_path, zip_url, size, validator)
+        if not state or not part_path.exists():
+            state = {
+                "url": zip_url,
+                "size": size,
+                "validator": validator,
+                "segments": _split(size, max(1, segments)),
+            }
+            with part_path.open("wb") as f:
+                f.truncate(size)
+            _save_state(state_path, state)
+        else:
+            done = sum(segment[2] for segment in state["segments"])
+            logger.info("Resuming download at %s of %s bytes", done, size)
+
+        lock = threading.Lock()
+
+        def checkpoint(segment: list[int], flushed: int) -> None:
+            with lock:
+                segment[2] += flushed
+                _save_state(state_path, state)
+
+        with ThreadPoolExecutor(max_workers=len(state["segments"])) as pool:
+            futures = [
+                pool.submit(_fetch_segment, zip_url, part_path, segment, checkpoint)
+                for segment in state["segments"]
+            ]
+        for future in futures:
+            future.result()
+    else:
+        with (
+            part_path.open("wb") as f,
+            http.get(zip_url, timeout=10, stream=True) as r,
+        ):
+            r.raise_for_status()
+            f.writelines(r.iter_content(chunk_size=DOWNLOAD_BUFFER_SIZE))
+
+    actual_size = part_path.stat().st_size
+    if size and actual_size != size:
+        msg = f"Downloaded {actual_size} bytes of {zip_url}, expected {size}"
+        raise RuntimeError(msg)
+    digest = _sha256(part_path)
+    if sha256 and digest != sha256.lower():
+        part_path.unlink()
+        state_path.unlink(missing_ok=True)
+        msg = f"SHA-256 of {zip_url} is {digest}, expected {sha256}"
+        raise RuntimeError(msg)
 
-    logger.info("Download complete")
+    part_path.replace(full_path)
+    state_path.unlink(missing_ok=True)
+    logger.info("Download complete (sha256 %s)", digest)
     return str(full_path)
 
 
@@ -82,13 +252,20 @@ def extract_nasr_zip(zip_path: str) -> str:
 
 
 def download_and_extract_nasr_zip(
-    edition: str = "current", path: str | None = None
+    edition: str = "current",
+    path: str | None = None,
+    *,
+    segments: int = DOWNLOAD_SEGMENTS,
+    sha256: str | None = None,
 ) -> str:
     """Download and extract the NASR zip for ``edition`` and return the extraction directory."""
-    if not path:
-        return extract_nasr_zip(download_nasr_zip(get_download_url(edition=edition)))
     return extract_nasr_zip(
-        download_nasr_zip(get_download_url(edition=edition), path=path)
+        download_nasr_zip(
+            get_download_url(edition=edition),
+            path=path,
+            segments=segments,
+            sha256=sha256,
+        )
     )
 
 
@@ -102,6 +279,20 @@ if __name__ == "__main__":
         choices=["debug", "info", "warning", "error", "critical"],
         default="warning",
     )
+    parser.add_argument(
+        "-n",
+        "--no-extract",
+        help="only download; import.py --zip reads the archive directly",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-s",
+        "--segments",
+        help="parallel range requests for the download",
+        type=int,
+        default=DOWNLOAD_SEGMENTS,
+    )
+    parser.add_argument("--sha256", help="expected SHA-256 of the zip, if known")
     args = parser.parse_args()
     log_level_map = {
         "debug": logging.DEBUG,
@@ -111,9 +302,22 @@ if __name__ == "__main__":
         "critical": logging.CRITICAL,
     }
     logging.basicConfig(level=log_level_map[args.log_level])
-    print(
-        download_and_extract_nasr_zip(
-            edition=args.edition,
-            path=str(Path(tempfile.gettempdir()) / "faa_nasr_data"),
+    download_path = str(Path(tempfile.gettempdir()) / "faa_nasr_data")
+    if args.no_extract:
+        print(
+            download_nasr_zip(
+                get_download_url(edition=args.edition),
+                path=download_path,
+                segments=args.segments,
+                sha256=args.sha256,
+            )
+        )
+    else:
+        print(
+            download_and_extract_nasr_zip(
+                edition=args.edition,
+                path=download_path,
+                segments=args.segments,
+                sha256=args.sha256,
+            )
         )
-    )
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+"""
+Export the database to a read-only SQLite snapshot for query nodes.
+
+The snapshot holds the newest record of each facility, fully indexed and
+analyzed, in a compact file that is never written again. Query nodes open
+it with ``DB_RDBM=sqlite-snapshot`` and ``DB_HOST=/path/to/snapshot.db``,
+which makes ``aeroinfo.database`` open the file read-only and immutable
+(no locking or change detection) with a large memory map.
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Select, Table, create_engine, event, func, insert, select
+from sqlalchemy.engine import Engine as SAEngine
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from aeroinfo.database import resolve_engine
+from aeroinfo.database.base import Base
+from aeroinfo.database.models.apt import Airport
+from aeroinfo.database.models.nav import Navaid
+from aeroinfo.parsers.schema import related_tables
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+# Rows fetched from the source and inserted into the snapshot at a time.
+COPY_CHUNK_SIZE = 5000
+
+
+def _superseded_airports() -> Select[tuple[str]]:
+    """Select site numbers of airports whose FAA id has a newer record."""
+    rows = select(
+        Airport.facility_site_number,
+        func.row_number()
+        .over(
+            partition_by=Airport.faa_id,
+            order_by=(
+                Airport.effective_date.desc().nulls_last(),
+                Airport.facility_site_number,
+            ),
+        )
+        .label("rank"),
+    ).where(Airport.faa_id.is_not(None))
+    ranked = rows.subquery()
+    return select(ranked.c.facility_site_number).where(ranked.c.rank > 1)
+
+
+def _copy_table(source: SAEngine, snapshot: SAEngine, table: Table) -> int:
+    stmt = select(table)
+    if table in related_tables(Airport.__table__):
+        stmt = stmt.where(table.c.facility_site_number.not_in(_superseded_airports()))
+    copied = 0
+    with source.connect() as reader, snapshot.begin() as writer:
+        result = reader.execution_options(yield_per=COPY_CHUNK_SIZE).execute(stmt)
+        for rows in result.mappings().partitions():
+            writer.execute(insert(table), [dict(row) for row in rows])
+            copied += len(rows)
+    return copied
+
+
+def export_snapshot(destination: Path, source: SAEngine | None = None) -> int:
+    """
+    Write the airport and navaid tables of ``source`` to ``destination``.
+
+    ``source`` defaults to the configured Engine. The file is built next to
+    ``destination`` and moved into place once complete, so a query node
+    never opens a partial snapshot. Returns the number of rows written.
+    """
+    source = resolve_engine(source)
+    tables = [
+        table
+        for table in Base.metadata.sorted_tables
+        if table in related_tables(Airport.__table__)
+        or table in related_tables(Navaid.__table__)
+    ]
+    building = destination.with_name(destination.name + ".tmp")
+    building.unlink(missing_ok=True)
+    snapshot = create_engine(f"sqlite:///{building}")
+
+    @event.listens_for(snapshot, "connect")
+    def _set_pragmas(dbapi_connection: Any, _record: object) -> None:  # noqa: ANN401
+        # A failed export deletes the file, so it needs no journal or fsyncs.
+        for pragma in ("journal_mode = OFF", "synchronous = OFF"):
+            dbapi_connection.execute(f"PRAGMA {pragma}")
+
+    try:
+        with snapshot.connect() as connection:
+            for table in tables:
+                connection.execute(CreateTable(table))
+            connection.commit()
+
+        rows = 0
+        for table in tables:
+            start = time.perf_counter()
+            copied = _copy_table(source, snapshot, table)
+            rows += copied
+            logger.info(
+                "Copied %s rows of %s in %.1fs",
+                copied,
+                table.name,
+                time.perf_counter() - start,
+            )
+
+        autocommit = snapshot.connect().execution_options(isolation_level="AUTOCOMMIT")
+        with autocommit as connection:
+            for table in tables:
+                for index in sorted(table.indexes, key=lambda ix: ix.name):
+                    connection.execute(CreateIndex(index))
+            for statement in ("ANALYZE", "VACUUM"):
+                connection.exec_driver_sql(statement)
+    except BaseException:
+        snapshot.dispose()
+        building.unlink(missing_ok=True)
+        raise
+    snapshot.dispose()
+
+    building.chmod(0o444)
+    building.replace(destination)
+    logger.info(
+        "Wrote %s rows to %s (%.1f MB)",
+        rows,
+        destination,
+        destination.stat().st_size / 1e6,
+    )
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("destination", type=Path, help="snapshot file to write")
+    args = parser.parse_args()
+    export_snapshot(args.destination)
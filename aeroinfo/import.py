@@ -1,12 +1,22 @@
 #!/usr/bin/env python
 """Small command-line helper to import parsed NASR files into the DB."""
 
+import argparse
 import logging
-import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from aeroinfo.database import invalidate_caches
+from aeroinfo.database import (
+    Engine,
+    configure_engine,
+    invalidate_caches,
+    optimize_sqlite,
+)
 from aeroinfo.parsers import apt, nav
+from aeroinfo.parsers.loaders import DEFAULT_CHUNK_SIZE
+from aeroinfo.parsers.utils import open_zip_member
 
 logging.basicConfig(
     level=logging.INFO,
@@ -15,18 +25,202 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def main(nasrdir: str) -> None:
-    """Import APT.txt and NAV.txt from the given NASR directory."""
+def _import_file(
+    parse: Callable[..., int],
+    nasr: Path,
+    name: str,
+    *,
+    from_zip: bool,
+    **parse_kwargs: object,
+) -> None:
+    """Run one parser over the ``name`` file of ``nasr`` and log its throughput."""
+    start = time.perf_counter()
+    if from_zip:
+        logger.info("Starting import of %s from %s", name, str(nasr))
+        with open_zip_member(nasr, name) as f:
+            rows = parse(f, **parse_kwargs)
+    else:
+        logger.info("Starting import of %s", str(nasr / name))
+        rows = parse(str(nasr / name), **parse_kwargs)
+    elapsed = time.perf_counter() - start
+    logger.info(
+        "Imported %s: %s rows in %.1fs (%.0f rows/s)",
+        name,
+        rows,
+        elapsed,
+        rows / elapsed if elapsed else 0,
+    )
+
+
+def main(
+    nasrdir: str,
+    *,
+    bulk: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int = 1,
+    sequential: bool = False,
+    from_zip: bool = False,
+    incremental: bool = False,
+    swap: bool = False,
+    defer_indexes: bool = False,
+    fast_sqlite: bool = False,
+) -> None:
+    """
+    Import APT.txt and NAV.txt from the given NASR directory.
+
+    With ``bulk`` set, records are written in batches of ``chunk_size``
+    rows instead of being merged one at a time. APT.txt is decoded in
+    ``workers`` processes when that is above one. With ``from_zip`` set,
+    ``nasrdir`` is the subscription zip itself and the files are
+    decompressed as they are parsed, without extracting them. With
+    ``incremental`` set, only facilities that changed since the last
+    incremental import are written, and ones that disappeared are deleted.
+    With ``swap`` set, each file is loaded into shadow tables that replace
+    the live ones in one short transaction once they are complete. With
+    ``defer_indexes`` set, secondary indexes and foreign keys are dropped
+    while the rows are written and rebuilt once at the end. With
+    ``fast_sqlite`` set, a SQLite database is loaded with durability traded
+    for speed and then analyzed, vacuumed and switched to WAL for readers.
+
+    The two files write disjoint tables, so they are imported side by side,
+    each in its own thread and transaction. SQLite allows only one writer
+    at a time, so there (or with ``sequential``) they run one after the
+    other. Caches are invalidated once both imports have finished.
+    """
     nasrdir_path = Path(nasrdir)
-    aptpath = nasrdir_path / "APT.txt"
-    logger.info("Starting import of %s", str(aptpath))
-    apt.parse(str(aptpath))
-    navpath = nasrdir_path / "NAV.txt"
-    logger.info("Starting import of %s", str(navpath))
-    nav.parse(str(navpath))
-    invalidate_caches()
-    logger.info("Import complete.")
+    jobs = [
+        (
+            apt.parse,
+            "APT.txt",
+            {
+                "bulk": bulk,
+                "chunk_size": chunk_size,
+                "workers": workers,
+                "incremental": incremental,
+                "swap": swap,
+                "defer_indexes": defer_indexes,
+            },
+        ),
+        (
+            nav.parse,
+            "NAV.txt",
+            {
+                "bulk": bulk,
+                "chunk_size": chunk_size,
+                "incremental": incremental,
+                "swap": swap,
+                "defer_indexes": defer_indexes,
+            },
+        ),
+    ]
+
+    if fast_sqlite and Engine.dialect.name != "sqlite":
+        logger.info("--fast-sqlite only applies to SQLite databases; ignoring it")
+        fast_sqlite = False
+    if fast_sqlite:
+        configure_engine(sqlite_profile="load")
+
+    start = time.perf_counter()
+    try:
+        if sequential or Engine.dialect.name == "sqlite":
+            for parse, name, parse_kwargs in jobs:
+                _import_file(
+                    parse, nasrdir_path, name, from_zip=from_zip, **parse_kwargs
+                )
+        else:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+                futures = [
+                    pool.submit(
+                        _import_file,
+                        parse,
+                        nasrdir_path,
+                        name,
+                        from_zip=from_zip,
+                        **parse_kwargs,
+                    )
+                    for parse, name, parse_kwargs in jobs
+                ]
+            # Leaving the pool waits for both; then surface the first error.
+            for future in futures:
+                future.result()
+    finally:
+        # Whatever committed is visible now; don't serve stale lookups.
+        invalidate_caches()
+    if fast_sqlite:
+        configure_engine(sqlite_profile="read")
+        optimize_sqlite()
+    logger.info("Import complete in %.1fs.", time.perf_counter() - start)
 
 
 if __name__ == "__main__":
-    main(sys.argv[1])
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "nasrdir", help="directory holding APT.txt and NAV.txt (or the zip with --zip)"
+    )
+    parser.add_argument(
+        "-b",
+        "--bulk",
+        help="batch rows into executemany upserts instead of merging each record",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-c",
+        "--chunk-size",
+        help="rows per batch in bulk mode",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        help="processes decoding APT.txt in parallel (default: 1, serial)",
+        type=int,
+        default=1,
+    )
+    parser.add_argument(
+        "-s",
+        "--sequential",
+        help="import APT.txt and then NAV.txt instead of both at once",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-z",
+        "--zip",
+        help="read APT.txt and NAV.txt straight from the NASR subscription zip",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-i",
+        "--incremental",
+        help="only write facilities that changed since the last incremental import",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--swap",
+        help="load into shadow tables and swap them in for the live ones when done",
+        action="store_true",
+    )
+    parser.add_argument(
+        "-d",
+        "--defer-indexes",
+        help="drop indexes and foreign keys while loading and rebuild them at the end",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--fast-sqlite",
+        help="load SQLite without fsyncs, then analyze, vacuum and switch it to WAL",
+        action="store_true",
+    )
+    args = parser.parse_args()
+    main(
+        args.nasrdir,
+        bulk=args.bulk,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        sequential=args.sequential,
+        from_zip=args.zip,
+        incremental=args.incremental,
+        swap=args.swap,
+        defer_indexes=args.defer_indexes,
+        fast_sqlite=args.fast_sqlite,
+    )
@@ -3,18 +3,23 @@
 """
 Parser for NASR APT fixed-width records.
 
-This module reads the APT.TXT NASR file and merges records into the
-database models. The FAA-format comment blocks are intentionally left
-unchanged.
+This module reads the APT.TXT NASR file and hands records to a loader that
+writes them into the database. The FAA-format comment blocks are
+intentionally left unchanged.
 """
 
+import io
+import itertools
 import logging
+import multiprocessing
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
 
-from sqlalchemy.orm import Session as SASession
-from sqlalchemy.orm import sessionmaker
-
-from aeroinfo.database import Engine
+from aeroinfo.database import Engine, resolve_engine
 from aeroinfo.database.models.apt import (
     Airport,
     AirportRemark,
@@ -22,1249 +27,842 @@ from aeroinfo.database.models.apt import (
     Runway,
     RunwayEnd,
 )
-from aeroinfo.parsers.utils import get_field
+from aeroinfo.parsers.fingerprints import (
+    FacilityKey,
+    FingerprintFilter,
+    forget_fingerprints,
+)
+from aeroinfo.parsers.loaders import BulkLoader, MergeLoader, get_loader
+from aeroinfo.parsers.schema import deferred_constraints
+from aeroinfo.parsers.shadow import swapped_in
+from aeroinfo.parsers.utils import NasrSource, RecordLayout, open_records
 
 logger = logging.getLogger(__name__)
-Session = sessionmaker()
 
+_AptRecord = Airport | AirportRemark | AttendanceSchedule | Runway | RunwayEnd
 
-def set_airport_attr(
-    session: SASession, facility_site_number: str, attr: str, value: object
-) -> None:
-    """Set an attribute on an existing Airport and merge into the session."""
-    airport = (
-        session.query(Airport)
-        .filter_by(facility_site_number=facility_site_number)
-        .scalar()
-    )
-    setattr(airport, attr, value)
-    session.merge(airport)
-
-
-def set_runway_attr(
-    session: SASession, facility_site_number: str, runway: str, attr: str, value: object
-) -> None:
-    """Set an attribute on an existing Runway and merge into the session."""
-    runway_obj = (
-        session.query(Runway)
-        .filter_by(facility_site_number=facility_site_number, name=runway)
-        .scalar()
-    )
-    setattr(runway_obj, attr, value)
-    session.merge(runway_obj)
-
-
-def set_rw_end_attr(
-    session: SASession, facility_site_number: str, rw_end: str, attr: str, value: object
-) -> None:
-    """Set an attribute on an existing RunwayEnd and merge into the session."""
-    runway_end = (
-        session.query(RunwayEnd)
-        .filter_by(facility_site_number=facility_site_number, id=rw_end)
-        .scalar()
-    )
-    setattr(runway_end, attr, value)
-    session.merge(runway_end)
+# Byte ranges per worker in parallel mode; more ranges than workers keeps
+# them all busy when some ranges decode slower than others.
+_RANGES_PER_WORKER = 4
+
+# Record layouts, positions as in references/apt_rf.txt.
+_APT = RecordLayout(
+    [
+        # L A N D I N G   F A C I L I T Y   D A T A
+        ("facility_site_number", 4, 11),
+        ("facility_type", 15, 13),
+        ("faa_id", 28, 4),
+        ("effective_date", 32, 10, "date"),
+        # DEMOGRAPHIC DATA
+        ("region", 42, 3),
+        ("field_office", 45, 4),
+        ("state_code", 49, 2),
+        ("state_name", 51, 20),
+        ("county", 71, 21),
+        ("countys_state", 92, 2),
+        ("city", 94, 40),
+        ("name", 134, 50),
+        # OWNERSHIP DATA
+        ("ownership_type", 184, 2),
+        ("facility_use", 186, 2),
+        ("owners_name", 188, 35),
+        ("owners_address", 223, 72),
+        ("owners_city_state_zip", 295, 45),
+        ("owners_phone", 340, 16),
+        ("managers_name", 356, 35),
+        ("managers_address", 391, 72),
+        ("managers_city_state_zip", 463, 45),
+        ("managers_phone", 508, 16),
+        # GEOGRAPHIC DATA
+        ("latitude_dms", 524, 15),
+        ("latitude_secs", 539, 12),
+        ("longitude_dms", 551, 15),
+        ("longitude_secs", 566, 12),
+        ("coords_method", 578, 1),
+        ("elevation", 579, 7, "float"),
+        ("elevation_method", 586, 1),
+        ("mag_variation", 587, 3),
+        ("mag_variation_year", 590, 4, "int"),
+        ("pattern_alt", 594, 4, "int"),
+        ("sectional", 598, 30),
+        ("distance_from_city", 628, 2, "int"),
+        ("direction_from_city", 630, 3),
+        ("land_area", 633, 5, "int"),
+        # FAA SERVICES
+        ("boundary_artcc_id", 638, 4),
+        ("boundary_artcc_computer_id", 642, 3),
+        ("boundary_artcc_name", 645, 30),
+        ("responsible_artcc_id", 675, 4),
+        ("responsible_artcc_computer_id", 679, 3),
+        ("responsible_artcc_name", 682, 30),
+        ("tie_in_fss_local", 712, 1, "bool"),
+        ("tie_in_fss_id", 713, 4),
+        ("tie_in_fss_name", 717, 30),
+        ("fss_local_phone", 747, 16),
+        ("fss_toll_free_phone", 763, 16),
+        ("alternate_fss_id", 779, 4),
+        ("alternate_fss_name", 783, 30),
+        ("alternate_fss_toll_free_phone", 813, 16),
+        ("notam_facility", 829, 4),
+        ("notam_d_available", 833, 1, "bool"),
+        # FEDERAL STATUS
+        ("activation_date", 834, 7, "date"),
+        ("status", 841, 2),
+        ("arff_certification", 843, 15),
+        ("npias_federal_agreements", 858, 7),
+        ("airspace_analysis", 865, 13),
+        ("airport_of_entry", 878, 1, "bool"),
+        ("customs_landing_rights", 879, 1, "bool"),
+        ("military_civil_join_use", 880, 1, "bool"),
+        ("military_landing_rights", 881, 1, "bool"),
+        # AIRPORT INSPECTION DATA
+        ("inspection_method", 882, 2, "AirportInspectionMethodEnum"),
+        ("agency_performing_inspection", 884, 1),
+        ("last_inspection_date", 885, 8, "mdydate"),
+        ("last_information_request_complete_date", 893, 8, "mdydate"),
+        # AIRPORT SERVICES
+        ("fuel_available", 901, 40),
+        ("airframe_repair_service", 941, 5),
+        ("power_plant_repair_service", 946, 5),
+        ("bottled_oxygen", 951, 8),
+        ("bulk_oxygen", 959, 8),
+        # AIRPORT FACILITIES
+        ("lighting_schedule", 967, 7),
+        ("beacon_schedule", 974, 7),
+        ("towered_airport", 981, 1, "bool"),
+        ("unicom", 982, 7),
+        ("ctaf", 989, 7),
+        ("segmented_circle_available", 996, 4, "SegmentedCircleEnum"),
+        ("beacon_color", 1000, 3),
+        ("noncommerical_landing_fee", 1003, 1, "bool"),
+        ("landing_facility_used_for_medical_purposes", 1004, 1, "bool"),
+        # BASED AIRCRAFT
+        ("based_general_aviation_single_engine_airplanes", 1005, 3, "int"),
+        ("based_general_aviation_multi_engine_airplanes", 1008, 3, "int"),
+        ("based_general_aviation_jet_engine_airplanes", 1011, 3, "int"),
+        ("based_general_aviation_helicopters", 1014, 3, "int"),
+        ("based_gliders", 1017, 3, "int"),
+        ("based_military_aircraft", 1020, 3, "int"),
+        ("based_ultralight_aircraft", 1023, 3, "int"),
+        # ANNUAL OPERATIONS
+        ("annual_ops_commercial", 1026, 6, "int"),
+        ("annual_ops_commuter", 1032, 6, "int"),
+        ("annual_ops_air_taxi", 1038, 6, "int"),
+        ("annual_ops_general_aviation_local", 1044, 6, "int"),
+        ("annual_ops_general_aviation_itinerant", 1050, 6, "int"),
+        ("annual_ops_military", 1056, 6, "int"),
+        ("annual_ops_end_of_measurement_period", 1062, 10, "date"),
+        # ADDITIONAL AIRPORT DATA
+        ("position_source", 1072, 16),
+        ("position_date", 1088, 10, "date"),
+        ("elevation_source", 1098, 16),
+        ("elevation_date", 1114, 10, "date"),
+        ("contract_fuel_available", 1124, 1, "bool"),
+        ("transient_storage_facilities", 1125, 12),
+        ("other_services_available", 1137, 71),
+        ("wind_indicator", 1208, 3, "SegmentedCircleEnum"),
+        ("icao_id", 1211, 7),
+        ("minimum_operational_network", 1218, 1),
+    ]
+)
+
+_RWY = RecordLayout(
+    [
+        # F A C I L I T Y   R U N W A Y   D A T A
+        ("facility_site_number", 4, 11),
+        ("name", 17, 7),
+        # COMMON RUNWAY DATA
+        ("length", 24, 5, "int"),
+        ("width", 29, 4, "int"),
+        ("surface_type_condition", 33, 12),
+        ("surface_treatment", 45, 5),
+        ("pavement_classification_number", 50, 11),
+        ("edge_light_intensity", 61, 5),
+        # ADDITIONAL COMMON RUNWAY DATA
+        ("length_source", 510, 16),
+        ("length_source_date", 526, 10, "date"),
+        ("weight_bearing_capacity_single_wheel", 536, 6),
+        ("weight_bearing_capacity_dual_wheels", 542, 6),
+        ("weight_bearing_capacity_two_dual_wheels_tandem", 548, 6),
+        ("weight_bearing_capacity_two_dual_wheels_double_tandem", 554, 6),
+    ]
+)
+
+_RWY_BASE_END = RecordLayout(
+    [
+        # BASE END INFORMATION
+        ("id", 66, 3),
+        ("true_alignment", 69, 3, "int"),
+        ("approach_type", 72, 10),
+        ("right_traffic", 82, 1, "bool"),
+        ("markings_type", 83, 5),
+        ("markings_condition", 88, 1),
+        # BASE END GEOGRAPHIC DATA
+        ("latitude_dms", 89, 15),
+        ("latitude_secs", 104, 12),
+        ("longitude_dms", 116, 15),
+        ("longitude_secs", 131, 12),
+        ("elevation", 143, 7, "float"),
+        ("threshold_crossing_height", 150, 3, "int"),
+        ("visual_glide_path_angle", 153, 4, "float"),
+        ("displaced_threshold_latitude_dms", 157, 15),
+        ("displaced_threshold_latitude_secs", 172, 12),
+        ("displaced_threshold_longitude_dms", 184, 15),
+        ("displaced_threshold_longitude_secs", 199, 12),
+        ("displaced_threshold_elevation", 211, 7, "float"),
+        ("displaced_threshold_length", 218, 4, "int"),
+        ("touchdown_zone_elevation", 222, 7, "float"),
+        # BASE END LIGHTING DATA
+        ("visual_glide_slope_indicators", 229, 5),
+        ("rvr_equipment", 234, 3),
+        ("rvv_equipment", 237, 1, "bool"),
+        ("approach_light_system", 238, 8),
+        ("reil_availability", 246, 1, "bool"),
+        ("centerline_light_availability", 247, 1, "bool"),
+        ("touchdown_lights_availability", 248, 1, "bool"),
+        # BASE END OBJECT DATA
+        ("controlling_object_description", 249, 11),
+        ("controlling_object_marking", 260, 4),
+        ("part77_category", 264, 5),
+        ("controlling_object_clearance_slope", 269, 2, "int"),
+        ("controlling_object_height_above_runway", 271, 5, "int"),
+        ("controlling_object_distance_from_runway", 276, 5, "int"),
+        ("controlling_object_centerline_offset", 281, 7),
+        # ADDITIONAL BASE END DATA
+        ("gradient", 560, 5),
+        ("gradient_direction", 565, 4),
+        ("position_source", 569, 16),
+        ("position_date", 585, 10, "date"),
+        ("elevation_source", 595, 16),
+        ("elevation_date", 611, 10, "date"),
+        ("displaced_threshold_position_source", 621, 16),
+        ("displaced_threshold_position_date", 637, 10, "date"),
+        ("displaced_threshold_elevation_source", 647, 16),
+        ("displaced_threshold_elevation_date", 663, 10, "date"),
+        ("touchdown_zone_elevation_source", 673, 16),
+        ("touchdown_zone_elevation_date", 689, 10, "date"),
+        ("takeoff_run_available", 699, 5, "int"),
+        ("takeoff_distance_available", 704, 5, "int"),
+        ("accelerate_stop_distance_available", 709, 5, "int"),
+        ("landing_distance_available", 714, 5, "int"),
+        ("lahso_distance_available", 719, 5, "int"),
+        ("id_of_lahso_intersecting_runway", 724, 7),
+        ("description_of_lahso_entity", 731, 40),
+        ("lahso_latitude_dms", 771, 15),
+        ("lahso_latitude_secs", 786, 12),
+        ("lahso_longitude_dms", 798, 15),
+        ("lahso_longitude_secs", 813, 12),
+        ("lahso_coords_source", 825, 16),
+        ("lahso_coords_date", 841, 10, "date"),
+    ]
+)
+
+_RWY_RECIP_END = RecordLayout(
+    [
+        # RECIPROCAL END INFORMATION
+        ("id", 288, 3),
+        ("true_alignment", 291, 3, "int"),
+        ("approach_type", 294, 10),
+        ("right_traffic", 304, 1, "bool"),
+        ("markings_type", 305, 5),
+        ("markings_condition", 310, 1),
+        # RECIPROCAL END GEOGRAPHIC DATA
+        ("latitude_dms", 311, 15),
+        ("latitude_secs", 326, 12),
+        ("longitude_dms", 338, 15),
+        ("longitude_secs", 353, 12),
+        ("elevation", 365, 7, "float"),
+        ("threshold_crossing_height", 372, 3, "int"),
+        ("visual_glide_path_angle", 375, 4, "float"),
+        ("displaced_threshold_latitude_dms", 379, 15),
+        ("displaced_threshold_latitude_secs", 394, 12),
+        ("displaced_threshold_longitude_dms", 406, 15),
+        ("displaced_threshold_longitude_secs", 421, 12),
+        ("displaced_threshold_elevation", 433, 7, "float"),
+        ("displaced_threshold_length", 440, 4, "int"),
+        ("touchdown_zone_elevation", 444, 7, "float"),
+        # RECIPROCAL END LIGHTING DATA
+        ("visual_glide_slope_indicators", 451, 5),
+        ("rvr_equipment", 456, 3),
+        ("rvv_equipment", 459, 1, "bool"),
+        ("approach_light_system", 460, 8),
+        ("reil_availability", 468, 1, "bool"),
+        ("centerline_light_availability", 469, 1, "bool"),
+        ("touchdown_lights_availability", 470, 1, "bool"),
+        # RECIPROCAL END OBJECT DATA
+        ("controlling_object_description", 471, 11),
+        ("controlling_object_marking", 482, 4),
+        ("part77_category", 486, 5),
+        ("controlling_object_clearance_slope", 491, 2, "int"),
+        ("controlling_object_height_above_runway", 493, 5, "int"),
+        ("controlling_object_distance_from_runway", 498, 5, "int"),
+        ("controlling_object_centerline_offset", 503, 7),
+        # ADDITIONAL RECIPROCAL END DATA
+        ("gradient", 851, 5),
+        ("gradient_direction", 856, 4),
+        ("position_source", 860, 16),
+        ("position_date", 876, 10, "date"),
+        ("elevation_source", 886, 16),
+        ("elevation_date", 902, 10, "date"),
+        ("displaced_threshold_position_source", 912, 16),
+        ("displaced_threshold_position_date", 928, 10, "date"),
+        ("displaced_threshold_elevation_source", 938, 16),
+        ("displaced_threshold_elevation_date", 954, 10, "date"),
+        ("touchdown_zone_elevation_source", 964, 16),
+        ("touchdown_zone_elevation_date", 980, 10, "date"),
+        ("takeoff_run_available", 990, 5, "int"),
+        ("takeoff_distance_available", 995, 5, "int"),
+        ("accelerate_stop_distance_available", 1000, 5, "int"),
+        ("landing_distance_available", 1005, 5, "int"),
+        ("lahso_distance_available", 1010, 5, "int"),
+        ("id_of_lahso_intersecting_runway", 1015, 7),
+        ("description_of_lahso_entity", 1022, 40),
+        ("lahso_latitude_dms", 1062, 15),
+        ("lahso_latitude_secs", 1077, 12),
+        ("lahso_longitude_dms", 1089, 15),
+        ("lahso_longitude_secs", 1104, 12),
+        ("lahso_coords_source", 1116, 16),
+        ("lahso_coords_date", 1132, 10, "date"),
+    ]
+)
+
+_ATT = RecordLayout(
+    [
+        # F A C I L I T Y   A T T E N D A N C E   S C H E D U L E   D A T A
+        ("facility_site_number", 4, 11),
+        ("sequence_number", 17, 2, "int"),
+        ("attendance_schedule", 19, 108),
+    ]
+)
 
+_ARS = RecordLayout(
+    [
+        ("facility_site_number", 4, 11),
+        ("runway_end", 24, 3),
+        ("arresting_gear", 27, 9),
+    ]
+)
+
+_RMK = RecordLayout(
+    [
+        ("facility_site_number", 4, 11),
+        ("remark_element_name", 17, 13),
+        ("remark", 30, 1500),
+    ]
+)
+
+# RMK element name -> Airport attribute the remark text is stored in.
+_AIRPORT_REMARKS: dict[str, str] = {
+    "A5": "county_remark",
+    "A1": "city_remark",
+    "A2": "name_remark",
+    "A10": "ownership_type_remark",
+    "A18": "facility_use_remark",
+    "A11": "owners_name_remark",
+    "A12": "owners_address_remark",
+    "A12A": "owners_city_state_zip_remark",
+    "A13": "owners_phone_remark",
+    "A14": "managers_name_remark",
+    "A15": "managers_address_remark",
+    "A15A": "managers_city_state_zip_remark",
+    "A16": "managers_phone_remark",
+    "A19": "latitude_dms_remark",
+    "A20": "longitude_dms_remark",
+    "A19A": "coords_method_remark",
+    "A21": "elevation_remark",
+    "E147": "pattern_alt_remark",
+    "A7": "sectional_remark",
+    "A3": "distance_from_city_remark",
+    "A22": "land_area_remark",
+    "E156A": "responsible_artcc_id_remark",
+    "A86": "tie_in_fss_remark",
+    "A26": "arff_certification_remark",
+    "A25": "npias_federal_agreements_remark",
+    "E111": "airspace_analysis_remark",
+    "E79": "airport_of_entry_remark",
+    "E80": "customs_landing_rights_remark",
+    "E115": "military_civil_join_use_remark",
+    "E116": "military_landing_rights_remark",
+    "A111": "agency_performing_inspection_remark",
+    "A112": "last_inspection_date_remark",
+    "A70": "fuel_available_remark",
+    "A71": "airframe_repair_service_remark",
+    "A72": "power_plant_repair_service_remark",
+    "A73": "bottled_oxygen_remark",
+    "A74": "bulk_oxygen_remark",
+    "A81-APT": "lighting_schedule_remark",
+    "A81-BCN": "beacon_schedule_remark",
+    "A82": "unicom_remark",
+    "E100": "ctaf_remark",
+    "A84": "segmented_circle_available_remark",
+    "A80": "beacon_color_remark",
+    "A24": "noncommerical_landing_fee_remark",
+    "A90": "based_general_aviation_single_engine_airplanes_remark",
+    "A91": "based_general_aviation_multi_engine_airplanes_remark",
+    "A92": "based_general_aviation_jet_engine_airplanes_remark",
+    "A93": "based_general_aviation_helicopters_remark",
+    "A94": "based_gliders_remark",
+    "A95": "based_military_aircraft_remark",
+    "A96": "based_ultralight_aircraft_remark",
+    "A100": "annual_ops_commercial_remark",
+    "A101": "annual_ops_commuter_remark",
+    "A102": "annual_ops_air_taxi_remark",
+    "A103": "annual_ops_general_aviation_local_remark",
+    "A104": "annual_ops_general_aviation_itinerant_remark",
+    "A105": "annual_ops_military_remark",
+    "A75": "transient_storage_facilities_remark",
+    "A76": "other_services_available_remark",
+    "A83": "wind_indicator_remark",
+}
 
-def parse(txtfile: str) -> None:
+# RMK element prefix -> (model, attribute) for per-runway and per-runway-end
+# remarks, whose element names look like "A31-18/36" or "A60-18".
+_RUNWAY_REMARK_PREFIXES: dict[str, tuple[type[Runway] | type[RunwayEnd], str]] = {
+    "A30": (Runway, "name_remark"),
+    "A31": (Runway, "length_remark"),
+    "A32": (Runway, "width_remark"),
+    "A33": (Runway, "surface_type_condition_remark"),
+    "A34": (Runway, "surface_treatment_remark"),
+    "A39": (Runway, "pavement_classification_number_remark"),
+    "A40": (Runway, "edge_light_intensity_remark"),
+    "A35": (Runway, "weight_bearing_capacity_single_wheel_remark"),
+    "A36": (Runway, "weight_bearing_capacity_dual_wheels_remark"),
+    "A37": (Runway, "weight_bearing_capacity_two_dual_wheels_tandem_remark"),
+    "A38": (Runway, "weight_bearing_capacity_two_dual_wheels_double_tandem_remark"),
+    "A30A": (RunwayEnd, "id_remark"),
+    "E46": (RunwayEnd, "true_alignment_remark"),
+    "A23": (RunwayEnd, "right_traffic_remark"),
+    "A42": (RunwayEnd, "markings_remark"),
+    "E68": (RunwayEnd, "latitude_dms_remark"),
+    "E69": (RunwayEnd, "longitude_dms_remark"),
+    "E70": (RunwayEnd, "elevation_remark"),
+    "A44": (RunwayEnd, "threshold_crossing_height_remark"),
+    "A45": (RunwayEnd, "visual_glide_path_angle_remark"),
+    "E161": (RunwayEnd, "displaced_threshold_latitude_dms_remark"),
+    "E162": (RunwayEnd, "displaced_threshold_longitude_dms_remark"),
+    "A51": (RunwayEnd, "displaced_threshold_length_remark"),
+    "A43": (RunwayEnd, "visual_glide_slope_indicators_remark"),
+    "A47": (RunwayEnd, "rvr_equipment_remark"),
+    "A49": (RunwayEnd, "approach_light_system_remark"),
+    "A48": (RunwayEnd, "reil_availability_remark"),
+    "A46": (RunwayEnd, "centerline_light_availability_remark"),
+    "A46A": (RunwayEnd, "touchdown_lights_availability_remark"),
+    "A52": (RunwayEnd, "controlling_object_description_remark"),
+    "A53": (RunwayEnd, "controlling_object_marking_remark"),
+    "A50": (RunwayEnd, "part77_category_remark"),
+    "A57": (RunwayEnd, "controlling_object_clearance_slope_remark"),
+    "A54": (RunwayEnd, "controlling_object_height_above_runway_remark"),
+    "A55": (RunwayEnd, "controlling_object_distance_from_runway_remark"),
+    "A56": (RunwayEnd, "controlling_object_centerline_offset_remark"),
+    "E40": (RunwayEnd, "gradient_remark"),
+    "A60": (RunwayEnd, "takeoff_run_available_remark"),
+}
+
+
+class _FacilityBuffer:
     """
-    Parse the given APT TXT file and merge records into the DB.
+    Hold the records of the facility being parsed until the next one starts.
 
-    The ``txtfile`` parameter may be a path string.
+    APT.txt lists each facility's APT record followed by its ATT, RWY, ARS
+    and RMK records, so ARS and RMK data can be applied to the buffered
+    Airport, Runway and RunwayEnd objects directly instead of querying the
+    database for them. The buffer is handed to the loader, in file order,
+    when the next APT record arrives. Records for any other site go straight
+    to the loader and attributes for them fall back to ``loader.set_attr``.
     """
-    path = Path(txtfile)
 
-    with (
-        path.open(errors="replace") as f,
-        Engine.connect() as connection,
-        connection.begin(),
-        Session(bind=connection) as session,
-    ):
-        for line in f:
-            logger.debug("line: %s", line)
-            record_type = get_field(line, 1, 3)
-
-            if record_type == "APT":
-                airport = Airport()
-                # L A N D I N G   F A C I L I T Y   D A T A
-                airport.facility_site_number = get_field(line, 4, 11)
-                airport.facility_type = get_field(line, 15, 13)
-                airport.faa_id = get_field(line, 28, 4)
-                airport.effective_date = get_field(line, 32, 10, "date")
-                # DEMOGRAPHIC DATA
-                airport.region = get_field(line, 42, 3)
-                airport.field_office = get_field(line, 45, 4)
-                airport.state_code = get_field(line, 49, 2)
-                airport.state_name = get_field(line, 51, 20)
-                airport.county = get_field(line, 71, 21)
-                airport.countys_state = get_field(line, 92, 2)
-                airport.city = get_field(line, 94, 40)
-                airport.name = get_field(line, 134, 50)
-                # OWNERSHIP DATA
-                airport.ownership_type = get_field(line, 184, 2)
-                airport.facility_use = get_field(line, 186, 2)
-                airport.owners_name = get_field(line, 188, 35)
-                airport.owners_address = get_field(line, 223, 72)
-                airport.owners_city_state_zip = get_field(line, 295, 45)
-                airport.owners_phone = get_field(line, 340, 16)
-                airport.managers_name = get_field(line, 356, 35)
-                airport.managers_address = get_field(line, 391, 72)
-                airport.managers_city_state_zip = get_field(line, 463, 45)
-                airport.managers_phone = get_field(line, 508, 16)
-                # GEOGRAPHIC DATA
-                airport.latitude_dms = get_field(line, 524, 15)
-                airport.latitude_secs = get_field(line, 539, 12)
-                airport.longitude_dms = get_field(line, 551, 15)
-                airport.longitude_secs = get_field(line, 566, 12)
-                airport.coords_method = get_field(line, 578, 1)
-                airport.elevation = get_field(line, 579, 7, "float")
-                airport.elevation_method = get_field(line, 586, 1)
-                airport.mag_variation = get_field(line, 587, 3)
-                airport.mag_variation_year = get_field(line, 590, 4, "int")
-                airport.pattern_alt = get_field(line, 594, 4, "int")
-                airport.sectional = get_field(line, 598, 30)
-                airport.distance_from_city = get_field(line, 628, 2, "int")
-                airport.direction_from_city = get_field(line, 630, 3)
-                airport.land_area = get_field(line, 633, 5, "int")
-                # FAA SERVICES
-                airport.boundary_artcc_id = get_field(line, 638, 4)
-                airport.boundary_artcc_computer_id = get_field(line, 642, 3)
-                airport.boundary_artcc_name = get_field(line, 645, 30)
-                airport.responsible_artcc_id = get_field(line, 675, 4)
-                airport.responsible_artcc_computer_id = get_field(line, 679, 3)
-                airport.responsible_artcc_name = get_field(line, 682, 30)
-                airport.tie_in_fss_local = get_field(line, 712, 1, "bool")
-                airport.tie_in_fss_id = get_field(line, 713, 4)
-                airport.tie_in_fss_name = get_field(line, 717, 30)
-                airport.fss_local_phone = get_field(line, 747, 16)
-                airport.fss_toll_free_phone = get_field(line, 763, 16)
-                airport.alternate_fss_id = get_field(line, 779, 4)
-                airport.alternate_fss_name = get_field(line, 783, 30)
-                airport.alternate_fss_toll_free_phone = get_field(line, 813, 16)
-                airport.notam_facility = get_field(line, 829, 4)
-                airport.notam_d_available = get_field(line, 833, 1, "bool")
-                # FEDERAL STATUS
-                airport.activation_date = get_field(line, 834, 7, "date")
-                airport.status = get_field(line, 841, 2)
-                airport.arff_certification = get_field(line, 843, 15)
-                airport.npias_federal_agreements = get_field(line, 858, 7)
-                airport.airspace_analysis = get_field(line, 865, 13)
-                airport.airport_of_entry = get_field(line, 878, 1, "bool")
-                airport.customs_landing_rights = get_field(line, 879, 1, "bool")
-                airport.military_civil_join_use = get_field(line, 880, 1, "bool")
-                airport.military_landing_rights = get_field(line, 881, 1, "bool")
-                # AIRPORT INSPECTION DATA
-                airport.inspection_method = get_field(
-                    line, 882, 2, "AirportInspectionMethodEnum"
-                )
-                airport.agency_performing_inspection = get_field(line, 884, 1)
-                airport.last_inspection_date = get_field(line, 885, 8, "mdydate")
-                airport.last_information_request_complete_date = get_field(
-                    line, 893, 8, "mdydate"
-                )
-                # AIRPORT SERVICES
-                airport.fuel_available = get_field(line, 901, 40)
-                airport.airframe_repair_service = get_field(line, 941, 5)
-                airport.power_plant_repair_service = get_field(line, 946, 5)
-                airport.bottled_oxygen = get_field(line, 951, 8)
-                airport.bulk_oxygen = get_field(line, 959, 8)
-                # AIRPORT FACILITIES
-                airport.lighting_schedule = get_field(line, 967, 7)
-                airport.beacon_schedule = get_field(line, 974, 7)
-                airport.towered_airport = get_field(line, 981, 1, "bool")
-                airport.unicom = get_field(line, 982, 7)
-                airport.ctaf = get_field(line, 989, 7)
-                airport.segmented_circle_available = get_field(
-                    line, 996, 4, "SegmentedCircleEnum"
-                )
-                airport.beacon_color = get_field(line, 1000, 3)
-                airport.noncommerical_landing_fee = get_field(line, 1003, 1, "bool")
-                airport.landing_facility_used_for_medical_purposes = get_field(
-                    line, 1004, 1, "bool"
-                )
-                # BASED AIRCRAFT
-                airport.based_general_aviation_single_engine_airplanes = get_field(
-                    line, 1005, 3, "int"
-                )
-                airport.based_general_aviation_multi_engine_airplanes = get_field(
-                    line, 1008, 3, "int"
-                )
-                airport.based_general_aviation_jet_engine_airplanes = get_field(
-                    line, 1011, 3, "int"
-                )
-                airport.based_general_aviation_helicopters = get_field(
-                    line, 1014, 3, "int"
-                )
-                airport.based_gliders = get_field(line, 1017, 3, "int")
-                airport.based_military_aircraft = get_field(line, 1020, 3, "int")
-                airport.based_ultralight_aircraft = get_field(line, 1023, 3, "int")
-                # ANNUAL OPERATIONS
-                airport.annual_ops_commercial = get_field(line, 1026, 6, "int")
-                airport.annual_ops_commuter = get_field(line, 1032, 6, "int")
-                airport.annual_ops_air_taxi = get_field(line, 1038, 6, "int")
-                airport.annual_ops_general_aviation_local = get_field(
-                    line, 1044, 6, "int"
-                )
-                airport.annual_ops_general_aviation_itinerant = get_field(
-                    line, 1050, 6, "int"
-                )
-                airport.annual_ops_military = get_field(line, 1056, 6, "int")
-                airport.annual_ops_end_of_measurement_period = get_field(
-                    line, 1062, 10, "date"
-                )
-                # ADDITIONAL AIRPORT DATA
-                airport.position_source = get_field(line, 1072, 16)
-                airport.position_date = get_field(line, 1088, 10, "date")
-                airport.elevation_source = get_field(line, 1098, 16)
-                airport.elevation_date = get_field(line, 1114, 10, "date")
-                airport.contract_fuel_available = get_field(line, 1124, 1, "bool")
-                airport.transient_storage_facilities = get_field(line, 1125, 12)
-                airport.other_services_available = get_field(line, 1137, 71)
-                airport.wind_indicator = get_field(line, 1208, 3, "SegmentedCircleEnum")
-                airport.icao_id = get_field(line, 1211, 7)
-                airport.minimum_operational_network = get_field(line, 1218, 1)
-
-                session.merge(airport)
-
-            if record_type == "RWY":
-                runway = Runway()
-                # F A C I L I T Y   R U N W A Y   D A T A
-                runway.facility_site_number = get_field(line, 4, 11)
-                runway.name = get_field(line, 17, 7)
-                # COMMON RUNWAY DATA
-                runway.length = get_field(line, 24, 5, "int")
-                runway.width = get_field(line, 29, 4, "int")
-                runway.surface_type_condition = get_field(line, 33, 12)
-                runway.surface_treatment = get_field(line, 45, 5)
-                runway.pavement_classification_number = get_field(line, 50, 11)
-                runway.edge_light_intensity = get_field(line, 61, 5)
-                # ADDITIONAL COMMON RUNWAY DATA
-                runway.length_source = get_field(line, 510, 16)
-                runway.length_source_date = get_field(line, 526, 10, "date")
-                runway.weight_bearing_capacity_single_wheel = get_field(line, 536, 6)
-                runway.weight_bearing_capacity_dual_wheels = get_field(line, 542, 6)
-                runway.weight_bearing_capacity_two_dual_wheels_tandem = get_field(
-                    line, 548, 6
-                )
-                runway.weight_bearing_capacity_two_dual_wheels_double_tandem = (
-                    get_field(line, 554, 6)
-                )
-                # BASE END INFORMATION
-                base_end = None
-                base_end_id = get_field(line, 66, 3)
-                if base_end_id:
-                    base_end = RunwayEnd()
-                    base_end.facility_site_number = runway.facility_site_number
-                    base_end.runway_name = runway.name
-                    base_end.id = base_end_id
-                    base_end.true_alignment = get_field(line, 69, 3, "int")
-                    base_end.approach_type = get_field(line, 72, 10)
-                    base_end.right_traffic = get_field(line, 82, 1, "bool")
-                    base_end.markings_type = get_field(line, 83, 5)
-                    base_end.markings_condition = get_field(line, 88, 1)
-                    # BASE END GEOGRAPHIC DATA
-                    base_end.latitude_dms = get_field(line, 89, 15)
-                    base_end.latitude_secs = get_field(line, 104, 12)
-                    base_end.longitude_dms = get_field(line, 116, 15)
-                    base_end.longitude_secs = get_field(line, 131, 12)
-                    base_end.elevation = get_field(line, 143, 7, "float")
-                    base_end.threshold_crossing_height = get_field(line, 150, 3, "int")
-                    base_end.visual_glide_path_angle = get_field(line, 153, 4, "float")
-                    base_end.displaced_threshold_latitude_dms = get_field(line, 157, 15)
-                    base_end.displaced_threshold_latitude_secs = get_field(
-                        line, 172, 12
-                    )
-                    base_end.displaced_threshold_longitude_dms = get_field(
-                        line, 184, 15
-                    )
-                    base_end.displaced_threshold_longitude_secs = get_field(
-                        line, 199, 12
-                    )
-                    base_end.displaced_threshold_elevation = get_field(
-                        line, 211, 7, "float"
-                    )
-                    base_end.displaced_threshold_length = get_field(line, 218, 4, "int")
-                    base_end.touchdown_zone_elevation = get_field(line, 222, 7, "float")
-                    # BASE END LIGHTING DATA
-                    base_end.visual_glide_slope_indicators = get_field(line, 229, 5)
-                    base_end.rvr_equipment = get_field(line, 234, 3)
-                    base_end.rvv_equipment = get_field(line, 237, 1, "bool")
-                    base_end.approach_light_system = get_field(line, 238, 8)
-                    base_end.reil_availability = get_field(line, 246, 1, "bool")
-                    base_end.centerline_light_availability = get_field(
-                        line, 247, 1, "bool"
-                    )
-                    base_end.touchdown_lights_availability = get_field(
-                        line, 248, 1, "bool"
-                    )
-                    # BASE END OBJECT DATA
-                    base_end.controlling_object_description = get_field(line, 249, 11)
-                    base_end.controlling_object_marking = get_field(line, 260, 4)
-                    base_end.part77_category = get_field(line, 264, 5)
-                    base_end.controlling_object_clearance_slope = get_field(
-                        line, 269, 2, "int"
-                    )
-                    base_end.controlling_object_height_above_runway = get_field(
-                        line, 271, 5, "int"
-                    )
-                    base_end.controlling_object_distance_from_runway = get_field(
-                        line, 276, 5, "int"
-                    )
-                    base_end.controlling_object_centerline_offset = get_field(
-                        line, 281, 7
-                    )
-                    # ADDITIONAL BASE END DATA
-                    base_end.gradient = get_field(line, 560, 5)
-                    base_end.gradient_direction = get_field(line, 565, 4)
-                    base_end.position_source = get_field(line, 569, 16)
-                    base_end.position_date = get_field(line, 585, 10, "date")
-                    base_end.elevation_source = get_field(line, 595, 16)
-                    base_end.elevation_date = get_field(line, 611, 10, "date")
-                    base_end.displaced_threshold_position_source = get_field(
-                        line, 621, 16
-                    )
-                    base_end.displaced_threshold_position_date = get_field(
-                        line, 637, 10, "date"
-                    )
-                    base_end.displaced_threshold_elevation_source = get_field(
-                        line, 647, 16
-                    )
-                    base_end.displaced_threshold_elevation_date = get_field(
-                        line, 663, 10, "date"
-                    )
-                    base_end.touchdown_zone_elevation_source = get_field(line, 673, 16)
-                    base_end.touchdown_zone_elevation_date = get_field(
-                        line, 689, 10, "date"
-                    )
-                    base_end.takeoff_run_available = get_field(line, 699, 5, "int")
-                    base_end.takeoff_distance_available = get_field(line, 704, 5, "int")
-                    base_end.accelerate_stop_distance_available = get_field(
-                        line, 709, 5, "int"
-                    )
-                    base_end.landing_distance_available = get_field(line, 714, 5, "int")
-                    base_end.lahso_distance_available = get_field(line, 719, 5, "int")
-                    base_end.id_of_lahso_intersecting_runway = get_field(line, 724, 7)
-                    base_end.description_of_lahso_entity = get_field(line, 731, 40)
-                    base_end.lahso_latitude_dms = get_field(line, 771, 15)
-                    base_end.lahso_latitude_secs = get_field(line, 786, 12)
-                    base_end.lahso_longitude_dms = get_field(line, 798, 15)
-                    base_end.lahso_longitude_secs = get_field(line, 813, 12)
-                    base_end.lahso_coords_source = get_field(line, 825, 16)
-                    base_end.lahso_coords_date = get_field(line, 841, 10, "date")
-                # RECIPROCAL END INFORMATION
-                recip_end = None
-                recip_end_id = get_field(line, 288, 3)
-                if recip_end_id:
-                    recip_end = RunwayEnd()
-                    recip_end.facility_site_number = runway.facility_site_number
-                    recip_end.runway_name = runway.name
-                    recip_end.id = recip_end_id
-                    recip_end.true_alignment = get_field(line, 291, 3, "int")
-                    recip_end.approach_type = get_field(line, 294, 10)
-                    recip_end.right_traffic = get_field(line, 304, 1, "bool")
-                    recip_end.markings_type = get_field(line, 305, 5)
-                    recip_end.markings_condition = get_field(line, 310, 1)
-                    # RECIPROCAL END GEOGRAPHIC DATA
-                    recip_end.latitude_dms = get_field(line, 311, 15)
-                    recip_end.latitude_secs = get_field(line, 326, 12)
-                    recip_end.longitude_dms = get_field(line, 338, 15)
-                    recip_end.longitude_secs = get_field(line, 353, 12)
-                    recip_end.elevation = get_field(line, 365, 7, "float")
-                    recip_end.threshold_crossing_height = get_field(line, 372, 3, "int")
-                    recip_end.visual_glide_path_angle = get_field(line, 375, 4, "float")
-                    recip_end.displaced_threshold_latitude_dms = get_field(
-                        line, 379, 15
-                    )
-                    recip_end.displaced_threshold_latitude_secs = get_field(
-                        line, 394, 12
-                    )
-                    recip_end.displaced_threshold_longitude_dms = get_field(
-                        line, 406, 15
-                    )
-                    recip_end.displaced_threshold_longitude_secs = get_field(
-                        line, 421, 12
-                    )
-                    recip_end.displaced_threshold_elevation = get_field(
-                        line, 433, 7, "float"
-                    )
-                    recip_end.displaced_threshold_length = get_field(
-                        line, 440, 4, "int"
-                    )
-                    recip_end.touchdown_zone_elevation = get_field(
-                        line, 444, 7, "float"
-                    )
-                    # RECIPROCAL END LIGHTING DATA
-                    recip_end.visual_glide_slope_indicators = get_field(line, 451, 5)
-                    recip_end.rvr_equipment = get_field(line, 456, 3)
-                    recip_end.rvv_equipment = get_field(line, 459, 1, "bool")
-                    recip_end.approach_light_system = get_field(line, 460, 8)
-                    recip_end.reil_availability = get_field(line, 468, 1, "bool")
-                    recip_end.centerline_light_availability = get_field(
-                        line, 469, 1, "bool"
-                    )
-                    recip_end.touchdown_lights_availability = get_field(
-                        line, 470, 1, "bool"
-                    )
-                    # RECIPROCAL END OBJECT DATA
-                    recip_end.controlling_object_description = get_field(line, 471, 11)
-                    recip_end.controlling_object_marking = get_field(line, 482, 4)
-                    recip_end.part77_category = get_field(line, 486, 5)
-                    recip_end.controlling_object_clearance_slope = get_field(
-                        line, 491, 2, "int"
-                    )
-                    recip_end.controlling_object_height_above_runway = get_field(
-                        line, 493, 5, "int"
-                    )
-                    recip_end.controlling_object_distance_from_runway = get_field(
-                        line, 498, 5, "int"
-                    )
-                    recip_end.controlling_object_centerline_offset = get_field(
-                        line, 503, 7
-                    )
-                    # ADDITIONAL RECIPROCAL END DATA
-                    recip_end.gradient = get_field(line, 851, 5)
-                    recip_end.gradient_direction = get_field(line, 856, 4)
-                    recip_end.position_source = get_field(line, 860, 16)
-                    recip_end.position_date = get_field(line, 876, 10, "date")
-                    recip_end.elevation_source = get_field(line, 886, 16)
-                    recip_end.elevation_date = get_field(line, 902, 10, "date")
-                    recip_end.displaced_threshold_position_source = get_field(
-                        line, 912, 16
-                    )
-                    recip_end.displaced_threshold_position_date = get_field(
-                        line, 928, 10, "date"
-                    )
-                    recip_end.displaced_threshold_elevation_source = get_field(
-                        line, 938, 16
-                    )
-                    recip_end.displaced_threshold_elevation_date = get_field(
-                        line, 954, 10, "date"
-                    )
-                    recip_end.touchdown_zone_elevation_source = get_field(line, 964, 16)
-                    recip_end.touchdown_zone_elevation_date = get_field(
-                        line, 980, 10, "date"
-                    )
-                    recip_end.takeoff_run_available = get_field(line, 990, 5, "int")
-                    recip_end.takeoff_distance_available = get_field(
-                        line, 995, 5, "int"
-                    )
-                    recip_end.accelerate_stop_distance_available = get_field(
-                        line, 1000, 5, "int"
-                    )
-                    recip_end.landing_distance_available = get_field(
-                        line, 1005, 5, "int"
+    def __init__(self, loader: MergeLoader | BulkLoader) -> None:
+        self.loader = loader
+        self.site: str | None = None
+        self.airport: Airport | None = None
+        self.runways: dict[str, Runway] = {}
+        self.runway_ends: dict[str, list[RunwayEnd]] = {}
+        self.records: list[_AptRecord] = []
+
+    def add(self, obj: _AptRecord) -> None:
+        """Buffer a record for the current facility (or start a new one)."""
+        if isinstance(obj, Airport):
+            self.flush()
+            self.site = obj.facility_site_number
+            self.airport = obj
+        elif obj.facility_site_number != self.site:
+            self.loader.add(obj)
+            return
+
+        self.records.append(obj)
+        if isinstance(obj, Runway):
+            self.runways[obj.name] = obj
+        elif isinstance(obj, RunwayEnd):
+            self.runway_ends.setdefault(obj.id, []).append(obj)
+
+    def flush(self) -> None:
+        """Hand the buffered facility to the loader."""
+        for obj in self.records:
+            self.loader.add(obj)
+        self.site = None
+        self.airport = None
+        self.runways = {}
+        self.runway_ends = {}
+        self.records = []
+
+    def set_airport_attr(
+        self, facility_site_number: str, attr: str, value: object
+    ) -> bool:
+        """Set an attribute on the facility's Airport; return False if missing."""
+        if facility_site_number != self.site:
+            return self._set_elsewhere(
+                Airport, {"facility_site_number": facility_site_number}, attr, value
+            )
+        setattr(self.airport, attr, value)
+        return True
+
+    def set_runway_attr(
+        self, facility_site_number: str, runway: str, attr: str, value: object
+    ) -> bool:
+        """Set an attribute on one of the facility's Runways; False if missing."""
+        if facility_site_number != self.site:
+            return self._set_elsewhere(
+                Runway,
+                {"facility_site_number": facility_site_number, "name": runway},
+                attr,
+                value,
+            )
+        runway_obj = self.runways.get(runway)
+        if runway_obj is None:
+            return False
+        setattr(runway_obj, attr, value)
+        return True
+
+    def set_rw_end_attr(
+        self, facility_site_number: str, rw_end: str, attr: str, value: object
+    ) -> bool:
+        """Set an attribute on one of the facility's RunwayEnds; False if missing."""
+        if facility_site_number != self.site:
+            return self._set_elsewhere(
+                RunwayEnd,
+                {"facility_site_number": facility_site_number, "id": rw_end},
+                attr,
+                value,
+            )
+        # Like the query this replaces, an end id shared by two runways is
+        # ambiguous and is treated as not found.
+        matches = self.runway_ends.get(rw_end, [])
+        if len(matches) != 1:
+            return False
+        setattr(matches[0], attr, value)
+        return True
+
+    def _set_elsewhere(
+        self,
+        model: type[Airport | Runway | RunwayEnd],
+        criteria: dict[str, object],
+        attr: str,
+        value: object,
+    ) -> bool:
+        try:
+            self.loader.set_attr(model, criteria, attr, value)
+        except LookupError:
+            return False
+        return True
+
+    def apply_remark(
+        self, facility_site_number: str, remark_element_name: str, remark_text: object
+    ) -> bool:
+        """
+        Store a RMK record's text on the attribute it annotates.
+
+        Returns False when the element name has no dedicated attribute (the
+        A110-* general remarks) or its runway/runway end can't be found.
+        """
+        attr = _AIRPORT_REMARKS.get(remark_element_name)
+        if attr is not None:
+            return self.set_airport_attr(facility_site_number, attr, remark_text)
+
+        prefix, _, target = remark_element_name.partition("-")
+        rule = _RUNWAY_REMARK_PREFIXES.get(prefix)
+        if rule is None or not target or "-" in target:
+            return False
+        model, attr = rule
+        if model is Runway:
+            return self.set_runway_attr(facility_site_number, target, attr, remark_text)
+        return self.set_rw_end_attr(facility_site_number, target, attr, remark_text)
+
+
+def _parse_lines(lines: Iterable[str], loader: MergeLoader | BulkLoader) -> None:
+    """Decode APT.txt ``lines`` and hand the records to ``loader``."""
+    facilities = _FacilityBuffer(loader)
+    for line in lines:
+        logger.debug("line: %s", line)
+        record_type = line[:3]
+
+        if record_type == "APT":
+            facilities.add(Airport(**_APT.decode(line)))
+
+        elif record_type == "RWY":
+            runway = Runway(**_RWY.decode(line))
+            facilities.add(runway)
+            for end_layout in (_RWY_BASE_END, _RWY_RECIP_END):
+                end = end_layout.decode(line)
+                if end["id"]:
+                    facilities.add(
+                        RunwayEnd(
+                            facility_site_number=runway.facility_site_number,
+                            runway_name=runway.name,
+                            **end,
+                        )
                     )
-                    recip_end.lahso_distance_available = get_field(line, 1010, 5, "int")
-                    recip_end.id_of_lahso_intersecting_runway = get_field(line, 1015, 7)
-                    recip_end.description_of_lahso_entity = get_field(line, 1022, 40)
-                    recip_end.lahso_latitude_dms = get_field(line, 1062, 15)
-                    recip_end.lahso_latitude_secs = get_field(line, 1077, 12)
-                    recip_end.lahso_longitude_dms = get_field(line, 1089, 15)
-                    recip_end.lahso_longitude_secs = get_field(line, 1104, 12)
-                    recip_end.lahso_coords_source = get_field(line, 1116, 16)
-                    recip_end.lahso_coords_date = get_field(line, 1132, 10, "date")
-
-                session.merge(runway)
-                if base_end:
-                    session.merge(base_end)
-                if recip_end:
-                    session.merge(recip_end)
-
-            if record_type == "ATT":
-                attsched = AttendanceSchedule()
-
-                # F A C I L I T Y   A T T E N D A N C E   S C H E D U L E   D A T A
-                attsched.facility_site_number = get_field(line, 4, 11)
-                attsched.sequence_number = get_field(line, 17, 2, "int")
-                attsched.attendance_schedule = get_field(line, 19, 108)
-
-                session.merge(attsched)
-
-            if record_type == "ARS":
-                facility_site_number = str(get_field(line, 4, 11) or "")
-                runway_end = str(get_field(line, 24, 3) or "")
-                arresting_gear = get_field(line, 27, 9)
-                set_rw_end_attr(
-                    session,
-                    facility_site_number,
+
+        elif record_type == "ATT":
+            facilities.add(AttendanceSchedule(**_ATT.decode(line)))
+
+        elif record_type == "ARS":
+            ars = _ARS.decode(line)
+            facility_site_number = str(ars["facility_site_number"] or "")
+            runway_end = str(ars["runway_end"] or "")
+            arresting_gear = ars["arresting_gear"]
+            if not facilities.set_rw_end_attr(
+                facility_site_number,
+                runway_end,
+                "arresting_gear",
+                arresting_gear,
+            ):
+                logger.warning(
+                    "No runway end %s at %s for arresting gear %s",
                     runway_end,
-                    "arresting_gear",
+                    facility_site_number,
                     arresting_gear,
                 )
 
-            if record_type == "RMK":
-                facility_site_number = str(get_field(line, 4, 11) or "")
-                remark_element_name = str(get_field(line, 17, 13) or "")
-                remark_text = get_field(line, 30, 1500)
+        elif record_type == "RMK":
+            rmk = _RMK.decode(line)
+            facility_site_number = str(rmk["facility_site_number"] or "")
+            remark_element_name = str(rmk["remark_element_name"] or "")
+            remark_text = rmk["remark"]
 
-                try:
-                    if remark_element_name == "A5":
-                        set_airport_attr(
-                            session, facility_site_number, "county_remark", remark_text
-                        )
-                    elif remark_element_name == "A1":
-                        set_airport_attr(
-                            session, facility_site_number, "city_remark", remark_text
-                        )
-                    elif remark_element_name == "A2":
-                        set_airport_attr(
-                            session, facility_site_number, "name_remark", remark_text
-                        )
-                    elif remark_element_name == "A10":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "ownership_type_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A18":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "facility_use_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A11":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "owners_name_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A12":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "owners_address_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A12A":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "owners_city_state_zip_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A13":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "owners_phone_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A14":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "managers_name_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A15":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "managers_address_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A15A":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "managers_city_state_zip_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A16":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "managers_phone_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A19":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "latitude_dms_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A20":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "longitude_dms_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A19A":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "coords_method_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A21":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "elevation_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "E147":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "pattern_alt_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A7":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "sectional_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A3":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "distance_from_city_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A22":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "land_area_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "E156A":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "responsible_artcc_id_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A86":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "tie_in_fss_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A26":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "arff_certification_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A25":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "npias_federal_agreements_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "E111":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "airspace_analysis_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "E79":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "airport_of_entry_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "E80":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "customs_landing_rights_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "E115":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "military_civil_join_use_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "E116":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "military_landing_rights_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A111":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "agency_performing_inspection_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A112":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "last_inspection_date_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A70":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "fuel_available_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A71":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "airframe_repair_service_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A72":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "power_plant_repair_service_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A73":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "bottled_oxygen_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A74":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "bulk_oxygen_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A81-APT":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "lighting_schedule_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A81-BCN":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "beacon_schedule_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A82":
-                        set_airport_attr(
-                            session, facility_site_number, "unicom_remark", remark_text
-                        )
-                    elif remark_element_name == "E100":
-                        set_airport_attr(
-                            session, facility_site_number, "ctaf_remark", remark_text
-                        )
-                    elif remark_element_name == "A84":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "segmented_circle_available_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A80":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "beacon_color_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A24":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "noncommerical_landing_fee_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A90":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "based_general_aviation_single_engine_airplanes_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A91":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "based_general_aviation_multi_engine_airplanes_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A92":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "based_general_aviation_jet_engine_airplanes_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A93":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "based_general_aviation_helicopters_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A94":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "based_gliders_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A95":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "based_military_aircraft_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A96":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "based_ultralight_aircraft_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A100":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "annual_ops_commercial_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A101":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "annual_ops_commuter_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A102":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "annual_ops_air_taxi_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A103":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "annual_ops_general_aviation_local_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A104":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "annual_ops_general_aviation_itinerant_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A105":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "annual_ops_military_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A75":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "transient_storage_facilities_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A76":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "other_services_available_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name == "A83":
-                        set_airport_attr(
-                            session,
-                            facility_site_number,
-                            "wind_indicator_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A30-"):
-                        _, rw = remark_element_name.split("-")
-                        set_runway_attr(
-                            session,
-                            facility_site_number,
-                            rw,
-                            "name_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A31-"):
-                        _, rw = remark_element_name.split("-")
-                        set_runway_attr(
-                            session,
-                            facility_site_number,
-                            rw,
-                            "length_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A32-"):
-                        _, rw = remark_element_name.split("-")
-                        set_runway_attr(
-                            session,
-                            facility_site_number,
-                            rw,
-                            "width_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A33-"):
-                        _, rw = remark_element_name.split("-")
-                        set_runway_attr(
-                            session,
-                            facility_site_number,
-                            rw,
-                            "surface_type_condition_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A34-"):
-                        _, rw = remark_element_name.split("-")
-                        set_runway_attr(
-                            session,
-                            facility_site_number,
-                            rw,
-                            "surface_treatment_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A39-"):
-                        _, rw = remark_element_name.split("-")
-                        set_runway_attr(
-                            session,
-                            facility_site_number,
-                            rw,
-                            "pavement_classification_number_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A40-"):
-                        _, rw = remark_element_name.split("-")
-                        set_runway_attr(
-                            session,
-                            facility_site_number,
-                            rw,
-                            "edge_light_intensity_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A35-"):
-                        _, rw = remark_element_name.split("-")
-                        set_runway_attr(
-                            session,
-                            facility_site_number,
-                            rw,
-                            "weight_bearing_capacity_single_wheel_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A36-"):
-                        _, rw = remark_element_name.split("-")
-                        set_runway_attr(
-                            session,
-                            facility_site_number,
-                            rw,
-                            "weight_bearing_capacity_dual_wheels_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A37-"):
-                        _, rw = remark_element_name.split("-")
-                        set_runway_attr(
-                            session,
-                            facility_site_number,
-                            rw,
-                            "weight_bearing_capacity_two_dual_wheels_tandem_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A38-"):
-                        _, rw = remark_element_name.split("-")
-                        set_runway_attr(
-                            session,
-                            facility_site_number,
-                            rw,
-                            "weight_bearing_capacity_two_dual_wheels_double_tandem_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A30A-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "id_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("E46-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "true_alignment_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A23-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "right_traffic_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A42-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "markings_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("E68-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "latitude_dms_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("E69-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "longitude_dms_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("E70-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "elevation_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A44-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "threshold_crossing_height_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A45-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "visual_glide_path_angle_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("E161-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "displaced_threshold_latitude_dms_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("E162-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "displaced_threshold_longitude_dms_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A51-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "displaced_threshold_length_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A43-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "visual_glide_slope_indicators_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A47-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "rvr_equipment_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A49-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "approach_light_system_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A48-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "reil_availability_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A46-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "centerline_light_availability_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A46A-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "touchdown_lights_availability_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A52-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "controlling_object_description_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A53-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "controlling_object_marking_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A50-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "part77_category_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A57-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "controlling_object_clearance_slope_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A54-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "controlling_object_height_above_runway_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A55-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "controlling_object_distance_from_runway_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A56-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "controlling_object_centerline_offset_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("E40-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "gradient_remark",
-                            remark_text,
-                        )
-                    elif remark_element_name.startswith("A60-"):
-                        _, rw_end = remark_element_name.split("-")
-                        set_rw_end_attr(
-                            session,
-                            facility_site_number,
-                            rw_end,
-                            "takeoff_run_available_remark",
-                            remark_text,
-                        )
-                    # elif remark_element_name == "":
-                    #    set_airport_attr(session, facility_site_number, "", remark_text)
-                    # elif remark_element_name.startswith(""):
-                    #    en, rw = tuple(remark_element_name.split("-"))
-                    #    set_runway_attr(session, facility_site_number, rw, "", remark_text)
-                    # elif remark_element_name.startswith(""):
-                    #    en, rw_end = tuple(remark_element_name.split("-"))
-                    #    set_rw_end_attr(session, facility_site_number, rw_end, "", remark_text)
-                    else:
-                        msg = f"No rule to parse remark with element name: {remark_element_name}"
-                        raise RuntimeError(msg)
-
-                except:  # noqa: E722
-                    # If we didn't handle this remark, store it in the generic table
-                    # This is probably a remark element A110-*
-                    remark = AirportRemark()
-                    remark.facility_site_number = facility_site_number
-                    remark.remark_element_name = remark_element_name
-                    remark.remark = remark_text
-                    session.merge(remark)
-
-    session.commit()
+            if not facilities.apply_remark(
+                facility_site_number, remark_element_name, remark_text
+            ):
+                # Anything without a dedicated attribute goes in the
+                # generic table. This is mostly remark elements A110-*
+                remark = AirportRemark()
+                remark.facility_site_number = facility_site_number
+                remark.remark_element_name = remark_element_name
+                remark.remark = remark_text
+                facilities.add(remark)
+
+    facilities.flush()
+
+
+def _facility_groups(
+    lines: Iterable[str],
+) -> Iterator[tuple[FacilityKey | None, list[str]]]:
+    """Group ``lines`` by facility: each APT record and the records after it."""
+    key: FacilityKey | None = None
+    group: list[str] = []
+    for line in lines:
+        if line.startswith("APT"):
+            if group:
+                yield key, group
+            key, group = (line[3:14].strip(),), []
+        group.append(line)
+    if group:
+        yield key, group
+
+
+class _CrossFacilityError(Exception):
+    """A record refers to a facility outside the range being parsed."""
+
+
+class _RecordingLoader:
+    """
+    Collect a worker's records as (model, attributes) pairs for the writer.
+
+    Only attributes that were actually set are kept, so the writer's loader
+    sees the same objects the serial parser would have built. A worker can't
+    reach facilities outside its own byte range, so ``set_attr`` gives up on
+    the range instead.
+    """
+
+    def __init__(self) -> None:
+        self.rows: list[tuple[type[_AptRecord], dict[str, object]]] = []
+
+    def add(self, obj: _AptRecord) -> None:
+        """Record ``obj``'s model and set attributes."""
+        row = {k: v for k, v in vars(obj).items() if not k.startswith("_sa_")}
+        self.rows.append((type(obj), row))
+
+    def set_attr(self, *_args: object) -> None:
+        """Abandon the range; its records need the serial parser."""
+        raise _CrossFacilityError
+
+
+def _open_range(path: Path, start: int, end: int | None = None) -> io.TextIOWrapper:
+    """Open bytes ``[start, end)`` of ``path`` (to EOF by default) as text."""
+    f = path.open("rb")
+    f.seek(start)
+    if end is not None:
+        data = f.read(end - start)
+        f.close()
+        return io.TextIOWrapper(io.BytesIO(data), errors="replace")
+    return io.TextIOWrapper(f, errors="replace")
+
+
+def _parse_range(
+    txtfile: str, start: int, end: int
+) -> list[tuple[type[_AptRecord], dict[str, object]]] | None:
+    """
+    Decode one facility-aligned byte range of APT.txt in a worker process.
+
+    Returns None if the range refers to a facility outside itself.
+    """
+    recorder = _RecordingLoader()
+    with _open_range(Path(txtfile), start, end) as lines:
+        try:
+            _parse_lines(lines, recorder)  # type: ignore[arg-type]
+        except _CrossFacilityError:
+            return None
+    return recorder.rows
+
+
+def _facility_ranges(path: Path, count: int) -> list[tuple[int, int]]:
+    """
+    Split ``path`` into up to ``count`` byte ranges that start at APT records.
+
+    Every facility's records follow its APT record contiguously, so no
+    facility is split across two ranges.
+    """
+    size = path.stat().st_size
+    bounds = [0]
+    with path.open("rb") as f:
+        for i in range(1, count):
+            f.seek(max(size * i // count, bounds[-1]))
+            f.readline()
+            pos = f.tell()
+            line = f.readline()
+            while line and not line.startswith(b"APT"):
+                pos = f.tell()
+                line = f.readline()
+            if line and pos > bounds[-1]:
+                bounds.append(pos)
+    bounds.append(size)
+    return list(itertools.pairwise(bounds))
+
+
+def _parse_parallel(path: Path, loader: MergeLoader | BulkLoader, workers: int) -> None:
+    """
+    Decode APT.txt in ``workers`` processes and load the rows here, in order.
+
+    Ranges are loaded in file order, so the result is the same as a serial
+    parse. If a range has a record for a facility outside itself (never the
+    case in FAA-published files) the rest of the file is parsed serially.
+    """
+    size = path.stat().st_size or 1
+    bounds = _facility_ranges(path, workers * _RANGES_PER_WORKER)
+    logger.info("Parsing %s in %s ranges with %s workers", path, len(bounds), workers)
+    ranges = iter(bounds)
+    # Never fork: the importer runs APT and NAV on threads and the engine's
+    # pool may hold connections, and a forked child would inherit both.
+    # Workers start from a clean interpreter and only decode.
+    method = (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context(method)
+    ) as pool:
+
+        def submit(start: int, end: int) -> tuple[int, int, Future]:
+            return start, end, pool.submit(_parse_range, str(path), start, end)
+
+        # Keep a bounded number of ranges in flight so parsed rows don't
+        # pile up in memory faster than this process can load them.
+        in_flight = deque(
+            itertools.starmap(submit, itertools.islice(ranges, workers * 2))
+        )
+        while in_flight:
+            start, end, future = in_flight.popleft()
+            rows = future.result()
+            if rows is None:
+                for _, _, queued in in_flight:
+                    queued.cancel()
+                logger.info("Records out of facility order; parsing the rest serially")
+                with _open_range(path, start) as lines:
+                    _parse_lines(lines, loader)
+                return
+            in_flight.extend(itertools.starmap(submit, itertools.islice(ranges, 1)))
+            for model, row in rows:
+                loader.add_row(model, row)
+            logger.info("%s: %.0f%% loaded", path.name, 100 * end / size)
+
+
+def parse(
+    txtfile: NasrSource,
+    *,
+    bulk: bool = False,
+    chunk_size: int | None = None,
+    workers: int = 1,
+    incremental: bool = False,
+    swap: bool = False,
+    defer_indexes: bool = False,
+) -> int:
+    """
+    Parse the given APT TXT file, write records into the DB, return the count.
+
+    ``txtfile`` may be a path, a ``zipfile.Path`` or an open text stream
+    (see ``open_zip_member``). With ``bulk`` set, rows are batched
+    ``chunk_size`` at a time and written with executemany upserts instead of
+    one ``session.merge`` per record. With ``workers`` above one, a plain
+    file is split at facility boundaries and decoded in that many processes
+    while this process writes the rows.
+
+    With ``incremental`` set, only facilities whose records changed since
+    the last incremental import are written and facilities no longer in the
+    file are deleted (see ``aeroinfo.parsers.fingerprints``). With ``swap``
+    set, the records are loaded into shadow copies of the airport tables,
+    which replace the live ones once loaded and indexed (see
+    ``aeroinfo.parsers.shadow``). With ``defer_indexes`` set, the live
+    airport tables' secondary indexes and foreign keys are dropped for the load
+    and rebuilt once at the end (see ``aeroinfo.parsers.schema``).
+    """
+    if swap and incremental:
+        msg = "Incremental imports update the live tables and can't be swapped in"
+        raise RuntimeError(msg)
+    if swap and defer_indexes:
+        logger.info("Shadow tables are indexed after the load already")
+    parallel = workers > 1 and isinstance(txtfile, str | os.PathLike)
+    if workers > 1 and not parallel:
+        logger.info("Parallel parsing needs a plain file; parsing serially")
+    if parallel and incremental:
+        logger.info("Incremental imports parse serially")
+        parallel = False
+
+    engine = resolve_engine(Engine)
+    with (
+        swapped_in(engine, Airport.__table__) if swap else nullcontext() as shadow,
+        engine.connect() as connection,
+        connection.begin(),
+        deferred_constraints(connection, Airport.__table__)
+        if defer_indexes and not swap
+        else nullcontext(),
+        get_loader(
+            connection,
+            bulk=bulk or swap,
+            chunk_size=chunk_size,
+            tables=shadow.tables if shadow else None,
+        ) as loader,
+    ):
+        if not incremental:
+            # A full import rewrites rows the stored hashes describe.
+            forget_fingerprints(connection, "APT")
+        if parallel:
+            _parse_parallel(Path(txtfile), loader, workers)  # type: ignore[arg-type]
+        elif incremental:
+            changes = FingerprintFilter(connection, "APT", ("facility_site_number",))
+            with open_records(txtfile) as lines:
+                _parse_lines(changes.filter(_facility_groups(lines)), loader)
+            changes.finish()
+        else:
+            with open_records(txtfile) as lines:
+                _parse_lines(lines, loader)
+    return loader.rows_written
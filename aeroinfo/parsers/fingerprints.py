@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+"""
+Per-facility fingerprints for incremental imports.
+
+Each 28-day NASR cycle changes only a small fraction of facilities. An
+incremental import hashes every facility's record group (an APT record with
+its ATT/RWY/ARS/RMK records, or a navaid's NAV1-NAV6 records) and compares
+the hash with the one stored by the previous incremental import. Only added
+and changed groups reach the parser; the rows of changed and removed
+facilities are deleted first, so records dropped from a facility don't
+linger. Every other import drops the stored hashes, so the next
+incremental import has nothing to compare against; it then empties the
+facility tables and loads every facility afresh.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import logging
+from typing import TYPE_CHECKING
+
+from sqlalchemy import delete, insert, select, tuple_
+
+from aeroinfo.database.base import Base
+from aeroinfo.database.models.imports import FacilityFingerprint
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from sqlalchemy import Table
+    from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+FacilityKey = tuple[str, ...]
+
+# Joins a multi-column key into FacilityFingerprint.facility_key.
+_KEY_SEP = "|"
+# Keys per DELETE ... WHERE (...) IN (...) statement.
+_DELETE_BATCH = 500
+
+
+def fingerprint(lines: Iterable[str]) -> str:
+    """Return the hex digest of a facility's record group."""
+    digest = hashlib.blake2b(digest_size=16)
+    for line in lines:
+        digest.update(line.encode())
+    return digest.hexdigest()
+
+
+def forget_fingerprints(connection: Connection, source: str) -> None:
+    """Drop the stored hashes for ``source``, e.g. after a full reload."""
+    fingerprints: Table = FacilityFingerprint.__table__
+    connection.execute(delete(fingerprints).where(fingerprints.c.source == source))
+
+
+class FacilityChanges:
+    """What an incremental import found, by facility key."""
+
+    def __init__(self, source: str) -> None:
+        """Start with no changes found in ``source``."""
+        self.source = source
+        self.added: list[FacilityKey] = []
+        self.changed: list[FacilityKey] = []
+        self.removed: list[FacilityKey] = []
+        self.unchanged = 0
+
+    def summary(self) -> str:
+        """Return a one-line summary of the changes."""
+        return (
+            f"{self.source}: {len(self.added)} added, {len(self.changed)} changed, "
+            f"{len(self.removed)} removed, {self.unchanged} unchanged"
+        )
+
+
+class FingerprintFilter:
+    """
+    Pass on only the record groups that differ from the last import.
+
+    ``key_columns`` name the columns identifying a facility; every table
+    holding all of them is treated as part of the facility when its rows
+    are deleted. The caller owns the transaction, so the stored hashes only
+    change if the whole import commits.
+    """
+
+    def __init__(
+        self, connection: Connection, source: str, key_columns: Sequence[str]
+    ) -> None:
+        """Load the hashes stored for ``source`` by the previous import."""
+        self.connection = connection
+        self.source = source
+        self.key_columns = tuple(key_columns)
+        self.changes = FacilityChanges(source)
+
+        fingerprints: Table = FacilityFingerprint.__table__
+        # Children before parents, so deletes never trip a foreign key.
+        self._tables = [
+            table
+            for table in reversed(Base.metadata.sorted_tables)
+            if table is not fingerprints
+            and all(column in table.c for column in self.key_columns)
+        ]
+        rows = connection.execute(
+            select(fingerprints.c.facility_key, fingerprints.c.digest).where(
+                fingerprints.c.source == source
+            )
+        )
+        self._stored = {tuple(key.split(_KEY_SEP)): digest for key, digest in rows}
+        if not self._stored:
+            # Rows left by a full import have no hashes to compare with, so
+            # neither their changes nor their removal could be detected.
+            logger.info(
+                "No fingerprints stored for %s; reloading every facility", source
+            )
+            self._delete_all()
+        self._seen: set[FacilityKey] = set()
+        self._digests: dict[FacilityKey, str] = {}
+
+    def filter(
+        self, groups: Iterable[tuple[FacilityKey | None, list[str]]]
+    ) -> Iterator[str]:
+        """
+        Yield the lines of every added or changed group in ``groups``.
+
+        A changed facility's existing rows are deleted just before its lines
+        are yielded. Lines with no facility (key None) are always yielded.
+        """
+        for key, lines in groups:
+            if key is None or key in self._seen:
+                # Nothing to compare against; parse it as a full import would.
+                yield from lines
+                continue
+            self._seen.add(key)
+            digest = fingerprint(lines)
+            stored = self._stored.get(key)
+            if digest == stored:
+                self.changes.unchanged += 1
+                continue
+
+            if stored is None:
+                self.changes.added.append(key)
+            else:
+                self.changes.changed.append(key)
+                self._delete_facilities([key])
+            self._digests[key] = digest
+            yield from lines
+
+    def finish(self) -> FacilityChanges:
+        """Delete removed facilities, store the new hashes and log the summary."""
+        self.changes.removed = [key for key in self._stored if key not in self._seen]
+        self._delete_facilities(self.changes.removed)
+
+        fingerprints: Table = FacilityFingerprint.__table__
+        stale = self.changes.changed + self.changes.removed
+        for batch in itertools.batched(stale, _DELETE_BATCH, strict=False):
+            self.connection.execute(
+                delete(fingerprints)
+                .where(fingerprints.c.source == self.source)
+                .where(fingerprints.c.facility_key.in_([self._join(k) for k in batch]))
+            )
+        if self._digests:
+            self.connection.execute(
+                insert(fingerprints),
+                [
+                    {
+                        "source": self.source,
+                        "facility_key": self._join(key),
+                        "digest": digest,
+                    }
+                    for key, digest in self._digests.items()
+                ],
+            )
+
+        logger.info("Incremental import of %s", self.changes.summary())
+        for label in ("added", "changed", "removed"):
+            keys = getattr(self.changes, label)
+            if keys:
+                logger.debug(
+                    "%s %s: %s", self.source, label, ", ".join(map(self._join, keys))
+                )
+        return self.changes
+
+    @staticmethod
+    def _join(key: FacilityKey) -> str:
+        return _KEY_SEP.join(key)
+
+    def _delete_all(self) -> None:
+        """Delete every row of the facility tables."""
+        for table in self._tables:
+            self.connection.execute(delete(table))
+
+    def _delete_facilities(self, keys: Sequence[FacilityKey]) -> None:
+        """Delete every row belonging to the facilities in ``keys``."""
+        for batch in itertools.batched(keys, _DELETE_BATCH, strict=False):
+            for table in self._tables:
+                columns = tuple_(*(table.c[name] for name in self.key_columns))
+                self.connection.execute(delete(table).where(columns.in_(batch)))
@@ -0,0 +1,393 @@
+#!/usr/bin/env python
+"""
+Loaders that write parsed NASR records into the database.
+
+The parsers hand every record they decode to a loader. ``MergeLoader`` keeps
+the historical behaviour of calling ``session.merge`` once per record, while
+``BulkLoader`` collects rows as plain dicts and writes them in chunks with a
+single executemany upsert per table. On PostgreSQL ``CopyLoader`` streams the
+same chunks through ``COPY`` into staging tables instead.
+"""
+
+from __future__ import annotations
+
+import csv
+import datetime
+import io
+import logging
+from typing import TYPE_CHECKING, Protocol
+
+from sqlalchemy import BigInteger, Column, Date, MetaData, Table, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import MultipleResultsFound, NoResultFound
+from sqlalchemy.orm import Session
+
+from aeroinfo.database.base import Base
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from sqlalchemy.dialects.postgresql import Insert
+    from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class _Mapped(Protocol):
+    """Anything mapped onto a table: a model class or one of its instances."""
+
+    __table__: Table
+
+
+class MergeLoader:
+    """Write each record with ``session.merge``, one round-trip at a time."""
+
+    def __init__(self, connection: Connection) -> None:
+        """Open a Session on ``connection``; the caller owns the transaction."""
+        self.session = Session(bind=connection)
+        self.rows_written = 0
+
+    def __enter__(self) -> MergeLoader:
+        """Return the loader itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Flush outstanding work unless an error is propagating, then close."""
+        if exc_type is None:
+            self.flush()
+        self.session.close()
+
+    def add(self, obj: _Mapped) -> None:
+        """Merge a mapped object into the session."""
+        self.session.merge(obj)
+        self.rows_written += 1
+
+    def add_row(self, model: type[_Mapped], row: dict[str, object]) -> None:
+        """Merge a ``model`` built from the attributes in ``row``."""
+        self.add(model(**row))
+
+    def set_attr(
+        self, model: _Mapped, criteria: dict[str, object], attr: str, value: object
+    ) -> None:
+        """
+        Set ``attr`` on the single existing row of ``model`` matching ``criteria``.
+
+        Raises LookupError when no row (or more than one row) matches.
+        """
+        try:
+            target = self.session.query(model).filter_by(**criteria).one()
+        except (NoResultFound, MultipleResultsFound) as exc:
+            msg = f"No single {model.__table__.name} row matches {criteria}"
+            raise LookupError(msg) from exc
+        setattr(target, attr, value)
+        self.session.merge(target)
+
+    def flush(self) -> None:
+        """Flush pending merges to the database."""
+        self.session.flush()
+
+
+class BulkLoader:
+    """
+    Batch records into plain dicts and write them with executemany upserts.
+
+    Rows are buffered per table, keyed by primary key so a later record with
+    the same key replaces an earlier one (as ``merge`` would). Once
+    ``chunk_size`` rows are pending every table is flushed in foreign-key
+    order with one ``INSERT ... ON CONFLICT DO UPDATE`` per table.
+
+    Unlike ``merge``, bulk rows are written whole: columns a record did not
+    set are written as NULL rather than left at their previous value.
+
+    ``tables`` maps model tables to the tables their rows should really be
+    written to, such as the shadow copies of a swap import.
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        tables: dict[Table, Table] | None = None,
+    ) -> None:
+        """Prepare a loader on ``connection``; the caller owns the transaction."""
+        dialect = connection.dialect.name
+        if dialect == "postgresql":
+            self._insert = postgresql.insert
+        elif dialect == "sqlite":
+            self._insert = sqlite.insert
+        else:
+            msg = f"Bulk loading is not supported on '{dialect}'; use the merge loader."
+            raise RuntimeError(msg)
+
+        self.connection = connection
+        self.chunk_size = max(1, chunk_size)
+        self.tables = tables or {}
+        self.rows_written = 0
+        self._pending: dict[Table, dict[tuple[object, ...], dict[str, object]]] = {}
+        self._pending_count = 0
+
+    def __enter__(self) -> BulkLoader:
+        """Return the loader itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Flush outstanding rows unless an error is propagating."""
+        if exc_type is None:
+            self.flush()
+            self._finish()
+
+    @staticmethod
+    def _pk(table: Table, row: dict[str, object]) -> tuple[object, ...]:
+        return tuple(row.get(column.key) for column in table.primary_key.columns)
+
+    def add(self, obj: _Mapped) -> None:
+        """Queue a mapped object as a plain row dict."""
+        self._queue(obj.__table__, obj.__dict__)
+
+    def add_row(self, model: type[_Mapped], row: dict[str, object]) -> None:
+        """Queue ``row`` for ``model``; missing columns are written as NULL."""
+        self._queue(model.__table__, row)
+
+    def _queue(self, table: Table, state: dict[str, object]) -> None:
+        row = {column.key: state.get(column.key) for column in table.columns}
+        pending = self._pending.setdefault(table, {})
+        key = self._pk(table, row)
+        if key not in pending:
+            self._pending_count += 1
+        pending[key] = row
+
+        if self._pending_count >= self.chunk_size:
+            self.flush()
+
+    def set_attr(
+        self, model: _Mapped, criteria: dict[str, object], attr: str, value: object
+    ) -> None:
+        """
+        Set ``attr`` on the single row of ``model`` matching ``criteria``.
+
+        Pending rows are flushed first so the UPDATE can see them. Raises
+        LookupError when no row (or more than one row) matches.
+        """
+        self.flush()
+        self._update_written(self._target(model.__table__), criteria, attr, value)
+
+    def _target(self, table: Table) -> Table:
+        """Return the table rows queued for ``table`` are written to."""
+        return self.tables.get(table, table)
+
+    def _update_written(
+        self, table: Table, criteria: dict[str, object], attr: str, value: object
+    ) -> None:
+        """Apply ``set_attr`` to a row that has already been flushed."""
+        stmt = update(table).values({attr: value})
+        for column, expected in criteria.items():
+            stmt = stmt.where(table.c[column] == expected)
+        result = self.connection.execute(stmt)
+        if result.rowcount != 1:
+            msg = f"{result.rowcount} {table.name} rows match {criteria}"
+            raise LookupError(msg)
+
+    def flush(self) -> None:
+        """Write every pending row, parents before children."""
+        if not self._pending_count:
+            return
+
+        for table in Base.metadata.sorted_tables:
+            rows = self._pending.pop(table, None)
+            if not rows:
+                continue
+            self._write(self._target(table), list(rows.values()))
+            self.rows_written += len(rows)
+
+        logger.debug("Flushed %s rows", self._pending_count)
+        self._pending_count = 0
+
+    def _finish(self) -> None:
+        """Complete the load once every row has been flushed."""
+
+    def _write(self, table: Table, rows: list[dict[str, object]]) -> None:
+        """Upsert one chunk of ``rows`` into ``table``."""
+        stmt = self._insert(table)
+        pk_names = [column.key for column in table.primary_key.columns]
+        update_cols = {
+            column.key: stmt.excluded[column.key]
+            for column in table.columns
+            if column.key not in pk_names
+        }
+        if update_cols:
+            stmt = stmt.on_conflict_do_update(index_elements=pk_names, set_=update_cols)
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=pk_names)
+        self.connection.execute(stmt, rows)
+
+
+class CopyLoader(BulkLoader):
+    """
+    Stream rows into staging tables with PostgreSQL ``COPY FROM STDIN``.
+
+    Each chunk is encoded as CSV and copied into a temporary staging table
+    (``<table>__staging``) that is dropped at commit. When the load finishes
+    one ``INSERT ... SELECT DISTINCT ON ... ON CONFLICT DO UPDATE`` per table
+    moves the latest staged row for every primary key into the real table.
+    """
+
+    SEQ_COLUMN = "_aeroinfo_seq"
+
+    def __init__(
+        self,
+        connection: Connection,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        tables: dict[Table, Table] | None = None,
+    ) -> None:
+        """Prepare a COPY loader on a psycopg2 ``connection``."""
+        super().__init__(connection, chunk_size, tables)
+        self._staging: dict[Table, Table] = {}
+        self._quote = connection.dialect.identifier_preparer.quote
+
+    def _staging_table(self, table: Table) -> Table:
+        staging = self._staging.get(table)
+        if staging is not None:
+            return staging
+
+        name = f"{table.name}__staging"
+        self.connection.exec_driver_sql(
+            f"CREATE TEMPORARY TABLE {self._quote(name)} "
+            f"(LIKE {self._quote(table.name)} INCLUDING DEFAULTS) ON COMMIT DROP"
+        )
+        # The sequence column records arrival order so the upsert can keep
+        # the last staged row for each key, the way merge would.
+        self.connection.exec_driver_sql(
+            f"ALTER TABLE {self._quote(name)} "
+            f"ADD COLUMN {self._quote(self.SEQ_COLUMN)} BIGSERIAL"
+        )
+        staging = Table(
+            name,
+            MetaData(),
+            *(Column(column.key, column.type) for column in table.columns),
+            Column(self.SEQ_COLUMN, BigInteger),
+        )
+        self._staging[table] = staging
+        return staging
+
+    def _encode(self, table: Table, rows: list[dict[str, object]]) -> io.StringIO:
+        """Encode ``rows`` as CSV in the representation PostgreSQL expects."""
+        dialect = self.connection.dialect
+        converters = []
+        for column in table.columns:
+            processor = column.type.bind_processor(dialect)
+            is_date = isinstance(column.type, Date)
+            converters.append((column.key, processor, is_date))
+
+        buf = io.StringIO()
+        # QUOTE_NOTNULL leaves None unquoted, which COPY reads back as NULL.
+        writer = csv.writer(buf, quoting=csv.QUOTE_NOTNULL)
+        for row in rows:
+            record: list[object] = []
+            for key, processor, is_date in converters:
+                value = row.get(key)
+                if value is not None:
+                    if processor is not None:
+                        value = processor(value)
+                    if is_date and isinstance(value, datetime.datetime):
+                        value = value.date()
+                    if isinstance(value, datetime.date):
+                        value = value.isoformat()
+                record.append(value)
+            writer.writerow(record)
+        buf.seek(0)
+        return buf
+
+    def _write(self, table: Table, rows: list[dict[str, object]]) -> None:
+        """COPY one chunk of ``rows`` into the staging table for ``table``."""
+        staging = self._staging_table(table)
+        columns = ", ".join(self._quote(column.key) for column in table.columns)
+        sql = (
+            f"COPY {self._quote(staging.name)} ({columns}) FROM STDIN WITH (FORMAT csv)"
+        )
+        cursor = self.connection.connection.driver_connection.cursor()
+        try:
+            cursor.copy_expert(sql, self._encode(table, rows))
+        finally:
+            cursor.close()
+
+    def _update_written(
+        self, table: Table, criteria: dict[str, object], attr: str, value: object
+    ) -> None:
+        """Apply ``set_attr`` to rows already copied into staging."""
+        staging = self._staging_table(table)
+        stmt = update(staging).values({attr: value})
+        for column, expected in criteria.items():
+            stmt = stmt.where(staging.c[column] == expected)
+        result = self.connection.execute(stmt)
+        if result.rowcount == 0:
+            msg = f"No staged {table.name} rows match {criteria}"
+            raise LookupError(msg)
+
+    def _finish(self) -> None:
+        """Upsert each staging table into its real table, parents first."""
+        for table in Base.metadata.sorted_tables:
+            target = self._target(table)
+            staging = self._staging.get(target)
+            if staging is None:
+                continue
+            self.connection.execute(self.upsert_from_staging(target, staging))
+
+    @classmethod
+    def upsert_from_staging(cls, table: Table, staging: Table) -> Insert:
+        """Build the statement moving the latest staged row per key into ``table``."""
+        keys = [column.key for column in table.columns]
+        pk_names = [column.key for column in table.primary_key.columns]
+        pk_cols = [staging.c[name] for name in pk_names]
+        latest = select(*(staging.c[key] for key in keys)).order_by(
+            *pk_cols, staging.c[cls.SEQ_COLUMN].desc()
+        )
+        # SQLAlchemy 2.1 deprecates Select.distinct(*columns) for DISTINCT ON
+        # in favour of the dialect's distinct_on() extension; 2.0 lacks it.
+        distinct_on = getattr(postgresql, "distinct_on", None)
+        if distinct_on is None:
+            latest = latest.distinct(*pk_cols)
+        else:
+            latest = latest.ext(distinct_on(*pk_cols))  # type: ignore[attr-defined,unused-ignore]
+        stmt = postgresql.insert(table).from_select(keys, latest)
+        update_cols = {key: stmt.excluded[key] for key in keys if key not in pk_names}
+        if update_cols:
+            return stmt.on_conflict_do_update(index_elements=pk_names, set_=update_cols)
+        return stmt.on_conflict_do_nothing(index_elements=pk_names)
+
+
+def get_loader(
+    connection: Connection,
+    *,
+    bulk: bool = False,
+    chunk_size: int | None = None,
+    tables: dict[Table, Table] | None = None,
+) -> MergeLoader | BulkLoader:
+    """
+    Return the loader for the requested import mode.
+
+    Bulk mode streams through ``COPY`` when the connection is PostgreSQL via
+    psycopg2 and uses batched upserts everywhere else. ``tables`` redirects
+    rows to other tables (see ``BulkLoader``) and needs bulk mode.
+    """
+    if bulk:
+        chunk_size = chunk_size or DEFAULT_CHUNK_SIZE
+        dialect = connection.dialect
+        if dialect.name == "postgresql" and dialect.driver == "psycopg2":
+            return CopyLoader(connection, chunk_size, tables)
+        return BulkLoader(connection, chunk_size, tables)
+    if tables:
+        msg = "Writing to other tables needs a bulk loader"
+        raise RuntimeError(msg)
+    return MergeLoader(connection)
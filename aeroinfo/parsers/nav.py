@@ -3,15 +3,16 @@
 """
 Parser for NASR NAV fixed-width records.
 
-This module parses NAV.TXT and merges records into the database.
+This module parses NAV.TXT and hands records to a loader that writes them
+into the database.
 """
 
+import itertools
 import logging
-from pathlib import Path
+from collections.abc import Iterable, Iterator
+from contextlib import nullcontext
 
-from sqlalchemy.orm import sessionmaker
-
-from aeroinfo.database import Engine
+from aeroinfo.database import Engine, resolve_engine
 from aeroinfo.database.models.nav import (
     AirspaceFix,
     FanMarker,
@@ -20,142 +21,224 @@ from aeroinfo.database.models.nav import (
     Remark,
     VORReceiverCheckpoint,
 )
-from aeroinfo.parsers.utils import get_field
+from aeroinfo.parsers.fingerprints import (
+    FacilityKey,
+    FingerprintFilter,
+    forget_fingerprints,
+)
+from aeroinfo.parsers.loaders import get_loader
+from aeroinfo.parsers.schema import deferred_constraints
+from aeroinfo.parsers.shadow import swapped_in
+from aeroinfo.parsers.utils import NasrSource, RecordLayout, open_records
 
 logger = logging.getLogger(__name__)
-Session = sessionmaker()
 
+_NavRecord = (
+    AirspaceFix | FanMarker | HoldingPattern | Navaid | Remark | VORReceiverCheckpoint
+)
+
+# Record layouts, positions as in references/nav_rf.txt.
+_NAV1 = RecordLayout(
+    [
+        ("facility_id", 5, 4),
+        ("facility_type", 9, 20),
+        ("official_facility_id", 29, 4),
+        ("effective_date", 33, 10, "date"),
+        ("name", 43, 30),
+        ("city", 73, 40),
+        ("state_name", 113, 30),
+        ("state_code", 143, 2),
+        ("region", 145, 3),
+        ("country", 148, 30),
+        ("country_code", 178, 2),
+        ("owners_name", 180, 50),
+        ("operators_name", 230, 50),
+        ("common_system_usage", 280, 1),
+        ("public_use", 281, 1),
+        ("navaid_class", 282, 11),
+        ("hours_of_operation", 293, 11),
+        ("high_altitude_artcc_id", 304, 4),
+        ("high_altitude_artcc_name", 308, 30),
+        ("low_altitude_artcc_id", 338, 4),
+        ("low_altitude_artcc_name", 342, 30),
+        ("latitude_dms", 372, 14),
+        ("latitude_secs", 386, 11),
+        ("longitude_dms", 397, 14),
+        ("longitude_secs", 411, 11),
+        ("coords_survey_accuracy", 422, 1, "NavaidPositionSurveyAccuracyEnum"),
+        ("tacan_only_latitude_dms", 423, 14),
+        ("tacan_only_latitude_secs", 437, 11),
+        ("tacan_only_longitude_dms", 448, 14),
+        ("tacan_only_longitude_secs", 462, 11),
+        ("elevation", 473, 7, "float"),
+        ("mag_variation", 480, 5),
+        ("mag_variation_year", 485, 4, "int"),
+        ("simultaneous_voice", 489, 3),
+        ("power_output_watts", 492, 4, "int"),
+        ("automatic_voice_id", 496, 3),
+        ("monitoring_category", 499, 1, "NavaidMonitoringCategoryEnum"),
+        ("radio_voice_call_name", 500, 30),
+        ("tacan_channel", 530, 4),
+        ("frequency", 534, 6),
+        ("transmitted_id", 540, 24),
+        ("fan_marker_type", 564, 10),
+        ("fan_marker_true_bearing", 574, 3, "int"),
+        ("vor_service_volume", 577, 2),
+        ("dme_service_volume", 579, 2),
+        ("low_altitude_facility_used_in_high_structure", 581, 3),
+        ("z_marker_available", 584, 3),
+        ("tweb_hours", 587, 9),
+        ("tweb_phone_number", 596, 20),
+        ("fss_id", 616, 4),
+        ("fss_name", 620, 30),
+        ("fss_hours_of_operation", 650, 100),
+        ("notam_accountability_code", 750, 4),
+        ("quadrant_id_and_range_leg_bearing", 754, 16),
+        ("navaid_status", 770, 30),
+        ("pitch", 800, 1),
+        ("catch", 801, 1),
+        ("sua_atcaa", 802, 1),
+        ("navaid_restriction", 803, 1),
+        ("hiwas", 804, 1),
+        ("tweb", 805, 1),
+    ]
+)
+
+_NAV2 = RecordLayout(
+    [
+        ("facility_id", 5, 4),
+        ("facility_type", 9, 20),
+        ("remark", 29, 600),
+    ]
+)
+
+_NAV3 = RecordLayout(
+    [
+        ("facility_id", 5, 4),
+        ("facility_type", 9, 20),
+        ("fix", 29, 36),
+        ("more_fixes", 65, 720),
+    ]
+)
+
+_NAV4 = RecordLayout(
+    [
+        ("facility_id", 5, 4),
+        ("facility_type", 9, 20),
+        ("holding_pattern", 29, 80),
+        ("holding_pattern_pattern", 109, 3),
+        ("more_holding_patterns", 112, 664),
+    ]
+)
+
+_NAV5 = RecordLayout(
+    [
+        ("facility_id", 5, 4),
+        ("facility_type", 9, 20),
+        ("fan_marker", 29, 30),
+        ("more_fan_markers", 59, 690),
+    ]
+)
+
+_NAV6 = RecordLayout(
+    [
+        ("facility_id", 5, 4),
+        ("facility_type", 9, 20),
+        ("air_ground", 29, 2),
+        ("bearing", 31, 3, "int"),
+        ("altitude", 34, 5, "int"),
+        ("airport_id", 39, 4),
+        ("state", 43, 2),
+        ("air_narrative", 45, 75),
+        ("ground_narrative", 120, 75),
+    ]
+)
 
-def parse(txtfile: str) -> None:
-    """Parse NAV.TXT and merge records into the DB."""
-    path = Path(txtfile)
 
+# NAV record type -> (model, layout).
+_RECORDS: dict[str, tuple[type[_NavRecord], RecordLayout]] = {
+    "NAV1": (Navaid, _NAV1),
+    "NAV2": (Remark, _NAV2),
+    "NAV3": (AirspaceFix, _NAV3),
+    "NAV4": (HoldingPattern, _NAV4),
+    "NAV5": (FanMarker, _NAV5),
+    "NAV6": (VORReceiverCheckpoint, _NAV6),
+}
+
+
+def _facility_key(line: str) -> FacilityKey:
+    """Return the (facility_id, facility_type) every NAV record starts with."""
+    return line[4:8].strip(), line[8:28].strip()
+
+
+def _facility_groups(lines: Iterable[str]) -> Iterator[tuple[FacilityKey, list[str]]]:
+    """Group consecutive ``lines`` belonging to the same navaid."""
+    for key, group in itertools.groupby(lines, _facility_key):
+        yield key, list(group)
+
+
+def parse(
+    txtfile: NasrSource,
+    *,
+    bulk: bool = False,
+    chunk_size: int | None = None,
+    incremental: bool = False,
+    swap: bool = False,
+    defer_indexes: bool = False,
+) -> int:
+    """
+    Parse NAV.TXT, write records into the DB and return how many were written.
+
+    ``txtfile`` may be a path, a ``zipfile.Path`` or an open text stream.
+    With ``bulk`` set, rows are batched ``chunk_size`` at a time and written
+    with executemany upserts instead of one ``session.merge`` per record.
+    With ``incremental`` set, only navaids whose records changed since the
+    last incremental import are written and navaids no longer in the file
+    are deleted (see ``aeroinfo.parsers.fingerprints``). With ``swap`` set,
+    the records are loaded into shadow copies of the navaid tables, which
+    replace the live ones once loaded and indexed (see
+    ``aeroinfo.parsers.shadow``). With ``defer_indexes`` set, the live
+    navaid tables' secondary indexes and foreign keys are dropped for the load
+    and rebuilt once at the end (see ``aeroinfo.parsers.schema``).
+    """
+    if swap and incremental:
+        msg = "Incremental imports update the live tables and can't be swapped in"
+        raise RuntimeError(msg)
+    if swap and defer_indexes:
+        logger.info("Shadow tables are indexed after the load already")
+    engine = resolve_engine(Engine)
     with (
-        path.open(errors="replace") as f,
-        Engine.connect() as connection,
+        open_records(txtfile) as records,
+        swapped_in(engine, Navaid.__table__) if swap else nullcontext() as shadow,
+        engine.connect() as connection,
         connection.begin(),
-        Session(bind=connection) as session,
+        deferred_constraints(connection, Navaid.__table__)
+        if defer_indexes and not swap
+        else nullcontext(),
+        get_loader(
+            connection,
+            bulk=bulk or swap,
+            chunk_size=chunk_size,
+            tables=shadow.tables if shadow else None,
+        ) as loader,
     ):
-        for line in f:
+        if not incremental:
+            # A full import rewrites rows the stored hashes describe.
+            forget_fingerprints(connection, "NAV")
+        changes = None
+        lines: Iterable[str] = records
+        if incremental:
+            changes = FingerprintFilter(
+                connection, "NAV", ("facility_id", "facility_type")
+            )
+            lines = changes.filter(_facility_groups(records))
+        for line in lines:
             logger.debug("line: %s", line)
-            record_type = get_field(line, 1, 4)
-
-            if record_type == "NAV1":
-                n = Navaid()
-                n.facility_id = get_field(line, 5, 4)
-                n.facility_type = get_field(line, 9, 20)
-                n.official_facility_id = get_field(line, 29, 4)
-                n.effective_date = get_field(line, 33, 10, "date")
-                n.name = get_field(line, 43, 30)
-                n.city = get_field(line, 73, 40)
-                n.state_name = get_field(line, 113, 30)
-                n.state_code = get_field(line, 143, 2)
-                n.region = get_field(line, 145, 3)
-                n.country = get_field(line, 148, 30)
-                n.country_code = get_field(line, 178, 2)
-                n.owners_name = get_field(line, 180, 50)
-                n.operators_name = get_field(line, 230, 50)
-                n.common_system_usage = get_field(line, 280, 1)
-                n.public_use = get_field(line, 281, 1)
-                n.navaid_class = get_field(line, 282, 11)
-                n.hours_of_operation = get_field(line, 293, 11)
-                n.high_altitude_artcc_id = get_field(line, 304, 4)
-                n.high_altitude_artcc_name = get_field(line, 308, 30)
-                n.low_altitude_artcc_id = get_field(line, 338, 4)
-                n.low_altitude_artcc_name = get_field(line, 342, 30)
-                n.latitude_dms = get_field(line, 372, 14)
-                n.latitude_secs = get_field(line, 386, 11)
-                n.longitude_dms = get_field(line, 397, 14)
-                n.longitude_secs = get_field(line, 411, 11)
-                n.coords_survey_accuracy = get_field(
-                    line, 422, 1, "NavaidPositionSurveyAccuracyEnum"
-                )
-                n.tacan_only_latitude_dms = get_field(line, 423, 14)
-                n.tacan_only_latitude_secs = get_field(line, 437, 11)
-                n.tacan_only_longitude_dms = get_field(line, 448, 14)
-                n.tacan_only_longitude_secs = get_field(line, 462, 11)
-                n.elevation = get_field(line, 473, 7, "float")
-                n.mag_variation = get_field(line, 480, 5)
-                n.mag_variation_year = get_field(line, 485, 4, "int")
-                n.simultaneous_voice = get_field(line, 489, 3)
-                n.power_output_watts = get_field(line, 492, 4, "int")
-                n.automatic_voice_id = get_field(line, 496, 3)
-                n.monitoring_category = get_field(
-                    line, 499, 1, "NavaidMonitoringCategoryEnum"
-                )
-                n.radio_voice_call_name = get_field(line, 500, 30)
-                n.tacan_channel = get_field(line, 530, 4)
-                n.frequency = get_field(line, 534, 6)
-                n.transmitted_id = get_field(line, 540, 24)
-                n.fan_marker_type = get_field(line, 564, 10)
-                n.fan_marker_true_bearing = get_field(line, 574, 3, "int")
-                n.vor_service_volume = get_field(line, 577, 2)
-                n.dme_service_volume = get_field(line, 579, 2)
-                n.low_altitude_facility_used_in_high_structure = get_field(line, 581, 3)
-                n.z_marker_available = get_field(line, 584, 3)
-                n.tweb_hours = get_field(line, 587, 9)
-                n.tweb_phone_number = get_field(line, 596, 20)
-                n.fss_id = get_field(line, 616, 4)
-                n.fss_name = get_field(line, 620, 30)
-                n.fss_hours_of_operation = get_field(line, 650, 100)
-                n.notam_accountability_code = get_field(line, 750, 4)
-                n.quadrant_id_and_range_leg_bearing = get_field(line, 754, 16)
-                n.navaid_status = get_field(line, 770, 30)
-                n.pitch = get_field(line, 800, 1)
-                n.catch = get_field(line, 801, 1)
-                n.sua_atcaa = get_field(line, 802, 1)
-                n.navaid_restriction = get_field(line, 803, 1)
-                n.hiwas = get_field(line, 804, 1)
-                n.tweb = get_field(line, 805, 1)
-
-                session.merge(n)
-
-            if record_type == "NAV2":
-                r = Remark()
-                r.facility_id = get_field(line, 5, 4)
-                r.facility_type = get_field(line, 9, 20)
-                r.remark = get_field(line, 29, 600)
-
-                session.merge(r)
-
-            if record_type == "NAV3":
-                f = AirspaceFix()
-                f.facility_id = get_field(line, 5, 4)
-                f.facility_type = get_field(line, 9, 20)
-                f.fix = get_field(line, 29, 36)
-                f.more_fixes = get_field(line, 65, 720)
-
-                session.merge(f)
-
-            if record_type == "NAV4":
-                h = HoldingPattern()
-                h.facility_id = get_field(line, 5, 4)
-                h.facility_type = get_field(line, 9, 20)
-                h.holding_pattern = get_field(line, 29, 80)
-                h.holding_pattern_pattern = get_field(line, 109, 3)
-                h.more_holding_patterns = get_field(line, 112, 664)
-
-                session.merge(h)
-
-            if record_type == "NAV5":
-                f = FanMarker()
-                f.facility_id = get_field(line, 5, 4)
-                f.facility_type = get_field(line, 9, 20)
-                f.fan_marker = get_field(line, 29, 30)
-                f.more_fan_markers = get_field(line, 59, 690)
-
-                session.merge(f)
-
-            if record_type == "NAV6":
-                v = VORReceiverCheckpoint()
-                v.facility_id = get_field(line, 5, 4)
-                v.facility_type = get_field(line, 9, 20)
-                v.air_ground = get_field(line, 29, 2)
-                v.bearing = get_field(line, 31, 3, "int")
-                v.altitude = get_field(line, 34, 5, "int")
-                v.airport_id = get_field(line, 39, 4)
-                v.state = get_field(line, 43, 2)
-                v.air_narrative = get_field(line, 45, 75)
-                v.ground_narrative = get_field(line, 120, 75)
-
-                session.merge(v)
+            record = _RECORDS.get(line[:4])
+            if record is None:
+                continue
+            model, layout = record
+            loader.add(model(**layout.decode(line)))
+        if changes is not None:
+            changes.finish()
+    return loader.rows_written
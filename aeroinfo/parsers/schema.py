@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+"""
+Schema helpers for bulk loads.
+
+Finds the group of tables an import writes and, for loads that can afford
+to lock those tables, takes their secondary indexes and foreign keys out of
+the way while the rows go in so they are built once at the end instead of
+maintained row by row.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+from sqlalchemy import inspect
+from sqlalchemy.schema import CreateIndex, DropIndex
+
+from aeroinfo.database.base import Base
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy import Table
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.engine.interfaces import ReflectedForeignKeyConstraint
+
+logger = logging.getLogger(__name__)
+
+
+def related_tables(root: Table) -> list[Table]:
+    """Return ``root`` and every table referring to it, parents first."""
+    tables = [root]
+    for table in Base.metadata.sorted_tables:
+        if table is not root and any(
+            fk.referred_table in tables for fk in table.foreign_key_constraints
+        ):
+            tables.append(table)
+    return tables
+
+
+def begin_ddl(connection: Connection) -> None:
+    """
+    Make the DDL that follows part of the caller's transaction.
+
+    pysqlite only opens a transaction before DML, so on SQLite DDL issued
+    first would otherwise commit on its own and survive a rollback.
+    """
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def _add_foreign_key(
+    connection: Connection, table_name: str, fk: ReflectedForeignKeyConstraint
+) -> None:
+    quote = connection.dialect.identifier_preparer.quote
+    columns = ", ".join(map(quote, fk["constrained_columns"]))
+    referred = ", ".join(map(quote, fk["referred_columns"]))
+    sql = (
+        f"ALTER TABLE {quote(table_name)} ADD CONSTRAINT {quote(fk['name'])} "
+        f"FOREIGN KEY ({columns}) "
+        f"REFERENCES {quote(fk['referred_table'])} ({referred})"
+    )
+    options = fk.get("options", {})
+    for option, clause in (("ondelete", "ON DELETE"), ("onupdate", "ON UPDATE")):
+        if options.get(option):
+            sql += f" {clause} {options[option]}"
+    if options.get("deferrable"):
+        sql += " DEFERRABLE"
+        if options.get("initially"):
+            sql += f" INITIALLY {options['initially']}"
+    connection.exec_driver_sql(sql)
+
+
+@contextmanager
+def deferred_constraints(connection: Connection, root: Table) -> Iterator[None]:
+    """
+    Load ``root`` and its related tables without indexes and FK checks.
+
+    Runs in the caller's transaction. The tables' secondary indexes are
+    dropped for the duration of the block and built once when it succeeds.
+    On PostgreSQL the foreign keys, which aren't DEFERRABLE, are dropped
+    and re-added under their old names, validating every row in one pass;
+    SQLite defers its foreign key checks (if enabled) to the commit. If the
+    block fails, the rollback restores everything.
+    """
+    tables = related_tables(root)
+    dialect = connection.dialect.name
+    quote = connection.dialect.identifier_preparer.quote
+    begin_ddl(connection)
+
+    inspector = inspect(connection)
+    existing = {ix["name"] for t in tables for ix in inspector.get_indexes(t.name)}
+    indexes = [
+        index
+        for table in tables
+        for index in sorted(table.indexes, key=lambda ix: ix.name)
+        if index.name in existing
+    ]
+    foreign_keys: list[tuple[str, ReflectedForeignKeyConstraint]] = []
+    if dialect == "postgresql":
+        foreign_keys = [
+            (table.name, fk)
+            for table in tables
+            for fk in inspector.get_foreign_keys(table.name)
+            if fk.get("name")
+        ]
+    elif dialect == "sqlite":
+        connection.exec_driver_sql("PRAGMA defer_foreign_keys = ON")
+
+    for table_name, fk in foreign_keys:
+        connection.exec_driver_sql(
+            f"ALTER TABLE {quote(table_name)} DROP CONSTRAINT {quote(fk['name'])}"
+        )
+    for index in indexes:
+        connection.execute(DropIndex(index))
+    logger.info(
+        "Deferred %s indexes and %s foreign keys on %s",
+        len(indexes),
+        len(foreign_keys),
+        root.name,
+    )
+
+    yield
+
+    start = time.perf_counter()
+    for index in indexes:
+        connection.execute(CreateIndex(index))
+    for table_name, fk in foreign_keys:
+        _add_foreign_key(connection, table_name, fk)
+    logger.info(
+        "Rebuilt %s indexes and %s foreign keys on %s in %.1fs",
+        len(indexes),
+        len(foreign_keys),
+        root.name,
+        time.perf_counter() - start,
+    )
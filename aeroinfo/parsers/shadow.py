@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+"""
+Shadow tables for imports that don't disturb the live tables.
+
+A swap import loads into empty copies of the live tables (``airports__next``
+and so on), builds their indexes once the rows are in and then swaps them
+in for the live tables within one short transaction. Readers see either the
+old data or the new, never a partial load, and are only held up for the
+moment the renames take.
+
+The copies are reflected from the live tables rather than built from the
+models, so they keep whatever schema Alembic migrated the database to, and
+the swap gives their indexes and constraints the live tables' names.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import (
+    Column,
+    DefaultClause,
+    ForeignKeyConstraint,
+    Index,
+    MetaData,
+    Table,
+    inspect,
+)
+from sqlalchemy.schema import CreateIndex, CreateTable, DropIndex, DropTable
+from sqlalchemy.sql.visitors import replacement_traverse
+
+from aeroinfo.parsers.schema import begin_ddl, related_tables
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+SHADOW_SUFFIX = "__next"
+# Live tables are renamed to this while the shadow tables take their names.
+_OLD_SUFFIX = "__old"
+
+
+class ShadowTables:
+    """Shadow copies of a group of live tables, and the swap that installs them."""
+
+    def __init__(self, tables: list[Table]) -> None:
+        """Describe a ``<name>__next`` copy of each of ``tables`` (parents first)."""
+        # Loaders write through copies of the models' tables, so values bind
+        # as they would for the live tables. create() builds the shadow
+        # tables themselves from the live tables' reflected schema.
+        self.tables = self._copy(tables, MetaData())
+        # Each live index, with the shadow table it is copied to.
+        self.indexes: list[tuple[Table, Index, str]] = []
+        self._live_indexes_dropped = False
+
+    @staticmethod
+    def _copy(tables: list[Table], metadata: MetaData) -> dict[Table, Table]:
+        """Map each of ``tables`` (parents first) to its shadow copy in ``metadata``."""
+        copies: dict[Table, Table] = {}
+        for table in tables:
+            columns = []
+            for column in table.columns:
+                default = column.server_default
+                columns.append(
+                    Column(
+                        column.name,
+                        column.type,
+                        key=column.key,
+                        primary_key=column.primary_key,
+                        nullable=column.nullable,
+                        autoincrement=column.autoincrement,
+                        server_default=(
+                            DefaultClause(default.arg)
+                            if isinstance(default, DefaultClause)
+                            else None
+                        ),
+                    )
+                )
+            foreign_keys = []
+            for fk in table.foreign_key_constraints:
+                referred = copies.get(fk.referred_table, fk.referred_table)
+                foreign_keys.append(
+                    ForeignKeyConstraint(
+                        [element.parent.name for element in fk.elements],
+                        [referred.c[element.column.key] for element in fk.elements],
+                    )
+                )
+            copies[table] = Table(
+                table.name + SHADOW_SUFFIX, metadata, *columns, *foreign_keys
+            )
+        return copies
+
+    @staticmethod
+    def _live_indexes(connection: Connection, table: Table) -> list[Index]:
+        """Return the indexes of the reflected live ``table``."""
+        if connection.dialect.name != "sqlite":
+            return sorted(table.indexes, key=lambda index: str(index.name))
+        # SQLAlchemy's SQLite reflection loses descending columns and skips
+        # expression indexes, so read them from the index itself.
+        quote = connection.dialect.identifier_preparer.quote
+        indexes = []
+        for _, name, unique, origin, partial in connection.exec_driver_sql(
+            f"PRAGMA index_list({quote(table.name)})"
+        ):
+            if origin != "c":
+                continue  # Backs the primary key or a UNIQUE constraint.
+            info = connection.exec_driver_sql(f"PRAGMA index_xinfo({quote(name)})")
+            keys = [(column, desc) for _, cid, column, desc, _, key in info if key]
+            if partial or any(column is None for column, _ in keys):
+                msg = f"Swap imports can't copy the expression or partial index {name}"
+                raise RuntimeError(msg)
+            columns = [
+                table.c[column].desc() if desc else table.c[column]
+                for column, desc in keys
+            ]
+            indexes.append(Index(name, *columns, unique=bool(unique), _table=table))
+        return sorted(indexes, key=lambda index: str(index.name))
+
+    def _index_names(self) -> list[tuple[Table, Index, str, str]]:
+        """List each live index with its shadow table, name and shadow name."""
+        return [
+            (shadow, index, name, name + SHADOW_SUFFIX)
+            for shadow, index, name in self.indexes
+        ]
+
+    @staticmethod
+    def _copy_index(index: Index, shadow: Table, name: str) -> Index:
+        """Return ``index`` rebuilt on the columns of ``shadow``."""
+        live = index.table
+
+        def replace(element: object, **_kw: Any) -> Column[Any] | None:  # noqa: ANN401
+            if isinstance(element, Column) and element.table is live:
+                return shadow.c[element.key]
+            return None
+
+        expressions = [
+            shadow.c[expression]
+            if isinstance(expression, str)
+            else replacement_traverse(expression, {}, replace)
+            for expression in index.expressions
+        ]
+        return Index(name, *expressions, unique=index.unique)
+
+    def create(self, connection: Connection) -> None:
+        """Create the empty shadow tables, replacing any left by a failed run."""
+        self.drop(connection)
+        live = MetaData()
+        live.reflect(connection, only=[table.name for table in self.tables])
+        copies = self._copy(
+            [live.tables[table.name] for table in self.tables], MetaData()
+        )
+        self.indexes = [
+            (shadow, index, str(index.name))
+            for table, shadow in copies.items()
+            for index in self._live_indexes(connection, table)
+        ]
+        for shadow in copies.values():
+            # Plain DDL, so enum types the live tables share aren't touched.
+            connection.execute(CreateTable(shadow))
+
+    def drop(self, connection: Connection) -> None:
+        """Drop the shadow tables if they exist, restoring any live indexes moved."""
+        for shadow in reversed(self.tables.values()):
+            connection.execute(DropTable(shadow, if_exists=True))
+        if self._live_indexes_dropped:
+            for _, index, _ in self.indexes:
+                connection.execute(CreateIndex(index, if_not_exists=True))
+            self._live_indexes_dropped = False
+
+    def build_indexes(self, connection: Connection) -> None:
+        """Index the loaded shadow tables and refresh their statistics."""
+        if connection.dialect.name == "sqlite":
+            # SQLite can't rename an index, so the live indexes make way for
+            # the shadow's under their names, in a transaction of their own
+            # so the swap's stays short. Live readers go without them until
+            # the swap commits.
+            begin_ddl(connection)
+            for shadow, index, name in self.indexes:
+                connection.execute(DropIndex(index))
+                connection.execute(CreateIndex(self._copy_index(index, shadow, name)))
+            self._live_indexes_dropped = True
+            return
+        for shadow, index, _, name in self._index_names():
+            connection.execute(CreateIndex(self._copy_index(index, shadow, name)))
+        quote = connection.dialect.identifier_preparer.quote
+        for shadow in self.tables.values():
+            connection.exec_driver_sql(f"ANALYZE {quote(shadow.name)}")
+
+    def swap(self, connection: Connection) -> None:
+        """Replace the live tables with the shadow tables, in the caller's transaction."""
+        dialect = connection.dialect.name
+        quote = connection.dialect.identifier_preparer.quote
+        begin_ddl(connection)
+        names = self._live_constraint_names(connection) if dialect != "sqlite" else {}
+
+        for live in self.tables:
+            old = live.name + _OLD_SUFFIX
+            connection.exec_driver_sql(
+                f"ALTER TABLE {quote(live.name)} RENAME TO {quote(old)}"
+            )
+        for live, shadow in self.tables.items():
+            connection.exec_driver_sql(
+                f"ALTER TABLE {quote(shadow.name)} RENAME TO {quote(live.name)}"
+            )
+        for live in reversed(self.tables):
+            connection.exec_driver_sql(f"DROP TABLE {quote(live.name + _OLD_SUFFIX)}")
+
+        if dialect == "sqlite":
+            # build_indexes() gave the shadow indexes their live names.
+            return
+        for _, _, name, shadow_name in self._index_names():
+            connection.exec_driver_sql(
+                f"ALTER INDEX {quote(shadow_name)} RENAME TO {quote(name)}"
+            )
+        self._rename_constraints(connection, names)
+
+    def _live_constraint_names(
+        self, connection: Connection
+    ) -> dict[str, dict[tuple[str, ...], str]]:
+        """Map each live table's constraint columns to the constraint's name."""
+        return {
+            live.name: self._constraint_names(connection, live.name)
+            for live in self.tables
+        }
+
+    @staticmethod
+    def _constraint_names(
+        connection: Connection, table_name: str
+    ) -> dict[tuple[str, ...], str]:
+        # Unnamed constraints (SQLite's, or ones the database named itself
+        # but doesn't report) are left alone.
+        inspector = inspect(connection)
+        names = {}
+        pk = inspector.get_pk_constraint(table_name)
+        if name := pk.get("name"):
+            names[("p", *pk["constrained_columns"])] = name
+        for fk in inspector.get_foreign_keys(table_name):
+            if name := fk.get("name"):
+                names[("f", *fk["constrained_columns"])] = name
+        return names
+
+    def _rename_constraints(
+        self, connection: Connection, names: dict[str, dict[tuple[str, ...], str]]
+    ) -> None:
+        """Give the swapped-in tables' constraints the names the live ones had."""
+        quote = connection.dialect.identifier_preparer.quote
+        for live in self.tables:
+            current = self._constraint_names(connection, live.name)
+            for columns, name in current.items():
+                wanted = names[live.name].get(columns)
+                if wanted and wanted != name:
+                    connection.exec_driver_sql(
+                        f"ALTER TABLE {quote(live.name)} "
+                        f"RENAME CONSTRAINT {quote(name)} TO {quote(wanted)}"
+                    )
+
+
+@contextmanager
+def swapped_in(engine: Engine, root: Table) -> Iterator[ShadowTables]:
+    """
+    Yield shadow copies of ``root`` and its related tables for loading.
+
+    Once the block finishes the shadow tables are indexed and swapped in
+    for the live tables. If it (or the swap) fails they are dropped and the
+    live tables are left as they were.
+    """
+    shadow = ShadowTables(related_tables(root))
+    with engine.begin() as connection:
+        shadow.create(connection)
+    try:
+        yield shadow
+        start = time.perf_counter()
+        with engine.begin() as connection:
+            shadow.build_indexes(connection)
+        logger.info(
+            "Indexed %s shadow tables in %.1fs",
+            root.name,
+            time.perf_counter() - start,
+        )
+        start = time.perf_counter()
+        with engine.begin() as connection:
+            shadow.swap(connection)
+        logger.info(
+            "Swapped in %s in %.0fms",
+            ", ".join(table.name for table in shadow.tables),
+            1000 * (time.perf_counter() - start),
+        )
+    except BaseException:
+        with engine.begin() as connection:
+            shadow.drop(connection)
+        raise
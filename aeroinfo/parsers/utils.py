@@ -3,13 +3,109 @@
 
 from __future__ import annotations
 
+import calendar
 import datetime
+import io
 import logging
+import os
+import re
+import zipfile
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
 
 from dateutil import parser as dateparser
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
 logger = logging.getLogger(__name__)
 
+# A field in a record layout: (name, 1-based start, length[, var_type]),
+# using the positions printed in the NASR layout files under references/.
+FieldSpec = tuple[str, int, int] | tuple[str, int, int, str]
+
+
+def _to_bool(field: str) -> bool:
+    return field in ("Y", "y", "T", "t")
+
+
+# MM/DD/YYYY, or MM/YYYY as used for activation dates.
+_NASR_DATE = re.compile(r"(\d{2})/(?:(\d{2})/)?(\d{4})")
+
+
+@lru_cache(maxsize=4096)
+def _decode_date(field: str, today: datetime.date) -> datetime.datetime:
+    """
+    Decode a NASR date exactly as ``dateutil.parser.parse`` would.
+
+    The fixed NASR formats are decoded directly; anything else (or an
+    impossible date) falls back to dateutil. Like dateutil, MM/YYYY takes
+    its day from ``today``, clipped to the length of the month, so today
+    is part of the cache key.
+    """
+    match = _NASR_DATE.fullmatch(field)
+    if match is not None:
+        month, day, year = match.groups()
+        try:
+            if day is None:
+                days = calendar.monthrange(int(year), int(month))[1]
+                return datetime.datetime(int(year), int(month), min(today.day, days))
+            return datetime.datetime(int(year), int(month), int(day))
+        except ValueError:
+            pass
+    return dateparser.parse(field)
+
+
+def _to_date(field: str) -> datetime.datetime:
+    return _decode_date(field, datetime.date.today())
+
+
+def _to_mdydate(field: str) -> datetime.date:
+    return datetime.datetime.strptime(field, "%m%d%Y").date()
+
+
+def _to_inspection_method(field: str) -> str:
+    # Literals like 1 or 2 can't be members of an enum, so translate them
+    return {"1": "O", "2": "T"}.get(field, field)
+
+
+def _to_segmented_circle(field: str) -> str:
+    # Y-L is an invalid member of an enum, so translate to YL
+    return "YL" if field == "Y-L" else field
+
+
+_DIGIT_NAMES = {
+    "0": "ZERO",
+    "1": "ONE",
+    "2": "TWO",
+    "3": "THREE",
+    "4": "FOUR",
+    "5": "FIVE",
+    "6": "SIX",
+    "7": "SEVEN",
+}
+
+
+def _to_digit_name(field: str) -> str:
+    return _DIGIT_NAMES.get(field, field)
+
+
+# var_type -> converter applied to the stripped, non-empty field text.
+# Plain strings ("str") have no converter.
+_CONVERTERS: dict[str, Callable[[str], object]] = {
+    "int": int,
+    "float": float,
+    "bool": _to_bool,
+    "date": _to_date,
+    "mdydate": _to_mdydate,
+    "AirportInspectionMethodEnum": _to_inspection_method,
+    "SegmentedCircleEnum": _to_segmented_circle,
+    "NavaidPositionSurveyAccuracyEnum": _to_digit_name,
+    "NavaidMonitoringCategoryEnum": _to_digit_name,
+}
+
 
 def get_field(record: str, start: int, length: int, var_type: str = "str") -> object:
     """
@@ -24,41 +120,119 @@ def get_field(record: str, start: int, length: int, var_type: str = "str") -> ob
     logger.debug("start: %s, length: %s, field: %s", start, length, field)
     if field == "":
         return None
-    if var_type == "int":
-        return int(field)
-    if var_type == "float":
-        return float(field)
-    if var_type == "bool":
-        return field in ["Y", "y", "T", "t"]
-    if var_type == "date":
-        return dateparser.parse(field)
-    if var_type == "mdydate":
-        return datetime.datetime.strptime(field, "%m%d%Y").date()
-    if var_type == "AirportInspectionMethodEnum":
-        # Literals like 1 or 2 can't be members of an enum, so translate them
-        if field == "1":
-            return "O"
-        if field == "2":
-            return "T"
-        return field
-    if var_type == "SegmentedCircleEnum":
-        # Y-L is an invalid member of an enum, so translate to YL
-        if field == "Y-L":
-            return "YL"
+    convert = _CONVERTERS.get(var_type)
+    if convert is None:
         return field
-    if var_type in (
-        "NavaidPositionSurveyAccuracyEnum",
-        "NavaidMonitoringCategoryEnum",
-    ):
-        mapping = {
-            "0": "ZERO",
-            "1": "ONE",
-            "2": "TWO",
-            "3": "THREE",
-            "4": "FOUR",
-            "5": "FIVE",
-            "6": "SIX",
-            "7": "SEVEN",
+    return convert(field)
+
+
+def log_progress(
+    lines: Iterable[str], name: str, size: int | None = None, every: int = 100_000
+) -> Iterator[str]:
+    """Yield ``lines`` of ``name``, logging progress every ``every`` lines."""
+    done = 0
+    for count, line in enumerate(lines, 1):
+        done += len(line)
+        if count % every == 0:
+            if size:
+                logger.info(
+                    "%s: %s lines, about %.0f%% read", name, count, 100 * done / size
+                )
+            else:
+                logger.info("%s: %s lines read", name, count)
+        yield line
+
+
+# Anything the parsers can read records from: a path to a text file, a
+# member of a zip archive, or an already open text stream.
+NasrSource = str | os.PathLike[str] | zipfile.Path | IO[str]
+
+
+@contextmanager
+def open_records(source: NasrSource) -> Iterator[Iterator[str]]:
+    """Open a NASR text ``source`` and yield its lines, logging progress."""
+    if isinstance(source, str | os.PathLike):
+        path = Path(source)
+        with path.open(errors="replace") as f:
+            yield log_progress(f, path.name, path.stat().st_size)
+    elif isinstance(source, zipfile.Path):
+        size = source.root.getinfo(source.at).file_size
+        with source.open(errors="replace") as f:
+            yield log_progress(f, source.name, size)
+    else:
+        yield log_progress(source, getattr(source, "name", "input"))
+
+
+def _find_member(archive: zipfile.ZipFile, name: str) -> zipfile.ZipInfo | None:
+    for info in archive.infolist():
+        if Path(info.filename).name.lower() == name.lower():
+            return info
+    return None
+
+
+@contextmanager
+def open_zip_member(archive: str | os.PathLike[str], name: str) -> Iterator[IO[str]]:
+    """
+    Open the file called ``name`` inside a NASR zip as a text stream.
+
+    The file is decompressed as it is read, so nothing is extracted to disk.
+    If the top-level archive doesn't hold it, zips nested inside it are
+    searched too. Raises FileNotFoundError if ``name`` isn't found.
+    """
+    with ExitStack() as stack:
+        pending = [stack.enter_context(zipfile.ZipFile(archive))]
+        while pending:
+            zf = pending.pop(0)
+            info = _find_member(zf, name)
+            if info is not None:
+                logger.info("Reading %s from %s", info.filename, zf.filename or archive)
+                binary = stack.enter_context(zf.open(info))
+                yield stack.enter_context(io.TextIOWrapper(binary, errors="replace"))
+                return
+            for inner in zf.infolist():
+                if inner.filename.lower().endswith(".zip"):
+                    nested = zipfile.ZipFile(stack.enter_context(zf.open(inner)))
+                    pending.append(stack.enter_context(nested))
+        msg = f"No {name} in {archive}"
+        raise FileNotFoundError(msg)
+
+
+class RecordLayout:
+    """
+    A fixed-width record layout compiled for repeated decoding.
+
+    Takes the field specs for one record type and precomputes a slice and
+    converter per field, so ``decode`` turns a whole record into a dict in
+    one pass instead of one ``get_field`` call per field. Decoded values are
+    the same as ``get_field`` would return for each spec.
+    """
+
+    def __init__(self, fields: Iterable[FieldSpec]) -> None:
+        """Compile ``fields``; raises ValueError for an unknown var_type."""
+        self.fields: tuple[FieldSpec, ...] = tuple(fields)
+        self.names: list[str] = []
+        self._spans: list[tuple[str, slice]] = []
+        self._typed: list[tuple[str, Callable[[str], object]]] = []
+        for name, start, length, *rest in self.fields:
+            var_type = rest[0] if rest else "str"
+            if var_type != "str" and var_type not in _CONVERTERS:
+                msg = f"Unknown var_type '{var_type}' for field '{name}'"
+                raise ValueError(msg)
+            if name in self.names:
+                msg = f"Field '{name}' appears twice in the layout"
+                raise ValueError(msg)
+            self.names.append(name)
+            self._spans.append((name, slice(start - 1, start + length - 1)))
+            if var_type != "str":
+                self._typed.append((name, _CONVERTERS[var_type]))
+
+    def decode(self, record: str) -> dict[str, object]:
+        """Decode ``record`` into a dict of field name -> value (None if empty)."""
+        row: dict[str, object] = {
+            name: record[span].strip() or None for name, span in self._spans
         }
-        return mapping.get(field, field)
-    return field
+        for name, convert in self._typed:
+            value = row[name]
+            if value is not None:
+                row[name] = convert(value)  # type: ignore[arg-type]
+        return row
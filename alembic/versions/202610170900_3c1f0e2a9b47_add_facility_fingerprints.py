@@ -0,0 +1,34 @@
+"""
+Add facility fingerprints for incremental imports.
+
+Revision ID: 3c1f0e2a9b47
+Revises: d597f9fdae33
+Create Date: 2026-10-17 09:00:00.000000+00:00
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3c1f0e2a9b47"
+down_revision = "d597f9fdae33"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the table holding each facility's record-group hash."""
+    op.create_table(
+        "facility_fingerprints",
+        sa.Column("source", sa.String(length=8), nullable=False),
+        sa.Column("facility_key", sa.String(length=40), nullable=False),
+        sa.Column("digest", sa.String(length=32), nullable=False),
+        sa.PrimaryKeyConstraint("source", "facility_key"),
+    )
+
+
+def downgrade() -> None:
+    """Drop the facility fingerprint table."""
+    op.drop_table("facility_fingerprints")
@@ -0,0 +1,45 @@
+"""
+Index runway ends by end ID.
+
+Revision ID: 7b2e4d91c5a8
+Revises: 3c1f0e2a9b47
+Create Date: 2026-10-17 12:00:00.000000+00:00
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7b2e4d91c5a8"
+down_revision = "3c1f0e2a9b47"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create the index resolving a runway end ID to its runway."""
+    # Use CONCURRENTLY on Postgres to avoid blocking writes.
+    bind = op.get_bind()
+    if bind.engine.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_runway_ends_facility_id_name ON runway_ends (facility_site_number, id, runway_name)"
+            )
+    else:
+        op.create_index(
+            "ix_runway_ends_facility_id_name",
+            "runway_ends",
+            ["facility_site_number", "id", "runway_name"],
+        )
+
+
+def downgrade() -> None:
+    """Drop the index created in :func:`upgrade`."""
+    bind = op.get_bind()
+    if bind.engine.name == "postgresql":
+        with op.get_context().autocommit_block():
+            op.execute(
+                "DROP INDEX CONCURRENTLY IF EXISTS ix_runway_ends_facility_id_name"
+            )
+    else:
+        op.drop_index("ix_runway_ends_facility_id_name", table_name="runway_ends")
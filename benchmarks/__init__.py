@@ -0,0 +1 @@
+"""Benchmarks for the aeroinfo import and query paths."""
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Build synthetic NASR files for benchmarking.
+
+The repo only ships one-facility fixtures, so these helpers replicate them
+with unique site numbers and identifiers and add the ATT/ARS/RMK records a
+real APT.txt carries for each facility.
+"""
+
+from __future__ import annotations
+
+import string
+from pathlib import Path
+
+FIXTURES = Path(__file__).resolve().parents[1] / "tests" / "fixtures"
+
+_ALPHABET = string.digits + string.ascii_uppercase
+
+
+def _ident(n: int, width: int) -> str:
+    chars = []
+    for _ in range(width):
+        n, rem = divmod(n, len(_ALPHABET))
+        chars.append(_ALPHABET[rem])
+    return "".join(reversed(chars))
+
+
+def _put(line: str, start: int, length: int, value: str) -> str:
+    """Overwrite the fixed-width field at 1-based ``start`` with ``value``."""
+    s = start - 1
+    return line[:s] + value.ljust(length)[:length] + line[s + length :]
+
+
+def _record(kind: str, site: str, rest: str) -> str:
+    return kind + site.ljust(11) + "AK" + rest
+
+
+def apt_lines(facility: int, remarks: int = 12) -> list[str]:
+    """Return the APT/ATT/RWY/ARS/RMK record group for one synthetic facility."""
+    apt_line, rwy_line = (FIXTURES / "APT_min.txt").read_text().splitlines()[:2]
+    site = f"{facility:07d}.*A"
+    faa_id = "Z" + _ident(facility, 3)
+
+    apt_line = _put(apt_line, 4, 11, site)
+    apt_line = _put(apt_line, 28, 4, faa_id)
+    apt_line = _put(apt_line, 1211, 7, "K" + faa_id)
+    rwy_line = _put(rwy_line, 4, 11, site)
+
+    lines = [apt_line]
+    lines.append(_record("ATT", site, "01" + "ALL/ALL/0800-1700".ljust(108)))
+    lines.append(_record("ATT", site, "02" + "ALL/SAT-SUN/1000-1400".ljust(108)))
+    lines.append(rwy_line)
+    lines.append(_record("ARS", site, "05/23".ljust(7) + "05 " + "BAK-12".ljust(9)))
+
+    targeted = [
+        "A5",
+        "A81-APT",
+        "E147",
+        "A31-05/23",
+        "A33-05/23",
+        "A60-05",
+        "A42-23",
+        "E40-05",
+    ]
+    for n in range(remarks):
+        general = f"A110-{n - len(targeted) + 1}"
+        element = targeted[n] if n < len(targeted) else general
+        text = f"SYNTHETIC REMARK {n} FOR {faa_id}"
+        lines.append(_record("RMK", site, element.ljust(13) + text))
+    return lines
+
+
+def nav_lines(facility: int, remarks: int = 2) -> list[str]:
+    """Return the NAV1 plus NAV2 record group for one synthetic navaid."""
+    nav1 = (FIXTURES / "NAV_min.txt").read_text().splitlines()[0]
+    ident = _ident(facility, 4)
+    nav1 = _put(nav1, 5, 4, ident)
+    nav1 = _put(nav1, 29, 4, ident)
+
+    lines = [nav1]
+    lines.extend(
+        "NAV2"
+        + ident
+        + "TACAN".ljust(20)
+        + f"SYNTHETIC NAVAID REMARK {n} FOR {ident}".ljust(600)
+        for n in range(remarks)
+    )
+    return lines
+
+
+def write_apt(path: Path, facilities: int, remarks: int = 12) -> Path:
+    """Write a synthetic APT.txt with ``facilities`` record groups."""
+    with path.open("w") as f:
+        for facility in range(1, facilities + 1):
+            f.writelines(line + "\n" for line in apt_lines(facility, remarks))
+    return path
+
+
+def write_nav(path: Path, facilities: int, remarks: int = 2) -> Path:
+    """Write a synthetic NAV.txt with ``facilities`` record groups."""
+    with path.open("w") as f:
+        for facility in range(1, facilities + 1):
+            f.writelines(line + "\n" for line in nav_lines(facility, remarks))
+    return path
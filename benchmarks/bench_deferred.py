@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+"""
+Compare a bulk import with and without deferred index and FK builds.
+
+Runs ``apt.parse`` and ``nav.parse`` in bulk mode against a fresh database,
+once maintaining the indexes and foreign keys row by row and once with
+``defer_indexes`` set. Uses a throwaway SQLite file unless ``--use-env-db``
+is given, in which case the DB_* environment variables select the database
+(for example a scratch PostgreSQL instance) and its tables are recreated.
+
+    uv run python -m benchmarks.bench_deferred --facilities 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+import aeroinfo.database as db
+from aeroinfo.database.base import Base
+from aeroinfo.database.models import apt as _apt_models  # noqa: F401
+from aeroinfo.database.models import nav as _nav_models  # noqa: F401
+from benchmarks import _synthetic
+
+
+def _run(
+    label: str, engine: object, apt_path: Path, nav_path: Path, **parse_kwargs: object
+) -> None:
+    Base.metadata.drop_all(engine)  # type: ignore[arg-type]
+    Base.metadata.create_all(engine)  # type: ignore[arg-type]
+
+    db.Engine = engine  # type: ignore[assignment]
+    apt = importlib.reload(importlib.import_module("aeroinfo.parsers.apt"))
+    nav = importlib.reload(importlib.import_module("aeroinfo.parsers.nav"))
+
+    start = time.perf_counter()
+    rows = apt.parse(str(apt_path), **parse_kwargs)
+    rows += nav.parse(str(nav_path), **parse_kwargs)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:>10}: {rows:8d} rows in {elapsed:8.2f}s = {rows / elapsed:10.0f} rows/s"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--apt", type=Path, help="APT.txt to load (default: synthetic)")
+    parser.add_argument("--nav", type=Path, help="NAV.txt to load (default: synthetic)")
+    parser.add_argument("--facilities", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--use-env-db", action="store_true")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="aeroinfo-bench-"))
+    apt_path = args.apt or _synthetic.write_apt(workdir / "APT.txt", args.facilities)
+    nav_path = args.nav or _synthetic.write_nav(workdir / "NAV.txt", args.facilities)
+
+    if args.use_env_db:
+        engine = create_engine(db.get_db_url())
+    else:
+        engine = create_engine(f"sqlite:///{workdir / 'bench.db'}")
+
+    for label, defer_indexes in (("indexed", False), ("deferred", True)):
+        _run(
+            label,
+            engine,
+            apt_path,
+            nav_path,
+            bulk=True,
+            chunk_size=args.chunk_size,
+            defer_indexes=defer_indexes,
+        )
+
+
+if __name__ == "__main__":
+    main()
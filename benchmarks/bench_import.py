@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+"""
+Compare rows per second of the merge and bulk import paths.
+
+Runs ``apt.parse`` and ``nav.parse`` against a fresh database once per
+mode. Uses a throwaway SQLite file unless ``--use-env-db`` is given, in
+which case the DB_* environment variables select the database (for
+example a scratch PostgreSQL instance) and its tables are recreated.
+
+    uv run python -m benchmarks.bench_import --facilities 2000
+    uv run python -m benchmarks.bench_import --apt /path/to/APT.txt --nav /path/to/NAV.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, select
+
+import aeroinfo.database as db
+from aeroinfo.database.base import Base
+from aeroinfo.database.models import apt as _apt_models  # noqa: F401
+from aeroinfo.database.models import nav as _nav_models  # noqa: F401
+from benchmarks import _synthetic
+
+
+def _count_rows(engine: object) -> int:
+    with engine.connect() as connection:  # type: ignore[attr-defined]
+        return sum(
+            connection.execute(select(func.count()).select_from(table)).scalar_one()
+            for table in Base.metadata.sorted_tables
+        )
+
+
+def _run(
+    label: str,
+    engine: object,
+    apt_path: Path,
+    nav_path: Path,
+    **parse_kwargs: object,
+) -> None:
+    Base.metadata.drop_all(engine)  # type: ignore[arg-type]
+    Base.metadata.create_all(engine)  # type: ignore[arg-type]
+
+    db.Engine = engine  # type: ignore[assignment]
+    apt = importlib.reload(importlib.import_module("aeroinfo.parsers.apt"))
+    nav = importlib.reload(importlib.import_module("aeroinfo.parsers.nav"))
+
+    start = time.perf_counter()
+    apt.parse(str(apt_path), **parse_kwargs)
+    nav.parse(str(nav_path), **parse_kwargs)
+    elapsed = time.perf_counter() - start
+
+    rows = _count_rows(engine)
+    print(
+        f"{label:>24}: {rows:8d} rows in {elapsed:8.2f}s = {rows / elapsed:10.0f} rows/s"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--apt", type=Path, help="APT.txt to load (default: synthetic)")
+    parser.add_argument("--nav", type=Path, help="NAV.txt to load (default: synthetic)")
+    parser.add_argument("--facilities", type=int, default=2000)
+    parser.add_argument("--chunk-size", type=int, action="append")
+    parser.add_argument("--use-env-db", action="store_true")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="aeroinfo-bench-"))
+    apt_path = args.apt or _synthetic.write_apt(workdir / "APT.txt", args.facilities)
+    nav_path = args.nav or _synthetic.write_nav(workdir / "NAV.txt", args.facilities)
+
+    if args.use_env_db:
+        engine = create_engine(db.get_db_url())
+    else:
+        engine = create_engine(f"sqlite:///{workdir / 'bench.db'}")
+
+    _run("merge", engine, apt_path, nav_path)
+    for chunk_size in args.chunk_size or [1000]:
+        _run(
+            f"bulk (chunk={chunk_size})",
+            engine,
+            apt_path,
+            nav_path,
+            bulk=True,
+            chunk_size=chunk_size,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Compare a full import with an incremental one on a cycle-over-cycle diff.
+
+Builds two synthetic NASR cycles where the second changes, removes and
+adds a small share of facilities (by default 3%, 0.5% and 0.5%, roughly
+what a real 28-day cycle touches). Both databases are seeded with the first
+cycle; the second is then loaded once in full and once incrementally.
+
+    uv run python -m benchmarks.bench_incremental --facilities 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+
+import aeroinfo.database as db
+from aeroinfo.database.base import Base
+from aeroinfo.database.models import apt as _apt_models  # noqa: F401
+from aeroinfo.database.models import nav as _nav_models  # noqa: F401
+from benchmarks import _synthetic
+
+
+def _write_cycle(
+    workdir: Path, facilities: range, changed: set[int]
+) -> tuple[Path, Path]:
+    """Write APT.txt and NAV.txt, amending a remark of every ``changed`` one."""
+    workdir.mkdir(parents=True, exist_ok=True)
+    with (workdir / "APT.txt").open("w") as apt, (workdir / "NAV.txt").open("w") as nav:
+        for n in facilities:
+            apt_lines = _synthetic.apt_lines(n)
+            nav_lines = _synthetic.nav_lines(n)
+            if n in changed:
+                apt_lines[-1] += " AMENDED"
+                nav_lines[-1] = nav_lines[-1].rstrip() + " AMENDED"
+            apt.writelines(line + "\n" for line in apt_lines)
+            nav.writelines(line + "\n" for line in nav_lines)
+    return workdir / "APT.txt", workdir / "NAV.txt"
+
+
+def _load(paths: tuple[Path, Path], **parse_kwargs: object) -> tuple[int, float]:
+    apt = importlib.reload(importlib.import_module("aeroinfo.parsers.apt"))
+    nav = importlib.reload(importlib.import_module("aeroinfo.parsers.nav"))
+    start = time.perf_counter()
+    rows = apt.parse(str(paths[0]), **parse_kwargs)
+    rows += nav.parse(str(paths[1]), **parse_kwargs)
+    return rows, time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--facilities", type=int, default=5000)
+    parser.add_argument("--changed", type=float, default=0.03)
+    parser.add_argument("--removed", type=float, default=0.005)
+    parser.add_argument("--added", type=float, default=0.005)
+    parser.add_argument("--bulk", action="store_true")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="aeroinfo-bench-"))
+    count = args.facilities
+    removed = max(1, int(count * args.removed))
+    added = max(1, int(count * args.added))
+    changed = set(range(removed + 1, count + 1, max(1, int(1 / args.changed))))
+    first = _write_cycle(workdir / "cycle1", range(1, count + 1), set())
+    second = _write_cycle(
+        workdir / "cycle2", range(removed + 1, count + added + 1), changed
+    )
+    print(
+        f"{count} facilities; next cycle changes {len(changed)}, "
+        f"removes {removed} and adds {added}"
+    )
+
+    for label, incremental in (("full", False), ("incremental", True)):
+        engine = create_engine(f"sqlite:///{workdir / f'{label}.db'}")
+        Base.metadata.create_all(engine)
+        db.Engine = engine  # type: ignore[assignment]
+        _load(first, bulk=args.bulk, incremental=True)
+        rows, elapsed = _load(second, bulk=args.bulk, incremental=incremental)
+        print(f"{label:>12}: {rows:8d} rows written in {elapsed:7.2f}s")
+
+
+if __name__ == "__main__":
+    main()
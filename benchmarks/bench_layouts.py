@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+"""
+Compare lines per second of per-field ``get_field`` and compiled layouts.
+
+Decodes every APT/RWY/ATT/ARS/RMK and NAV1-6 line of the input files into
+dicts twice: once with one ``get_field`` call per field (as the parsers
+used to) and once with ``RecordLayout.decode``. No database is involved.
+
+    uv run python -m benchmarks.bench_layouts --facilities 2000
+    uv run python -m benchmarks.bench_layouts --apt /path/to/APT.txt --nav /path/to/NAV.txt
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from aeroinfo.parsers import apt, nav
+from aeroinfo.parsers.utils import get_field
+from benchmarks import _synthetic
+
+if TYPE_CHECKING:
+    from aeroinfo.parsers.utils import RecordLayout
+
+_LAYOUTS: dict[str, list[RecordLayout]] = {
+    "APT": [apt._APT],
+    "RWY": [apt._RWY, apt._RWY_BASE_END, apt._RWY_RECIP_END],
+    "ATT": [apt._ATT],
+    "ARS": [apt._ARS],
+    "RMK": [apt._RMK],
+    **{kind: [layout] for kind, (_, layout) in nav._RECORDS.items()},
+}
+
+
+def _layouts_for(line: str) -> list[RecordLayout]:
+    return _LAYOUTS.get(line[:4]) or _LAYOUTS.get(line[:3], [])
+
+
+def _with_get_field(lines: list[str]) -> None:
+    for line in lines:
+        for layout in _layouts_for(line):
+            {
+                name: get_field(line, start, length, *rest)
+                for name, start, length, *rest in layout.fields
+            }
+
+
+def _with_layouts(lines: list[str]) -> None:
+    for line in lines:
+        for layout in _layouts_for(line):
+            layout.decode(line)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--apt", type=Path, help="APT.txt to decode (default: synthetic)"
+    )
+    parser.add_argument(
+        "--nav", type=Path, help="NAV.txt to decode (default: synthetic)"
+    )
+    parser.add_argument("--facilities", type=int, default=2000)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="aeroinfo-bench-"))
+    apt_path = args.apt or _synthetic.write_apt(workdir / "APT.txt", args.facilities)
+    nav_path = args.nav or _synthetic.write_nav(workdir / "NAV.txt", args.facilities)
+
+    for path in (apt_path, nav_path):
+        with path.open(errors="replace") as f:
+            lines = f.readlines()
+        for label, decode in (
+            ("get_field", _with_get_field),
+            ("layout", _with_layouts),
+        ):
+            start = time.perf_counter()
+            decode(lines)
+            elapsed = time.perf_counter() - start
+            print(
+                f"{path.name:>8} {label:>10}: {len(lines):8d} lines in "
+                f"{elapsed:6.2f}s = {len(lines) / elapsed:10.0f} lines/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
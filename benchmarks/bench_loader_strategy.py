@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+"""
+Compare eager loading strategies for airports with many related rows.
+
+Builds ORD-sized synthetic airports (8 runways, 200 remarks and 4
+attendance schedules each) in a SQLite database and runs
+``find_airport(...).to_dict(include)`` (uncached) for each. It runs once
+with the previous options (every collection joined) and once with the
+planned options. For each, it reports the queries issued and rows
+returned per lookup, and the mean latency.
+
+    uv run python -m benchmarks.bench_loader_strategy --airports 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Load, Session, sessionmaker
+
+import aeroinfo.database as db
+from aeroinfo.database.base import Base
+from aeroinfo.database.models.apt import (
+    Airport,
+    AirportRemark,
+    AttendanceSchedule,
+    Runway,
+)
+
+RUNWAYS = ("04L/22R", "04R/22L", "09L/27R", "09C/27C", "09R/27L", "10L/28R")
+RUNWAYS += ("10C/28C", "10R/28L")
+REMARKS = 200
+SCHEDULES = 4
+
+INCLUDES = {
+    "runways": ["runways"],
+    "runways+remarks": ["runways", "remarks"],
+    "runways+remarks+attendance": ["runways", "remarks", "attendance"],
+}
+
+
+@functools.cache
+def _joined_options(
+    model: type, include_flags: frozenset[str], *, project: bool
+) -> tuple[Load, ...]:
+    """Build the options used before the planner: every collection joined."""
+    options = [db._project(Load(model), model, include_flags)] if project else []
+    for flag, (collection, target) in db._COLLECTIONS[model].items():
+        if flag in include_flags:
+            load = Load(model).joinedload(collection)
+            if project and target is not None:
+                load = db._project(load, target, frozenset())
+            options.append(load)
+    return tuple(options)
+
+
+def _populate(engine: Any, airports: int) -> list[str]:  # noqa: ANN401
+    identifiers = []
+    with Session(engine) as session:
+        for n in range(airports):
+            site = f"{n:07d}.*A"
+            faa_id = f"O{n:03d}"
+            identifiers.append(faa_id)
+            session.add(Airport(facility_site_number=site, faa_id=faa_id, name="ORD"))
+            for name in RUNWAYS:
+                session.add(Runway(facility_site_number=site, name=name, length=13000))
+            session.add_all(
+                AirportRemark(
+                    facility_site_number=site,
+                    remark_element_name=f"A110-{r}",
+                    remark=f"SYNTHETIC REMARK {r} ".ljust(120, "X"),
+                )
+                for r in range(REMARKS)
+            )
+            session.add_all(
+                AttendanceSchedule(
+                    facility_site_number=site,
+                    sequence_number=s,
+                    attendance_schedule="ALL/ALL/CONTINUOUS",
+                )
+                for s in range(1, SCHEDULES + 1)
+            )
+        session.commit()
+    return identifiers
+
+
+def _run(
+    engine: Any,  # noqa: ANN401
+    identifiers: list[str],
+    include: list[str],
+) -> tuple[float, float, float]:
+    """Return queries and rows per lookup and the mean latency."""
+    statements: list[tuple[str, Any]] = []
+
+    def record(*args: Any) -> None:  # noqa: ANN401
+        statements.append((args[2], args[3]))
+
+    event.listen(engine, "before_cursor_execute", record)
+    start = time.perf_counter()
+    for identifier in identifiers:
+        # Inside a session, so collections that weren't loaded eagerly can
+        # still load lazily.
+        with db.session_scope() as session:
+            db.find_airport(identifier, include, session=session).to_dict(include)
+    elapsed = time.perf_counter() - start
+    event.remove(engine, "before_cursor_execute", record)
+
+    with engine.connect() as connection:
+        rows = sum(
+            len(connection.exec_driver_sql(statement, parameters).all())
+            for statement, parameters in statements
+        )
+    count = len(identifiers)
+    return len(statements) / count, rows / count, elapsed / count
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--airports", type=int, default=50)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="aeroinfo-bench-"))
+    engine = create_engine(f"sqlite:///{workdir / 'strategy.db'}")
+    Base.metadata.create_all(engine)
+    db.Engine = engine
+    db.SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
+    identifiers = _populate(engine, args.airports)
+
+    planned = db._build_options
+    for name, include in INCLUDES.items():
+        line = f"{name:>26}:"
+        for label, builder in (("joined", _joined_options), ("planned", planned)):
+            db._build_options = builder
+            queries, rows, latency = _run(engine, identifiers, include)
+            line += (
+                f"  {label} {queries:4.1f} q {rows:6.0f} rows {latency * 1e3:7.2f} ms"
+            )
+        print(line)
+    db._build_options = planned
+
+
+if __name__ == "__main__":
+    main()
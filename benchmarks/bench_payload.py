@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Compare building airport JSON through the ORM and straight from rows.
+
+For common include combinations, looks up a sample of identifiers
+(uncached) and JSON-encodes each airport, once as
+``find_airport(...).to_dict(include)`` and once with
+``fetch_airport_payload(..., as_json=True)``, and reports the mean time per
+response. Uses the synthetic SQLite database from ``bench_projection``, or
+the DB_* database with ``--configured``.
+
+    uv run python -m benchmarks.bench_payload --facilities 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import TYPE_CHECKING
+
+from sqlalchemy import select
+
+import aeroinfo.database as db
+from aeroinfo.database.models.apt import Airport
+from benchmarks.bench_projection import _synthetic_database
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+INCLUDES = {
+    "base": [],
+    "demographic+geographic": ["demographic", "geographic"],
+    "all": ["all"],
+    "all+runways+remarks": ["all", "runways", "remarks", "attendance"],
+}
+
+
+def _orm(identifier: str, include: list[str]) -> bytes:
+    airport = db.find_airport(identifier, include, use_cache=False)
+    payload = airport.to_dict(include=include) if airport else None
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+def _rows(identifier: str, include: list[str]) -> bytes:
+    return db.fetch_airport_payload(identifier, include, as_json=True)  # type: ignore[return-value]
+
+
+def _time(
+    build: Callable[[str, list[str]], bytes], identifiers: list[str], include: list[str]
+) -> float:
+    start = time.perf_counter()
+    for identifier in identifiers:
+        build(identifier, include)
+    return (time.perf_counter() - start) / len(identifiers)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--facilities", type=int, default=2000)
+    parser.add_argument("--lookups", type=int, default=500)
+    parser.add_argument(
+        "--configured", action="store_true", help="use the DB_* database"
+    )
+    args = parser.parse_args()
+
+    if not args.configured:
+        _synthetic_database(args.facilities)
+    with db.session_scope() as session:
+        faa_ids = session.execute(select(Airport.faa_id)).scalars().all()
+    identifiers = random.Random(0).choices(faa_ids, k=args.lookups)  # noqa: S311
+
+    for name, include in INCLUDES.items():
+        assert json.loads(_orm(identifiers[0], include)) == json.loads(  # noqa: S101
+            _rows(identifiers[0], include)
+        )
+        orm = _time(_orm, identifiers, include)
+        rows = _time(_rows, identifiers, include)
+        print(
+            f"{name:>24}: ORM {orm * 1e3:6.3f} ms, rows {rows * 1e3:6.3f} ms "
+            f"({orm / rows:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+Measure what loading only the requested columns saves on airport lookups.
+
+For common include combinations, runs ``find_airport`` (uncached) for a
+sample of identifiers with and without column projection and reports the
+columns selected, the bytes of row data the database returned per lookup
+(string lengths, 8 bytes for other non-null values) and the mean latency.
+
+Runs against a synthetic SQLite database by default; pass ``--configured``
+to use the database the DB_* environment variables point at instead.
+
+    uv run python -m benchmarks.bench_projection --facilities 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+import aeroinfo.database as db
+from aeroinfo.database.base import Base
+from aeroinfo.database.models.apt import Airport
+from benchmarks import _synthetic
+
+INCLUDES = {
+    "base": [],
+    "demographic": ["demographic"],
+    "demographic+geographic": ["demographic", "geographic"],
+    "runways": ["runways"],
+    "all": ["all"],
+    "all+runways+remarks": ["all", "runways", "remarks"],
+}
+
+
+def _synthetic_database(facilities: int) -> None:
+    workdir = Path(tempfile.mkdtemp(prefix="aeroinfo-bench-"))
+    engine = create_engine(f"sqlite:///{workdir / 'projection.db'}")
+    Base.metadata.create_all(engine)
+    db.Engine = engine  # type: ignore[assignment]
+    db.SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True)
+    apt = importlib.reload(importlib.import_module("aeroinfo.parsers.apt"))
+    apt.parse(str(_synthetic.write_apt(workdir / "APT.txt", facilities)), bulk=True)
+
+
+def _row_bytes(include: list[str], identifier: str) -> tuple[int, int]:
+    """Return the columns selected and bytes of row data returned for one lookup."""
+    include_flags, _ = db._prepare_include(include)
+    compiled = db._airport_stmt(identifier, include_flags).compile(db.Engine)
+    params = compiled.construct_params()
+    positional = tuple(params[name] for name in compiled.positiontup or ())
+    with db.Engine.connect() as connection:
+        result = connection.exec_driver_sql(compiled.string, positional or params)
+        columns = len(result.keys())
+        rows = result.all()
+    size = sum(
+        len(value) if isinstance(value, str | bytes) else 8
+        for row in rows
+        for value in row
+        if value is not None
+    )
+    return columns, size
+
+
+def _latency(include: list[str], identifiers: list[str]) -> float:
+    start = time.perf_counter()
+    for identifier in identifiers:
+        db.find_airport(identifier, include, use_cache=False)
+    return (time.perf_counter() - start) / len(identifiers)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--facilities", type=int, default=2000)
+    parser.add_argument("--lookups", type=int, default=500)
+    parser.add_argument(
+        "--configured", action="store_true", help="use the DB_* database"
+    )
+    args = parser.parse_args()
+
+    if not args.configured:
+        _synthetic_database(args.facilities)
+    with db.session_scope() as session:
+        faa_ids = session.execute(select(Airport.faa_id)).scalars().all()
+    identifiers = random.Random(0).choices(faa_ids, k=args.lookups)  # noqa: S311
+
+    for name, include in INCLUDES.items():
+        line = f"{name:>24}:"
+        for label, project in (("all columns", False), ("projected", True)):
+            db._PROJECT_COLUMNS = project
+            columns, size = _row_bytes(include, identifiers[0])
+            latency = _latency(include, identifiers)
+            line += f"  {label} {columns:4d} cols {size:7,d} B {latency * 1e3:6.2f} ms"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
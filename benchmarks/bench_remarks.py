@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+Measure how fast RMK element names are dispatched to their attributes.
+
+Replays a synthetic stream of remark element names through
+``_FacilityBuffer.apply_remark`` for a facility with one runway and two
+runway ends, with no database involved. The stream mixes general A110-*
+remarks (which fall through to the generic table) with every airport,
+runway and runway-end element the parser knows about.
+
+    uv run python -m benchmarks.bench_remarks --remarks 500000
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import time
+
+from aeroinfo.database.models.apt import Airport, Runway, RunwayEnd
+from aeroinfo.parsers import apt
+
+SITE = "0000001.*A"
+
+
+class _NullLoader:
+    """Loader stand-in; the buffered facility never leaves memory."""
+
+    def add(self, obj: object) -> None:
+        """Discard ``obj``."""
+
+    def set_attr(self, *_args: object) -> None:
+        """Report every out-of-facility row as missing."""
+        raise LookupError
+
+
+def _buffer() -> apt._FacilityBuffer:
+    facilities = apt._FacilityBuffer(_NullLoader())  # type: ignore[arg-type]
+    facilities.add(Airport(facility_site_number=SITE))
+    facilities.add(Runway(facility_site_number=SITE, name="05/23"))
+    for end in ("05", "23"):
+        facilities.add(
+            RunwayEnd(facility_site_number=SITE, runway_name="05/23", id=end)
+        )
+    return facilities
+
+
+def _element_names(general_share: float) -> list[str]:
+    targeted = list(apt._AIRPORT_REMARKS)
+    for prefix, (model, _) in apt._RUNWAY_REMARK_PREFIXES.items():
+        targeted.append(f"{prefix}-05/23" if model is Runway else f"{prefix}-05")
+    general = round(len(targeted) * general_share / (1 - general_share))
+    return targeted + [f"A110-{n}" for n in range(1, general + 1)]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--remarks", type=int, default=500_000)
+    parser.add_argument(
+        "--general-share",
+        type=float,
+        default=0.7,
+        help="fraction of the stream that is A110-* general remarks",
+    )
+    args = parser.parse_args()
+
+    facilities = _buffer()
+    names = _element_names(args.general_share)
+    stream = list(itertools.islice(itertools.cycle(names), args.remarks))
+
+    start = time.perf_counter()
+    applied = sum(facilities.apply_remark(SITE, name, "TEXT") for name in stream)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{len(stream)} remarks ({applied} applied) in {elapsed:.3f}s = "
+        f"{len(stream) / elapsed:,.0f} remarks/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
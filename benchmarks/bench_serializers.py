@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+Compare the compiled ``to_dict`` serializers with the uncompiled approach.
+
+Loads the APT fixture into an in-memory SQLite database and serializes its
+airport (with its runway and runway ends) repeatedly, once through the
+models' ``to_dict`` and once through a replica of the previous
+implementation, which rebuilt the attribute lists on every call, checked
+include groups against a list and type-checked every value.
+
+    uv run python -m benchmarks.bench_serializers --calls 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import enum
+import importlib
+import time
+from typing import TYPE_CHECKING
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, selectinload, sessionmaker
+
+import aeroinfo.database as db
+from aeroinfo.database.base import Base
+from aeroinfo.database.models.apt import Airport, Runway
+from benchmarks._synthetic import FIXTURES
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+INCLUDES = {
+    "base": [],
+    "demographic+geographic": ["demographic", "geographic"],
+    "all": ["all"],
+    "all+runways": ["all", "runways"],
+}
+
+
+def _uncompiled(instance: object, include: list[str]) -> dict[str, object]:
+    """Serialize ``instance`` the way ``to_dict`` did before compilation."""
+    model = type(instance)
+    base_attrs = list(model._dict_attrs)  # type: ignore[attr-defined]
+    for group, attrs in model._dict_groups.items():  # type: ignore[attr-defined]
+        if group in include or "all" in include:
+            base_attrs += list(attrs)
+
+    result = {}
+    for attr in base_attrs:
+        value = getattr(instance, attr)
+        if isinstance(value, enum.Enum):
+            result[attr] = getattr(value, "description", value.value)
+        elif isinstance(value, datetime.date | datetime.datetime):
+            result[attr] = value.isoformat()
+        else:
+            result[attr] = value
+
+    if isinstance(instance, Airport) and "runways" in include:
+        result["runways"] = [_uncompiled(runway, []) for runway in instance.runways]
+    return result
+
+
+def _airport() -> Airport:
+    engine = create_engine("sqlite://")
+    db.Engine = engine
+    db.SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+    Base.metadata.create_all(engine)
+    importlib.import_module("aeroinfo.parsers.apt").parse(str(FIXTURES / "APT_min.txt"))
+    with Session(engine, expire_on_commit=False) as session:
+        stmt = select(Airport).options(
+            selectinload(Airport.runways).selectinload(Runway.runway_ends)
+        )
+        return session.execute(stmt).scalars().one()
+
+
+def _time(serialize: Callable[[], object], calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        serialize()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    airport = _airport()
+    for name, include in INCLUDES.items():
+        assert airport.to_dict(include=include) == _uncompiled(airport, include)  # noqa: S101
+        before = _time(
+            lambda include=include: _uncompiled(airport, include), args.calls
+        )
+        after = _time(
+            lambda include=include: airport.to_dict(include=include), args.calls
+        )
+        print(
+            f"{name:>24}: uncompiled {args.calls / before:>9,.0f}/s, "
+            f"compiled {args.calls / after:>9,.0f}/s ({before / after:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
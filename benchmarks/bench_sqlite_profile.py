@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+"""
+Compare building a SQLite snapshot with default settings and the load profile.
+
+Imports synthetic (or given) APT.txt and NAV.txt into a fresh SQLite file
+once with SQLite's default PRAGMAs and once with the "load" profile, then
+times ``optimize_sqlite`` (ANALYZE, VACUUM and the switch to WAL) on the
+result. Pass ``--bulk`` to compare the bulk loaders instead of merges.
+
+    uv run python -m benchmarks.bench_sqlite_profile --facilities 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import aeroinfo.database as db
+from aeroinfo.database.base import Base
+from aeroinfo.database.models import apt as _apt_models  # noqa: F401
+from aeroinfo.database.models import nav as _nav_models  # noqa: F401
+from benchmarks import _synthetic
+
+
+def _run(
+    label: str,
+    path: Path,
+    apt_path: Path,
+    nav_path: Path,
+    profile: str | None,
+    **parse_kwargs: object,
+) -> None:
+    os.environ["DB_RDBM"] = "sqlite"
+    os.environ["DB_HOST"] = f"/{path}"
+    engine = db._create_engine_safely({"sqlite_profile": profile})
+    Base.metadata.create_all(engine)
+
+    db.Engine = engine  # type: ignore[assignment]
+    apt = importlib.reload(importlib.import_module("aeroinfo.parsers.apt"))
+    nav = importlib.reload(importlib.import_module("aeroinfo.parsers.nav"))
+
+    start = time.perf_counter()
+    rows = apt.parse(str(apt_path), **parse_kwargs)
+    rows += nav.parse(str(nav_path), **parse_kwargs)
+    elapsed = time.perf_counter() - start
+    engine.dispose()
+
+    start = time.perf_counter()
+    db.optimize_sqlite(db._create_engine_safely({"sqlite_profile": "read"}))
+    optimized = time.perf_counter() - start
+    print(
+        f"{label:>8}: {rows:8d} rows in {elapsed:8.2f}s = {rows / elapsed:8.0f} rows/s"
+        f", optimize {optimized:5.2f}s, {path.stat().st_size / 1e6:6.1f} MB"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--apt", type=Path, help="APT.txt to load (default: synthetic)")
+    parser.add_argument("--nav", type=Path, help="NAV.txt to load (default: synthetic)")
+    parser.add_argument("--facilities", type=int, default=2000)
+    parser.add_argument("--bulk", action="store_true")
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="aeroinfo-bench-"))
+    apt_path = args.apt or _synthetic.write_apt(workdir / "APT.txt", args.facilities)
+    nav_path = args.nav or _synthetic.write_nav(workdir / "NAV.txt", args.facilities)
+
+    for label, profile in (("default", None), ("load", "load")):
+        _run(
+            label,
+            workdir / f"{label}.db",
+            apt_path,
+            nav_path,
+            profile,
+            bulk=args.bulk,
+        )
+
+
+if __name__ == "__main__":
+    main()
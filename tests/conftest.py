@@ -49,9 +49,18 @@ _load_dotenv_file(env_path)
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from types import ModuleType
+
+    from sqlalchemy.engine import Engine as SAEngine
+
     from aeroinfo.database.models.apt import Airport, Runway, RunwayEnd
     from aeroinfo.database.models.nav import Navaid
 
+FIXTURES = Path(__file__).parent / "fixtures"
+# Site number of the one facility in fixtures/APT_min.txt.
+FIXTURE_SITE = "50009.*A"
+
 
 # Note: env is already loaded above; avoid repeating the loader.
 
@@ -116,3 +125,135 @@ def sample_navaid() -> Navaid:
     n.region = enums.FAARegionEnum.AGL
     n.frequency = "113.6"
     return n
+
+
+@pytest.fixture
+def make_engine(monkeypatch: pytest.MonkeyPatch) -> Callable[..., SAEngine]:
+    """
+    Return a factory for SQLite engines holding the full schema.
+
+    Each engine is patched in as ``aeroinfo.database.Engine`` (and bound to
+    its ``SessionLocal``); reload the parsers afterwards so they use it.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    import aeroinfo.database as db
+    from aeroinfo.database.base import Base
+
+    def make(path: Path | None = None) -> SAEngine:
+        engine = create_engine(f"sqlite:///{path}" if path else "sqlite:///:memory:")
+        monkeypatch.setattr(db, "Engine", engine)
+        monkeypatch.setattr(
+            db, "SessionLocal", sessionmaker(bind=engine, expire_on_commit=False)
+        )
+        Base.metadata.create_all(engine)
+        return engine
+
+    return make
+
+
+@pytest.fixture
+def reload_parsers() -> Callable[[], tuple[ModuleType, ModuleType]]:
+    """Return a function reloading the APT and NAV parsers onto the current Engine."""
+    import importlib
+
+    def reload() -> tuple[ModuleType, ModuleType]:
+        apt = importlib.reload(importlib.import_module("aeroinfo.parsers.apt"))
+        nav = importlib.reload(importlib.import_module("aeroinfo.parsers.nav"))
+        return apt, nav
+
+    return reload
+
+
+@pytest.fixture
+def dump_tables() -> Callable[..., dict[str, list[tuple[object, ...]]]]:
+    """Return a function listing every table's rows, sorted, for comparisons."""
+    from sqlalchemy import select
+
+    from aeroinfo.database.base import Base
+
+    def dump(
+        engine: SAEngine, *, exclude: Iterable[str] = ()
+    ) -> dict[str, list[tuple[object, ...]]]:
+        with engine.connect() as connection:
+            return {
+                table.name: sorted(
+                    (tuple(row) for row in connection.execute(select(table))),
+                    key=repr,
+                )
+                for table in Base.metadata.sorted_tables
+                if table.name not in exclude
+            }
+
+    return dump
+
+
+@pytest.fixture
+def record_queries() -> Iterator[Callable[[SAEngine], list[str]]]:
+    """
+    Return a function recording the SQL an engine runs from then on.
+
+    It returns the list the statements are appended to; the listeners are
+    removed when the test finishes.
+    """
+    from sqlalchemy import event
+
+    listeners: list[tuple[SAEngine, Callable[..., None]]] = []
+
+    def record(engine: SAEngine) -> list[str]:
+        statements: list[str] = []
+
+        def listener(
+            _conn: object, _cursor: object, statement: str, *_: object
+        ) -> None:
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", listener)
+        listeners.append((engine, listener))
+        return statements
+
+    yield record
+    for engine, listener in listeners:
+        event.remove(engine, "before_cursor_execute", listener)
+
+
+@pytest.fixture
+def write_apt() -> Callable[..., Path]:
+    """
+    Return a function writing an APT.txt with one copy of the fixture per site.
+
+    ``extra`` records are appended to every copy, with the fixture's site
+    number replaced like in the fixture's own records.
+    """
+
+    def write(path: Path, sites: Iterable[str], extra: Iterable[str] = ()) -> Path:
+        facility = (FIXTURES / "APT_min.txt").read_text().splitlines()
+        facility += extra
+        path.write_text(
+            "".join(
+                line.replace(FIXTURE_SITE, site) + "\n"
+                for site in sites
+                for line in facility
+            )
+        )
+        return path
+
+    return write
+
+
+@pytest.fixture
+def db(
+    make_engine: Callable[..., SAEngine],
+    reload_parsers: Callable[[], tuple[ModuleType, ModuleType]],
+    tmp_path: Path,
+) -> Iterator[ModuleType]:
+    """Return ``aeroinfo.database`` bound to a database holding the APT fixture."""
+    import aeroinfo.database as db
+
+    make_engine(tmp_path / "aeroinfo.db")
+    apt, _ = reload_parsers()
+    apt.parse(str(FIXTURES / "APT_min.txt"))
+    db.invalidate_caches()
+    yield db
+    db.invalidate_caches()
@@ -0,0 +1,152 @@
+"""Tests for the asyncio lookup helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.mark.fast
+def test_concurrent_misses_share_one_fetch() -> None:
+    """Lookups of a key already being fetched wait for that fetch."""
+    from aeroinfo.database.aio import CoalescingCache
+
+    cache = CoalescingCache(8)
+    calls: list[str] = []
+
+    async def fetch() -> str:
+        calls.append("fetch")
+        await asyncio.sleep(0.01)
+        return "ADK"
+
+    async def run() -> list[object]:
+        results = await asyncio.gather(*(cache.get("k", fetch) for _ in range(20)))
+        results.append(await cache.get("k", fetch))
+        return results
+
+    assert asyncio.run(run()) == ["ADK"] * 21
+    assert calls == ["fetch"]
+
+
+@pytest.mark.fast
+def test_failed_and_cancelled_lookups() -> None:
+    """Failures reach every waiter uncached; a cancelled waiter doesn't stop the fetch."""
+    from aeroinfo.database.aio import CoalescingCache
+
+    cache = CoalescingCache(8)
+    calls: list[str] = []
+
+    async def failing() -> str:
+        calls.append("failing")
+        await asyncio.sleep(0.01)
+        msg = "database down"
+        raise RuntimeError(msg)
+
+    async def slow() -> str:
+        calls.append("slow")
+        await asyncio.sleep(0.01)
+        return "BER"
+
+    async def run() -> None:
+        results = await asyncio.gather(
+            cache.get("a", failing), cache.get("a", failing), return_exceptions=True
+        )
+        assert [str(result) for result in results] == ["database down"] * 2
+        assert await cache.get("a", slow) == "BER"
+
+        waiter = asyncio.ensure_future(cache.get("b", slow))
+        other = asyncio.ensure_future(cache.get("b", slow))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        assert await other == "BER"
+        assert waiter.cancelled()
+
+    asyncio.run(run())
+    assert calls == ["failing", "slow", "slow"]
+
+
+@pytest.mark.fast
+def test_configure_caches_applies_to_async_caches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """configure_caches() replaces the async caches with the same limits."""
+    import aeroinfo.database as db
+    from aeroinfo.database import aio
+
+    monkeypatch.setattr(db, "_CACHE_ENABLED", True)
+    try:
+        db.configure_caches(airport_size=3, navaid_bytes=1000, ttl=60)
+        airport = aio._airport_cache._cache.stats()  # type: ignore[union-attr]
+        navaid = aio._navaid_cache._cache.stats()  # type: ignore[union-attr]
+        assert (airport["maxsize"], airport["ttl"]) == (3, 60)
+        assert (navaid["max_bytes"], navaid["ttl"]) == (1000, 60)
+
+        db.configure_caches(navaid_size=0)
+        assert aio._navaid_cache._cache is None
+    finally:
+        db.configure_caches()
+
+
+@pytest.mark.fast
+def test_async_db_url_uses_async_drivers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The async URL swaps in asyncpg or aiosqlite for the configured backend."""
+    from aeroinfo.database.aio import get_async_db_url
+
+    monkeypatch.setenv("DB_RDBM", "postgresql")
+    for name, value in (("USER", "me"), ("PASS", "pw"), ("HOST", "db"), ("NAME", "n")):
+        monkeypatch.setenv(f"DB_{name}", value)
+    assert get_async_db_url() == "postgresql+asyncpg://me:pw@db/n"
+
+    monkeypatch.setenv("DB_RDBM", "sqlite")
+    monkeypatch.setenv("DB_HOST", "/aeroinfo.db")
+    assert get_async_db_url() == "sqlite+aiosqlite:///aeroinfo.db"
+
+
+@pytest.mark.fast
+def test_async_lookups_match_sync_ones(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The async helpers return what the synchronous ones do."""
+    pytest.importorskip("aiosqlite")
+    import aeroinfo.database as db
+    from aeroinfo.database import aio
+    from aeroinfo.database.base import Base
+
+    path = tmp_path / "aio.db"
+    engine = create_engine(f"sqlite:///{path}")
+    monkeypatch.setattr(db, "Engine", engine)
+    Base.metadata.create_all(engine)
+    importlib.reload(importlib.import_module("aeroinfo.parsers.apt")).parse(
+        str(FIXTURES / "APT_min.txt")
+    )
+    importlib.reload(importlib.import_module("aeroinfo.parsers.nav")).parse(
+        str(FIXTURES / "NAV_min.txt")
+    )
+    monkeypatch.setenv("DB_RDBM", "sqlite")
+    monkeypatch.setenv("DB_HOST", f"/{path}")
+    aio.configure_async_engine()
+
+    async def run() -> None:
+        try:
+            airport, again = await asyncio.gather(
+                aio.find_airport("adk", include=["runways"]), aio.find_airport("PADK")
+            )
+            assert airport.facility_site_number == "50009.*A"
+            assert again.facility_site_number == "50009.*A"
+            assert airport.runways
+            runway = await aio.find_runway(airport.runways[0].name[:2], "ADK")
+            assert runway is not None
+            end = await aio.find_runway_end(runway.name[:2], runway)
+            assert end is not None
+            navaid = await aio.find_navaid("ber", "tacan")
+            assert navaid.name
+        finally:
+            await aio.dispose_engine()
+
+    asyncio.run(run())
@@ -0,0 +1,41 @@
+"""Tests for building airport payloads straight from rows."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+INCLUDES = (
+    [],
+    ["demographic", "ownership"],
+    ["all"],
+    ["all", "runways", "remarks", "attendance"],
+)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("include", INCLUDES)
+def test_payload_matches_to_dict(db: object, include: list[str]) -> None:
+    """The row-built payload equals to_dict(), key order included."""
+    expected = db.find_airport("PADK", include, use_cache=False).to_dict(include)  # type: ignore[attr-defined]
+    payload = db.fetch_airport_payload("padk", include)  # type: ignore[attr-defined]
+
+    assert payload == expected
+    assert list(payload) == list(expected)
+
+
+@pytest.mark.fast
+def test_payload_skips_orm_instances(db: object) -> None:
+    """No instances are created, enums are described and JSON is pre-encoded."""
+    with db.session_scope() as session:  # type: ignore[attr-defined]
+        payload = db.fetch_airport_payload(  # type: ignore[attr-defined]
+            "ADK", ["demographic", "runways"], session=session
+        )
+        assert len(session.identity_map) == 0
+
+    assert payload["region"] == "ALASKA"
+    assert payload["runways"][0]["name"] == "05/23"
+    encoded = db.fetch_airport_payload("ADK", ["demographic", "runways"], as_json=True)  # type: ignore[attr-defined]
+    assert json.loads(encoded) == payload
+    assert db.fetch_airport_payload("NONE", as_json=True) is None  # type: ignore[attr-defined]
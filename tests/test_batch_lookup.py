@@ -0,0 +1,85 @@
+"""Tests for the find_airports / find_navaids batch lookups."""
+
+from __future__ import annotations
+
+import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import update
+
+if TYPE_CHECKING:
+    import types
+    from collections.abc import Callable, Iterator
+
+    from sqlalchemy.engine import Engine as SAEngine
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture
+def db(
+    make_engine: Callable[..., SAEngine],
+    reload_parsers: Callable[[], tuple[types.ModuleType, types.ModuleType]],
+    write_apt: Callable[..., Path],
+    tmp_path: Path,
+) -> Iterator[types.ModuleType]:
+    """Query helpers bound to a database holding an old and a new ADK."""
+    import aeroinfo.database as db
+    from aeroinfo.database.models.apt import Airport
+
+    apt_path = write_apt(tmp_path / "APT.txt", ["50001.*A", "50002.*A"])
+    engine = make_engine(tmp_path / "lookup.db")
+    apt, nav = reload_parsers()
+    apt.parse(str(apt_path), bulk=True)
+    nav.parse(str(FIXTURES / "NAV_min.txt"), bulk=True)
+    with engine.begin() as connection:
+        connection.execute(
+            update(Airport)
+            .where(Airport.facility_site_number == "50001.*A")
+            .values(effective_date=datetime.date(2001, 1, 1))
+        )
+    db.invalidate_caches()
+    yield db
+    db.invalidate_caches()
+
+
+@pytest.mark.fast
+def test_find_airports_matches_find_airport(db: types.ModuleType) -> None:
+    """Each identifier resolves to what find_airport returns for it."""
+    result = db.find_airports(["adk", "PADK", "ZZZ"], include=["runways"])
+
+    assert list(result) == ["adk", "PADK", "ZZZ"]
+    assert result["ZZZ"] is None
+    for identifier in ("adk", "PADK"):
+        expected = db.find_airport(identifier, use_cache=False)
+        assert result[identifier].facility_site_number == "50002.*A"
+        assert result[identifier].facility_site_number == (
+            expected.facility_site_number
+        )
+        assert [runway.name for runway in result[identifier].runways]
+
+
+@pytest.mark.fast
+def test_batch_lookups_query_only_cache_misses(
+    db: types.ModuleType, record_queries: Callable[[SAEngine], list[str]]
+) -> None:
+    """Misses are fetched in one query; hits come from the shared caches."""
+    statements = record_queries(db.Engine)
+
+    db.find_airport("ADK")
+    assert len(statements) == 1
+    airports = db.find_airports(["ADK", "PADK", "ZZZ"])
+    assert len(statements) == 2
+    assert airports["ADK"] is db.find_airport("ADK")
+    assert db.find_airport("ZZZ") is None
+    assert len(statements) == 2
+
+    navaids = db.find_navaids([("ber", "tacan"), ("XXX", "VOR")])
+    assert len(statements) == 3
+    assert navaids[("ber", "tacan")].name
+    assert navaids[("XXX", "VOR")] is None
+    assert db.find_navaid("BER", "TACAN") is navaids[("ber", "tacan")]
+    db.find_navaids([("BER", "TACAN"), ("XXX", "VOR")])
+    assert len(statements) == 3
@@ -0,0 +1,108 @@
+"""Stress tests for single-flight coalescing in the lookup caches."""
+
+from __future__ import annotations
+
+import importlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from aeroinfo.database.cache import LookupCache
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.engine import Engine as SAEngine
+
+FIXTURES = Path(__file__).parent / "fixtures"
+THREADS = 64
+
+
+def _hammer(call: object, threads: int = THREADS) -> list[object]:
+    """Run ``call`` from ``threads`` threads released at the same moment."""
+    start = threading.Barrier(threads)
+
+    def run() -> object:
+        start.wait()
+        return call()  # type: ignore[operator]
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [pool.submit(run) for _ in range(threads)]
+    return [future.exception() or future.result() for future in futures]
+
+
+@pytest.mark.fast
+def test_concurrent_misses_fetch_once() -> None:
+    """Threads missing on the same key share one fetch."""
+    cache = LookupCache(8)
+    calls: list[int] = []
+
+    def fetch() -> str:
+        calls.append(1)
+        time.sleep(0.05)
+        return "ORD"
+
+    results = _hammer(lambda: cache.get_or_fetch("ORD", fetch))
+
+    assert results == ["ORD"] * THREADS
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] + stats["coalesced"] == THREADS - 1
+    assert stats["coalesced"] > 0
+
+
+@pytest.mark.fast
+def test_failed_fetch_reaches_waiters_and_is_retried() -> None:
+    """Every waiter sees the fetch's exception; the next miss fetches again."""
+    cache = LookupCache(8)
+    calls: list[int] = []
+
+    def failing() -> str:
+        calls.append(1)
+        time.sleep(0.05)
+        msg = "database down"
+        raise RuntimeError(msg)
+
+    results = _hammer(lambda: cache.get_or_fetch("ORD", failing))
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(calls) == 1
+    assert cache.get_or_fetch("ORD", lambda: "ORD") == "ORD"
+
+
+@pytest.mark.fast
+def test_cold_find_airport_runs_one_query(
+    monkeypatch: pytest.MonkeyPatch,
+    record_queries: Callable[[SAEngine], list[str]],
+    tmp_path: Path,
+) -> None:
+    """After invalidation, a burst of lookups of one airport runs one query."""
+    import aeroinfo.database as db
+    from aeroinfo.database.base import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'burst.db'}")
+    monkeypatch.setattr(db, "Engine", engine)
+    monkeypatch.setattr(db, "SessionLocal", sessionmaker(bind=engine))
+    Base.metadata.create_all(engine)
+    importlib.reload(importlib.import_module("aeroinfo.parsers.apt")).parse(
+        str(FIXTURES / "APT_min.txt")
+    )
+    db.invalidate_caches()
+
+    statements = record_queries(engine)
+    before = db._airport_cache.stats()
+    results = _hammer(lambda: db.find_airport("ADK"), threads=32)
+    after = db._airport_cache.stats()
+    db.invalidate_caches()
+
+    assert len({id(result) for result in results}) == 1
+    assert results[0].faa_id == "ADK"
+    assert len(statements) == 1
+    assert after["misses"] - before["misses"] == 1
@@ -0,0 +1,116 @@
+"""Tests for the byte budget, TTL and partitions of the lookup caches."""
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from aeroinfo.database.cache import (
+    MISSING,
+    LookupCache,
+    PartitionedCache,
+    estimate_size,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.mark.fast
+def test_byte_budget_evicts_least_recently_used() -> None:
+    """Entries are evicted, oldest first, once their sizes exceed the budget."""
+    cache = LookupCache(100, max_bytes=10, sizeof=len)
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    assert cache.get("a") == "aaaa"
+    cache.put("c", "cccc")
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == "aaaa"
+    stats = cache.stats()
+    assert (stats["entries"], stats["bytes"], stats["evictions"]) == (2, 8, 1)
+
+    cache.put("d", "d" * 11)
+    assert cache.get("d") is MISSING
+    assert cache.stats()["bytes"] == 0
+
+
+@pytest.mark.fast
+def test_entries_expire_after_ttl() -> None:
+    """An entry older than the TTL is a miss and is fetched again."""
+    now = [0.0]
+    cache = LookupCache(8, ttl=60, clock=lambda: now[0])
+    assert cache.get_or_fetch("ORD", lambda: "first") == "first"
+    now[0] = 59.0
+    assert cache.get_or_fetch("ORD", lambda: "second") == "first"
+    now[0] = 60.0
+    assert cache.get_or_fetch("ORD", lambda: "second") == "second"
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["expirations"]) == (1, 2, 1)
+
+
+@pytest.mark.fast
+def test_partitions_share_one_budget() -> None:
+    """Partitions don't each get the limits; the oldest entry of any goes."""
+    cache = PartitionedCache(3, max_bytes=10, sizeof=len)
+    for name in ("a", "b", "c", "d"):
+        cache.partition(("include", name)).put("ORD", "ORD")
+
+    stats = cache.stats()
+    assert (stats["entries"], stats["bytes"], stats["evictions"]) == (3, 9, 1)
+    assert cache.partition(("include", "a")).get("ORD") is MISSING
+    assert cache.partition(("include", "d")).get("ORD") == "ORD"
+
+    cache.partition("big").put("ORD", "x" * 8)
+    assert cache.stats()["partitions"] == {"big": {"entries": 1, "bytes": 8}}
+
+
+@pytest.mark.fast
+def test_estimate_size_counts_loaded_collections(
+    sample_runway_end: object,
+) -> None:
+    """Eagerly loaded children add to an airport's estimate; cycles don't loop."""
+    airport = sample_runway_end.runway.airport  # type: ignore[attr-defined]
+    with_runways = estimate_size(airport)
+    del airport.__dict__["runways"]
+
+    assert with_runways > estimate_size(airport) > 0
+
+
+@pytest.mark.fast
+def test_cache_stats_partitions_by_include(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Airport lookups with different includes are cached and counted apart."""
+    import aeroinfo.database as db
+    from aeroinfo.database.base import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'stats.db'}")
+    monkeypatch.setattr(db, "Engine", engine)
+    monkeypatch.setattr(db, "SessionLocal", sessionmaker(bind=engine))
+    Base.metadata.create_all(engine)
+    importlib.reload(importlib.import_module("aeroinfo.parsers.apt")).parse(
+        str(FIXTURES / "APT_min.txt")
+    )
+    db.configure_caches(airport_bytes=1 << 20, ttl=300)
+    try:
+        db.find_airport("ADK")
+        db.find_airport("ADK")
+        db.find_airport("ADK", include=["runways", "remarks"])
+        db.find_navaid("BER", "TACAN")
+        stats = db.cache_stats()
+    finally:
+        db.configure_caches()
+
+    airport = stats["airport"]
+    assert (airport["hits"], airport["misses"], airport["entries"]) == (1, 2, 2)
+    bare = airport["partitions"][()]
+    loaded = airport["partitions"][("remarks", "runways")]
+    assert loaded["bytes"] > bare["bytes"] > 0
+    assert airport["bytes"] == loaded["bytes"] + bare["bytes"]
+    assert airport["ttl"] == 300
+    assert stats["navaid"]["misses"] == 1
@@ -0,0 +1,85 @@
+"""Tests for bulk loads with deferred index and foreign key builds."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import inspect
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import ModuleType
+
+    from sqlalchemy.engine import Engine as SAEngine
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _indexes(engine: SAEngine) -> dict[str, list[tuple[str, list[str]]]]:
+    inspector = inspect(engine)
+    return {
+        name: sorted(
+            (ix["name"], ix["column_names"]) for ix in inspector.get_indexes(name)
+        )
+        for name in sorted(inspector.get_table_names())
+    }
+
+
+@pytest.mark.fast
+def test_deferred_load_rebuilds_indexes(
+    make_engine: Callable[..., SAEngine],
+    reload_parsers: Callable[[], tuple[ModuleType, ModuleType]],
+    write_apt: Callable[..., Path],
+    dump_tables: Callable[..., dict[str, list[tuple[object, ...]]]],
+    tmp_path: Path,
+) -> None:
+    """A deferred load ends with the indexes and rows of a normal bulk load."""
+    apt_path = write_apt(tmp_path / "APT.txt", ["50001.*A", "50002.*A"])
+    nav_path = FIXTURES / "NAV_min.txt"
+
+    engine = make_engine(tmp_path / "deferred.db")
+    before = _indexes(engine)
+    assert any(before.values())
+    apt, nav = reload_parsers()
+    apt.parse(str(apt_path), bulk=True, defer_indexes=True)
+    nav.parse(str(nav_path), bulk=True, defer_indexes=True)
+    assert _indexes(engine) == before
+    deferred = dump_tables(engine)
+
+    plain = make_engine(tmp_path / "plain.db")
+    apt, nav = reload_parsers()
+    apt.parse(str(apt_path), bulk=True)
+    nav.parse(str(nav_path), bulk=True)
+    assert deferred == dump_tables(plain)
+
+
+@pytest.mark.fast
+def test_failed_deferred_load_keeps_indexes(
+    monkeypatch: pytest.MonkeyPatch,
+    make_engine: Callable[..., SAEngine],
+    reload_parsers: Callable[[], tuple[ModuleType, ModuleType]],
+    write_apt: Callable[..., Path],
+    dump_tables: Callable[..., dict[str, list[tuple[object, ...]]]],
+    tmp_path: Path,
+) -> None:
+    """If loading fails the dropped indexes come back with the rollback."""
+    engine = make_engine(tmp_path / "deferred.db")
+    apt, _ = reload_parsers()
+    apt.parse(str(write_apt(tmp_path / "old.txt", ["50001.*A"])), bulk=True)
+    before = (_indexes(engine), dump_tables(engine))
+
+    def broken(*_args: object) -> None:
+        msg = "disk full"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(apt, "_parse_lines", broken)
+    with pytest.raises(RuntimeError, match="disk full"):
+        apt.parse(
+            str(write_apt(tmp_path / "new.txt", ["50002.*A"])),
+            bulk=True,
+            defer_indexes=True,
+        )
+
+    assert (_indexes(engine), dump_tables(engine)) == before
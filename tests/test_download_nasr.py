@@ -0,0 +1,193 @@
+"""Tests for the NASR downloader against a local http.server stand-in."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+
+import pytest
+
+import aeroinfo.download_nasr as dl
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+PAYLOAD = bytes(range(256)) * 256  # 64 KiB stand-in for the subscription zip
+ZIP_NAME = "28DaySubscription_Effective_2025-10-30.zip"
+
+
+class _FakeFAA(BaseHTTPRequestHandler):
+    """Serve the edition JSON and the zip, honouring Range requests."""
+
+    ranges = True
+    # Close the first response after this many body bytes (None: never).
+    cut_after: int | None = None
+    requested: list[str | None]
+
+    def log_message(self, *_args: object) -> None:
+        """Keep test output quiet."""
+
+    def do_HEAD(self) -> None:
+        """Describe the zip."""
+        self._send_zip(body=False)
+
+    def do_GET(self) -> None:
+        """Serve the edition JSON or (part of) the zip."""
+        if self.path.startswith("/chart"):
+            host, port = self.server.server_address[:2]
+            body = json.dumps(
+                {
+                    "edition": [
+                        {
+                            "editionDate": "10/30/2025",
+                            "product": {"url": f"http://{host}:{port}/{ZIP_NAME}"},
+                        }
+                    ]
+                }
+            ).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return
+        self._send_zip(body=True)
+
+    def _send_zip(self, *, body: bool) -> None:
+        header = self.headers.get("Range")
+        if body:
+            type(self).requested.append(header)
+        start, end = 0, len(PAYLOAD) - 1
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", header or "")
+        if self.ranges and match:
+            start, end = int(match[1]), int(match[2])
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(PAYLOAD)}")
+        else:
+            self.send_response(200)
+        if self.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", '"edition-2025-10-30"')
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        if not body:
+            return
+        data = PAYLOAD[start : end + 1]
+        cut_after = type(self).cut_after
+        if cut_after is not None:
+            type(self).cut_after = None
+            self.wfile.write(data[:cut_after])
+            self.close_connection = True
+            return
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def faa(monkeypatch: pytest.MonkeyPatch) -> Iterator[type[_FakeFAA]]:
+    """Run the stand-in server and point the downloader at it."""
+    handler = type("Handler", (_FakeFAA,), {"requested": []})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    host, port = server.server_address[:2]
+    monkeypatch.setattr(dl, "zip_file_finder", f"http://{host}:{port}/chart")
+    monkeypatch.setattr(dl, "MIN_SEGMENT_SIZE", 4096)
+    monkeypatch.setattr(dl, "DOWNLOAD_BUFFER_SIZE", 1024)
+    monkeypatch.setattr(dl, "CHECKPOINT_BYTES", 1024)
+    try:
+        yield handler
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.fast
+def test_parallel_range_download(faa: type[_FakeFAA], tmp_path: Path) -> None:
+    """The zip arrives in parallel ranges and is verified against its hash."""
+    url = dl.get_download_url()
+    sha256 = hashlib.sha256(PAYLOAD).hexdigest()
+
+    result = dl.download_nasr_zip(url, str(tmp_path), segments=4, sha256=sha256)
+
+    assert result == str(tmp_path / "2025-10-30" / ZIP_NAME)
+    assert (tmp_path / "2025-10-30" / ZIP_NAME).read_bytes() == PAYLOAD
+    assert sorted(faa.requested) == [
+        "bytes=0-16383",
+        "bytes=16384-32767",
+        "bytes=32768-49151",
+        "bytes=49152-65535",
+    ]
+    assert [p.name for p in (tmp_path / "2025-10-30").iterdir()] == [ZIP_NAME]
+
+
+@pytest.mark.fast
+def test_download_resumes_from_state_file(faa: type[_FakeFAA], tmp_path: Path) -> None:
+    """A partial download picks up each segment where the state file says."""
+    url = dl.get_download_url()
+    download_dir = tmp_path / "2025-10-30"
+    download_dir.mkdir()
+
+    part = bytearray(len(PAYLOAD))
+    part[0:10000] = PAYLOAD[0:10000]
+    part[32768:40000] = PAYLOAD[32768:40000]
+    (download_dir / f"{ZIP_NAME}.part").write_bytes(part)
+    state = {
+        "url": url,
+        "size": len(PAYLOAD),
+        "validator": '"edition-2025-10-30"',
+        "segments": [[0, 32767, 10000], [32768, 65535, 7232]],
+    }
+    (download_dir / f"{ZIP_NAME}.state.json").write_text(json.dumps(state))
+
+    dl.download_nasr_zip(url, str(tmp_path))
+
+    assert (download_dir / ZIP_NAME).read_bytes() == PAYLOAD
+    assert sorted(faa.requested) == ["bytes=10000-32767", "bytes=40000-65535"]
+    assert not (download_dir / f"{ZIP_NAME}.state.json").exists()
+
+
+@pytest.mark.fast
+def test_interrupted_segment_is_retried_from_checkpoint(
+    faa: type[_FakeFAA], tmp_path: Path
+) -> None:
+    """A dropped connection resumes the segment instead of restarting it."""
+    url = dl.get_download_url()
+    faa.cut_after = 5000
+
+    dl.download_nasr_zip(url, str(tmp_path), segments=1)
+
+    assert (tmp_path / "2025-10-30" / ZIP_NAME).read_bytes() == PAYLOAD
+    assert faa.requested[0] == "bytes=0-65535"
+    resumed_at = int(re.fullmatch(r"bytes=(\d+)-65535", faa.requested[1])[1])
+    assert 0 < resumed_at <= 5000
+
+
+@pytest.mark.fast
+@pytest.mark.usefixtures("faa")
+def test_checksum_mismatch_raises(tmp_path: Path) -> None:
+    """A file that doesn't hash as expected is discarded."""
+    url = dl.get_download_url()
+
+    with pytest.raises(RuntimeError, match="SHA-256"):
+        dl.download_nasr_zip(url, str(tmp_path), sha256="0" * 64)
+    assert list((tmp_path / "2025-10-30").iterdir()) == []
+
+
+@pytest.mark.fast
+def test_servers_without_ranges_get_a_plain_download(
+    faa: type[_FakeFAA], tmp_path: Path
+) -> None:
+    """Without Accept-Ranges the zip is fetched in one ordinary GET."""
+    url = dl.get_download_url()
+    faa.ranges = False
+
+    dl.download_nasr_zip(url, str(tmp_path))
+
+    assert (tmp_path / "2025-10-30" / ZIP_NAME).read_bytes() == PAYLOAD
+    assert faa.requested == [None]
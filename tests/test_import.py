@@ -0,0 +1,131 @@
+"""Tests for the import driver in aeroinfo/import.py."""
+
+from __future__ import annotations
+
+import importlib
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+
+def _driver(monkeypatch: pytest.MonkeyPatch, dialect: str) -> types.ModuleType:
+    """Import the driver with parsers and caches replaced by recorders."""
+    driver = importlib.import_module("aeroinfo.import")
+    fake_engine = types.SimpleNamespace(dialect=types.SimpleNamespace(name=dialect))
+    monkeypatch.setattr(driver, "Engine", fake_engine)
+    return driver
+
+
+@pytest.mark.fast
+def test_apt_and_nav_import_concurrently(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Both files are parsed at once; caches are invalidated after both."""
+    driver = _driver(monkeypatch, "postgresql")
+    both_running = threading.Barrier(2, timeout=5)
+    events: list[str] = []
+
+    def fake_parse(name: str) -> object:
+        def parse(txtfile: str, **_kwargs: object) -> int:
+            both_running.wait()
+            events.append(f"{name} {Path(txtfile).name}")
+            return 1
+
+        return parse
+
+    monkeypatch.setattr(driver.apt, "parse", fake_parse("apt"))
+    monkeypatch.setattr(driver.nav, "parse", fake_parse("nav"))
+    monkeypatch.setattr(
+        driver, "invalidate_caches", lambda: events.append("invalidate")
+    )
+
+    driver.main(str(tmp_path))
+
+    assert sorted(events[:2]) == ["apt APT.txt", "nav NAV.txt"]
+    assert events[2:] == ["invalidate"]
+
+
+@pytest.mark.fast
+def test_failed_import_still_waits_and_invalidates(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """A failure in one file surfaces after the other has finished."""
+    driver = _driver(monkeypatch, "postgresql")
+    events: list[str] = []
+    nav_started = threading.Event()
+
+    def failing_apt(_txtfile: str, **_kwargs: object) -> int:
+        nav_started.wait(timeout=5)
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    def nav_parse(_txtfile: str, **_kwargs: object) -> int:
+        nav_started.set()
+        events.append("nav")
+        return 1
+
+    monkeypatch.setattr(driver.apt, "parse", failing_apt)
+    monkeypatch.setattr(driver.nav, "parse", nav_parse)
+    monkeypatch.setattr(
+        driver, "invalidate_caches", lambda: events.append("invalidate")
+    )
+
+    with pytest.raises(RuntimeError, match="boom"):
+        driver.main(str(tmp_path))
+    assert events == ["nav", "invalidate"]
+
+
+@pytest.mark.fast
+def test_sqlite_imports_one_file_at_a_time(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """SQLite has a single writer, so APT and NAV run back to back."""
+    driver = _driver(monkeypatch, "sqlite")
+    events: list[str] = []
+
+    def fake_parse(name: str) -> object:
+        def parse(_txtfile: str, **_kwargs: object) -> int:
+            events.append(f"{name} start")
+            events.append(f"{name} end")
+            return 1
+
+        return parse
+
+    monkeypatch.setattr(driver.apt, "parse", fake_parse("apt"))
+    monkeypatch.setattr(driver.nav, "parse", fake_parse("nav"))
+    monkeypatch.setattr(
+        driver, "invalidate_caches", lambda: events.append("invalidate")
+    )
+
+    driver.main(str(tmp_path))
+
+    assert events == ["apt start", "apt end", "nav start", "nav end", "invalidate"]
+
+
+@pytest.mark.fast
+def test_fast_sqlite_wraps_import_in_profiles(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """The load profile covers the import; the database is optimized after."""
+    driver = _driver(monkeypatch, "sqlite")
+    events: list[str] = []
+
+    def parse(txtfile: str, **_kwargs: object) -> int:
+        events.append(Path(txtfile).name)
+        return 1
+
+    monkeypatch.setattr(driver.apt, "parse", parse)
+    monkeypatch.setattr(driver.nav, "parse", parse)
+    monkeypatch.setattr(driver, "invalidate_caches", lambda: None)
+    monkeypatch.setattr(
+        driver,
+        "configure_engine",
+        lambda **overrides: events.append(overrides["sqlite_profile"]),
+    )
+    monkeypatch.setattr(driver, "optimize_sqlite", lambda: events.append("optimize"))
+
+    driver.main(str(tmp_path), fast_sqlite=True)
+
+    assert events == ["load", "APT.txt", "NAV.txt", "read", "optimize"]
@@ -0,0 +1,179 @@
+"""Tests for incremental imports driven by per-facility fingerprints."""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import ModuleType
+
+    from sqlalchemy.engine import Engine as SAEngine
+
+FIXTURES = Path(__file__).parent / "fixtures"
+SITE = "50009.*A"
+# Only incremental imports write fingerprints, so leave them out of comparisons.
+BOOKKEEPING = ("facility_fingerprints",)
+
+
+def _apt_lines(n: int, remark: str = "GENERAL REMARK") -> list[str]:
+    """Return the record group of synthetic facility ``n``."""
+    site = f"5000{n}.*A"
+    lines = [
+        line.replace(SITE, site)
+        for line in (FIXTURES / "APT_min.txt").read_text().splitlines()
+    ]
+    lines += [
+        "RMK" + site.ljust(11) + "AK" + "A5".ljust(13) + "COUNTY REMARK",
+        "RMK" + site.ljust(11) + "AK" + "A110-1".ljust(13) + remark,
+    ]
+    return lines
+
+
+def _nav_lines(ident: str, remark: str = "NAVAID REMARK") -> list[str]:
+    """Return a NAV1 record plus one NAV2 remark for navaid ``ident``."""
+    nav1 = (FIXTURES / "NAV_min.txt").read_text().splitlines()[0]
+    nav1 = nav1[:4] + ident.ljust(4) + nav1[8:]
+    return [nav1, "NAV2" + ident.ljust(4) + "TACAN".ljust(20) + remark.ljust(600)]
+
+
+def _write(path: Path, groups: list[list[str]]) -> Path:
+    path.write_text("".join(line + "\n" for group in groups for line in group))
+    return path
+
+
+@pytest.fixture
+def parse(
+    reload_parsers: Callable[[], tuple[ModuleType, ModuleType]],
+) -> Callable[..., tuple[int, int]]:
+    """Return a function parsing APT and NAV files into the current Engine."""
+
+    def run(apt_path: Path, nav_path: Path, **parse_kwargs: object) -> tuple[int, int]:
+        apt, nav = reload_parsers()
+        return apt.parse(str(apt_path), **parse_kwargs), nav.parse(
+            str(nav_path), **parse_kwargs
+        )
+
+    return run
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("parse_kwargs", [{}, {"bulk": True}], ids=["merge", "bulk"])
+def test_incremental_import_writes_only_changes(
+    make_engine: Callable[..., SAEngine],
+    parse: Callable[..., tuple[int, int]],
+    dump_tables: Callable[..., dict[str, list[tuple[object, ...]]]],
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+    parse_kwargs: dict[str, object],
+) -> None:
+    """A second cycle writes the changed facilities and deletes removed ones."""
+    apt_path, nav_path = tmp_path / "APT.txt", tmp_path / "NAV.txt"
+    incremental = make_engine(tmp_path / "incremental.db")
+
+    _write(apt_path, [_apt_lines(n) for n in range(4)])
+    _write(nav_path, [_nav_lines(ident) for ident in ("AAA", "BBB", "CCC")])
+    with caplog.at_level(logging.INFO, logger="aeroinfo.parsers.fingerprints"):
+        parse(apt_path, nav_path, incremental=True, **parse_kwargs)
+    assert "APT: 4 added, 0 changed, 0 removed, 0 unchanged" in caplog.text
+    assert "NAV: 3 added, 0 changed, 0 removed, 0 unchanged" in caplog.text
+
+    # Next cycle: facility 1 has a new remark, 2 is gone and 4 is new;
+    # navaid BBB's remark changed and CCC is gone.
+    _write(
+        apt_path,
+        [_apt_lines(0), _apt_lines(1, "AMENDED"), _apt_lines(3), _apt_lines(4)],
+    )
+    _write(nav_path, [_nav_lines("AAA"), _nav_lines("BBB", "AMENDED")])
+    caplog.clear()
+    with caplog.at_level(logging.INFO, logger="aeroinfo.parsers.fingerprints"):
+        apt_rows, nav_rows = parse(apt_path, nav_path, incremental=True, **parse_kwargs)
+    assert "APT: 1 added, 1 changed, 1 removed, 2 unchanged" in caplog.text
+    assert "NAV: 0 added, 1 changed, 1 removed, 1 unchanged" in caplog.text
+    # Only facilities 1 and 4 and navaid BBB were written.
+    # APT, RWY, two runway ends and the A110-1 remark; A5 is an airport column.
+    facility_rows = 5
+    assert apt_rows == 2 * facility_rows
+    assert nav_rows == 2
+
+    full = make_engine(tmp_path / "full.db")
+    parse(apt_path, nav_path, **parse_kwargs)
+    assert dump_tables(incremental, exclude=BOOKKEEPING) == dump_tables(
+        full, exclude=BOOKKEEPING
+    )
+
+
+@pytest.mark.fast
+def test_unchanged_cycle_writes_nothing(
+    make_engine: Callable[..., SAEngine],
+    parse: Callable[..., tuple[int, int]],
+    dump_tables: Callable[..., dict[str, list[tuple[object, ...]]]],
+    tmp_path: Path,
+) -> None:
+    """Re-importing the same files only computes hashes."""
+    apt_path = _write(tmp_path / "APT.txt", [_apt_lines(n) for n in range(3)])
+    nav_path = _write(tmp_path / "NAV.txt", [_nav_lines("AAA")])
+    engine = make_engine(tmp_path / "db.sqlite")
+
+    parse(apt_path, nav_path, incremental=True)
+    before = dump_tables(engine, exclude=BOOKKEEPING)
+
+    assert parse(apt_path, nav_path, incremental=True) == (0, 0)
+    assert dump_tables(engine, exclude=BOOKKEEPING) == before
+
+
+@pytest.mark.fast
+def test_first_incremental_import_reloads_existing_rows(
+    make_engine: Callable[..., SAEngine],
+    parse: Callable[..., tuple[int, int]],
+    dump_tables: Callable[..., dict[str, list[tuple[object, ...]]]],
+    tmp_path: Path,
+) -> None:
+    """Rows from a full import don't survive the first incremental one."""
+    apt_path, nav_path = tmp_path / "APT.txt", tmp_path / "NAV.txt"
+    engine = make_engine(tmp_path / "db.sqlite")
+    _write(apt_path, [_apt_lines(n, "OLD REMARK") for n in range(3)])
+    _write(nav_path, [_nav_lines("AAA"), _nav_lines("BBB")])
+    parse(apt_path, nav_path)
+
+    # Facility 1's A110-1 remark is gone, 2 and navaid BBB left the data.
+    _write(apt_path, [_apt_lines(0), _apt_lines(1)[:-1]])
+    _write(nav_path, [_nav_lines("AAA")])
+    parse(apt_path, nav_path, incremental=True)
+
+    full = make_engine(tmp_path / "full.db")
+    parse(apt_path, nav_path)
+    assert dump_tables(engine, exclude=BOOKKEEPING) == dump_tables(
+        full, exclude=BOOKKEEPING
+    )
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("parse_kwargs", [{}, {"bulk": True}], ids=["merge", "bulk"])
+def test_full_import_drops_stored_fingerprints(
+    make_engine: Callable[..., SAEngine],
+    parse: Callable[..., tuple[int, int]],
+    dump_tables: Callable[..., dict[str, list[tuple[object, ...]]]],
+    tmp_path: Path,
+    parse_kwargs: dict[str, object],
+) -> None:
+    """Hashes from before a full import don't hide what it changed."""
+    cycle_a = _write(tmp_path / "APT_A.txt", [_apt_lines(n) for n in range(2)])
+    cycle_b = _write(tmp_path / "APT_B.txt", [_apt_lines(1, "AMENDED")])
+    nav_path = _write(tmp_path / "NAV.txt", [_nav_lines("AAA")])
+    engine = make_engine(tmp_path / "db.sqlite")
+
+    parse(cycle_a, nav_path, incremental=True)
+    parse(cycle_b, nav_path, **parse_kwargs)
+    # Cycle A again: its hashes were stored, but the rows are cycle B's now.
+    parse(cycle_a, nav_path, incremental=True)
+
+    full = make_engine(tmp_path / "full.db")
+    parse(cycle_a, nav_path)
+    assert dump_tables(engine, exclude=BOOKKEEPING) == dump_tables(
+        full, exclude=BOOKKEEPING
+    )
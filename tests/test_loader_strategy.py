@@ -0,0 +1,54 @@
+"""Tests for the eager loading strategy planned from include flags."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.engine import Engine as SAEngine
+
+    RecordQueries = Callable[[SAEngine], list[str]]
+
+
+@pytest.mark.fast
+def test_single_collection_is_joined(db: object, record_queries: RecordQueries) -> None:
+    """One collection is loaded by the airport's own query."""
+    statements = record_queries(db.Engine)  # type: ignore[attr-defined]
+    db.find_airport("ADK", ["runways"], use_cache=False)  # type: ignore[attr-defined]
+
+    (statement,) = statements
+    assert "JOIN runways" in statement
+
+
+@pytest.mark.fast
+def test_several_collections_are_selected_in(
+    db: object, record_queries: RecordQueries
+) -> None:
+    """Several collections get one IN query each instead of one joined product."""
+    statements = record_queries(db.Engine)  # type: ignore[attr-defined]
+    db.find_airport("ADK", ["runways", "remarks", "attendance"], use_cache=False)  # type: ignore[attr-defined]
+
+    assert len(statements) == 4
+    assert "JOIN" not in statements[0]
+    for table in ("runways", "airport_remarks", "attendance_schedules"):
+        assert any(f"FROM {table}" in statement for statement in statements[1:])
+
+
+@pytest.mark.fast
+def test_airport_runways_do_not_nest_runway_ends(
+    db: object, record_queries: RecordQueries
+) -> None:
+    """Runway ends are a runway include group, not an airport one."""
+    include = ["runways", "runway_ends"]
+    statements = record_queries(db.Engine)  # type: ignore[attr-defined]
+    airport = db.find_airport("ADK", include)  # type: ignore[attr-defined]
+    assert not any("FROM runway_ends" in statement for statement in statements)
+
+    payload = airport.to_dict(include)
+    assert payload["runways"] == airport.to_dict(["runways"])["runways"]
+    assert "runway_ends" not in payload["runways"][0]
+    assert payload == db.fetch_airport_payload("ADK", include)  # type: ignore[attr-defined]
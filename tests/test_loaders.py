@@ -0,0 +1,214 @@
+"""Tests for the bulk import mode of the APT/NAV parsers."""
+
+from __future__ import annotations
+
+import os
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import create_engine, select
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from types import ModuleType
+
+    from sqlalchemy.engine import Engine as SAEngine
+
+FIXTURES = Path(__file__).parent / "fixtures"
+# SQLAlchemy URL of a PostgreSQL database the COPY tests may create schemas in.
+POSTGRESQL_URL = os.getenv("AEROINFO_TEST_POSTGRESQL_URL")
+
+
+def _apt_with_remarks(tmp_path: Path) -> Path:
+    """Copy the APT fixture and append ARS and RMK records for ADK."""
+    site = "50009.*A".ljust(11) + "AK"
+    extra = [
+        "ARS" + site + "05/23".ljust(7) + "05 " + "BAK-12",
+        "RMK" + site + "A5".ljust(13) + "COUNTY REMARK",
+        "RMK" + site + "A31-05/23".ljust(13) + "LENGTH REMARK",
+        "RMK" + site + "A60-23".ljust(13) + "TORA REMARK",
+        "RMK" + site + "A110-1".ljust(13) + "GENERAL REMARK",
+        "RMK" + site + "A60-99".ljust(13) + "REMARK FOR A MISSING END",
+    ]
+    path = tmp_path / "APT.txt"
+    path.write_text((FIXTURES / "APT_min.txt").read_text() + "\n".join(extra) + "\n")
+    return path
+
+
+@pytest.fixture
+def load(
+    make_engine: Callable[..., SAEngine],
+    reload_parsers: Callable[[], tuple[ModuleType, ModuleType]],
+) -> Callable[..., SAEngine]:
+    """Return a function parsing APT/NAV into a fresh in-memory DB."""
+
+    def run(apt_path: Path, **parse_kwargs: object) -> SAEngine:
+        engine = make_engine()
+        apt_parser, nav_parser = reload_parsers()
+        apt_parser.parse(str(apt_path), **parse_kwargs)
+        nav_parser.parse(str(FIXTURES / "NAV_min.txt"), **parse_kwargs)
+        return engine
+
+    return run
+
+
+@pytest.fixture
+def postgresql_engine(monkeypatch: pytest.MonkeyPatch) -> Iterator[SAEngine]:
+    """
+    Return an engine on a throwaway schema of the PostgreSQL test database.
+
+    Like ``make_engine`` it is patched in as ``aeroinfo.database.Engine``
+    with the full schema created; the schema is dropped afterwards.
+    """
+    if not POSTGRESQL_URL:
+        pytest.skip("set AEROINFO_TEST_POSTGRESQL_URL to test against PostgreSQL")
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.schema import CreateSchema, DropSchema
+
+    import aeroinfo.database as db
+    from aeroinfo.database.base import Base
+
+    schema = f"aeroinfo_test_{uuid.uuid4().hex[:12]}"
+    admin = create_engine(POSTGRESQL_URL)
+    with admin.begin() as connection:
+        connection.execute(CreateSchema(schema))
+    # The COPY statements and staging tables use unqualified names.
+    engine = create_engine(
+        POSTGRESQL_URL, connect_args={"options": f"-csearch_path={schema}"}
+    )
+    monkeypatch.setattr(db, "Engine", engine)
+    monkeypatch.setattr(
+        db, "SessionLocal", sessionmaker(bind=engine, expire_on_commit=False)
+    )
+    try:
+        Base.metadata.create_all(engine)
+        yield engine
+    finally:
+        engine.dispose()
+        with admin.begin() as connection:
+            connection.execute(DropSchema(schema, cascade=True))
+        admin.dispose()
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("chunk_size", [1, 3, 1000])
+def test_bulk_mode_matches_merge_mode(
+    load: Callable[..., SAEngine],
+    dump_tables: Callable[..., dict[str, list[tuple[object, ...]]]],
+    tmp_path: Path,
+    chunk_size: int,
+) -> None:
+    """Bulk loading writes the same rows as merging, whatever the chunk size."""
+    apt_path = _apt_with_remarks(tmp_path)
+    merged = dump_tables(load(apt_path))
+    bulked = dump_tables(load(apt_path, bulk=True, chunk_size=chunk_size))
+
+    assert bulked == merged
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "parse_kwargs", [{}, {"bulk": True, "chunk_size": 2}], ids=["merge", "bulk"]
+)
+def test_remarks_are_applied(
+    load: Callable[..., SAEngine], tmp_path: Path, parse_kwargs: dict[str, object]
+) -> None:
+    """Remarks land on their airport, runway and runway end in either mode."""
+    from sqlalchemy.orm import Session
+
+    from aeroinfo.database.models.apt import Airport, AirportRemark, Runway, RunwayEnd
+    from aeroinfo.database.models.nav import Navaid
+
+    engine = load(_apt_with_remarks(tmp_path), **parse_kwargs)
+
+    with Session(engine) as session:
+        airport = session.get(Airport, "50009.*A")
+        assert airport is not None
+        assert airport.county_remark == "COUNTY REMARK"
+
+        runway = session.get(Runway, ("50009.*A", "05/23"))
+        assert runway is not None
+        assert runway.length_remark == "LENGTH REMARK"
+
+        base_end = session.get(RunwayEnd, ("50009.*A", "05/23", "05"))
+        recip_end = session.get(RunwayEnd, ("50009.*A", "05/23", "23"))
+        assert base_end is not None
+        assert recip_end is not None
+        assert base_end.arresting_gear == "BAK-12"
+        assert recip_end.takeoff_run_available_remark == "TORA REMARK"
+
+        general = session.scalars(select(AirportRemark.remark_element_name)).all()
+        assert sorted(general) == ["A110-1", "A60-99"]
+
+        # Both navaids in the fixture are written, including the last record.
+        assert len(session.scalars(select(Navaid)).all()) == 2
+
+
+@pytest.mark.fast
+def test_copy_loader_upsert_keeps_latest_staged_row() -> None:
+    """The staging upsert dedupes on primary key, newest staged row first."""
+    from sqlalchemy import BigInteger, Column, MetaData, Table
+    from sqlalchemy.dialects import postgresql
+
+    from aeroinfo.database.models.apt import AttendanceSchedule
+    from aeroinfo.parsers.loaders import CopyLoader
+
+    table = AttendanceSchedule.__table__
+    staging = Table(
+        "attendance_schedules__staging",
+        MetaData(),
+        *(Column(column.key, column.type) for column in table.columns),
+        Column(CopyLoader.SEQ_COLUMN, BigInteger),
+    )
+    sql = str(
+        CopyLoader.upsert_from_staging(table, staging).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+
+    assert "SELECT DISTINCT ON (" in sql
+    assert f"{CopyLoader.SEQ_COLUMN} DESC" in sql
+    assert "ON CONFLICT (facility_site_number, sequence_number) DO UPDATE" in sql
+
+
+@pytest.mark.fast
+def test_get_loader_falls_back_to_batched_upserts_on_sqlite() -> None:
+    """COPY is PostgreSQL-only; SQLite bulk loads use executemany upserts."""
+    from aeroinfo.parsers.loaders import BulkLoader, CopyLoader, get_loader
+
+    engine = create_engine("sqlite:///:memory:")
+    with engine.connect() as connection:
+        loader = get_loader(connection, bulk=True)
+        assert isinstance(loader, BulkLoader)
+        assert not isinstance(loader, CopyLoader)
+
+
+def test_copy_loader_matches_merge_mode_on_postgresql(
+    postgresql_engine: SAEngine,
+    reload_parsers: Callable[[], tuple[ModuleType, ModuleType]],
+    load: Callable[..., SAEngine],
+    dump_tables: Callable[..., dict[str, list[tuple[object, ...]]]],
+    tmp_path: Path,
+) -> None:
+    """COPY bulk loads write what merging does, including over existing rows."""
+    from aeroinfo.parsers.loaders import CopyLoader, get_loader
+
+    with postgresql_engine.connect() as connection:
+        assert isinstance(get_loader(connection, bulk=True), CopyLoader)
+
+    apt_path = _apt_with_remarks(tmp_path)
+    # Schedule 01 repeats after a chunk boundary; the later record wins.
+    att = "ATT" + "50009.*A".ljust(11) + "AK"
+    with apt_path.open("a") as apt_file:
+        for sequence, schedule in (("01", "0800-1700"), ("02", "24"), ("01", "24")):
+            apt_file.write(f"{att}{sequence}ALL/ALL/{schedule}\n")
+    apt_parser, nav_parser = reload_parsers()
+    # The second pass upserts every staged row over the rows of the first.
+    for _ in range(2):
+        apt_parser.parse(str(apt_path), bulk=True, chunk_size=2)
+        nav_parser.parse(str(FIXTURES / "NAV_min.txt"), bulk=True, chunk_size=2)
+    copied = dump_tables(postgresql_engine)
+
+    assert copied == dump_tables(load(apt_path))
@@ -0,0 +1,125 @@
+"""Tests for the parallel (multi-process) APT parse mode."""
+
+from __future__ import annotations
+
+import importlib
+import itertools
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+    from types import ModuleType
+
+    from sqlalchemy.engine import Engine as SAEngine
+
+SITE = "50009.*A"
+
+
+@pytest.fixture
+def apt_file(write_apt: Callable[..., Path], tmp_path: Path) -> Callable[..., Path]:
+    """Return a function writing an APT.txt holding six copies of the fixture."""
+
+    def write(*, late_remark: bool = False) -> Path:
+        path = write_apt(
+            tmp_path / "APT.txt",
+            [f"5000{n}.*A" for n in range(6)],
+            [
+                "RMK" + SITE.ljust(11) + "AK" + "A5".ljust(13) + "COUNTY REMARK",
+                "RMK" + SITE.ljust(11) + "AK" + "A110-1".ljust(13) + "GENERAL REMARK",
+            ],
+        )
+        if late_remark:
+            # A remark for the first facility after all the others.
+            with path.open("a") as f:
+                f.write("RMK" + "50000.*A".ljust(11) + "AK" + "A1".ljust(13) + "LATE\n")
+        return path
+
+    return write
+
+
+@pytest.fixture
+def load(
+    make_engine: Callable[..., SAEngine],
+    reload_parsers: Callable[[], tuple[ModuleType, ModuleType]],
+) -> Callable[..., SAEngine]:
+    """Return a function parsing an APT.txt into a fresh in-memory DB."""
+
+    def run(apt_path: Path, **parse_kwargs: object) -> SAEngine:
+        engine = make_engine()
+        apt_parser, _ = reload_parsers()
+        apt_parser.parse(str(apt_path), **parse_kwargs)
+        return engine
+
+    return run
+
+
+@pytest.mark.fast
+def test_facility_ranges_split_at_apt_records(
+    apt_file: Callable[..., Path],
+) -> None:
+    """Every range starts at an APT record and together they cover the file."""
+    from aeroinfo.parsers.apt import _facility_ranges
+
+    path = apt_file()
+    ranges = _facility_ranges(path, 4)
+    data = path.read_bytes()
+
+    assert len(ranges) > 1
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len(data)
+    assert all(end == start for (_, end), (start, _) in itertools.pairwise(ranges))
+    assert all(data[start:].startswith(b"APT") for start, _ in ranges)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    "file_kwargs", [{}, {"late_remark": True}], ids=["ordered", "late"]
+)
+@pytest.mark.parametrize("parse_kwargs", [{}, {"bulk": True}], ids=["merge", "bulk"])
+def test_parallel_parse_matches_serial(
+    apt_file: Callable[..., Path],
+    load: Callable[..., SAEngine],
+    dump_tables: Callable[..., dict[str, list[tuple[object, ...]]]],
+    parse_kwargs: dict[str, object],
+    file_kwargs: dict[str, bool],
+) -> None:
+    """Decoding in worker processes writes exactly what a serial parse does."""
+    path = apt_file(**file_kwargs)
+    serial = dump_tables(load(path, **parse_kwargs))
+    parallel = dump_tables(load(path, workers=2, **parse_kwargs))
+
+    assert parallel == serial
+    assert len(serial["airports"]) == 6
+
+
+@pytest.mark.fast
+def test_workers_are_not_forked(
+    monkeypatch: pytest.MonkeyPatch,
+    apt_file: Callable[..., Path],
+    load: Callable[..., SAEngine],
+    make_engine: Callable[..., SAEngine],
+    dump_tables: Callable[..., dict[str, list[tuple[object, ...]]]],
+) -> None:
+    """Workers start from a fresh interpreter rather than a fork of the importer."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    methods: list[str] = []
+
+    def executor(**kwargs: Any) -> ProcessPoolExecutor:  # noqa: ANN401
+        methods.append(kwargs["mp_context"].get_start_method())
+        return ProcessPoolExecutor(**kwargs)
+
+    path = apt_file()
+    serial = dump_tables(load(path))
+    apt_parser = importlib.import_module("aeroinfo.parsers.apt")
+    monkeypatch.setattr(apt_parser, "ProcessPoolExecutor", executor)
+    monkeypatch.setattr(apt_parser, "Engine", make_engine())
+    apt_parser.parse(str(path), workers=2)
+    parallel = dump_tables(apt_parser.Engine)
+
+    assert methods
+    assert "fork" not in methods
+    assert parallel == serial
@@ -0,0 +1,111 @@
+"""Tests for the fixed-width record helpers in aeroinfo.parsers.utils."""
+
+from __future__ import annotations
+
+import datetime
+from pathlib import Path
+
+import pytest
+
+from aeroinfo.parsers import apt, nav
+from aeroinfo.parsers.utils import RecordLayout, get_field
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    ("fixture", "record_type", "layouts"),
+    [
+        ("APT_min.txt", "APT", [apt._APT]),
+        ("APT_min.txt", "RWY", [apt._RWY, apt._RWY_BASE_END, apt._RWY_RECIP_END]),
+        ("NAV_min.txt", "NAV1", [nav._NAV1]),
+    ],
+    ids=["apt", "rwy", "nav"],
+)
+def test_layout_decodes_like_get_field(
+    fixture: str, record_type: str, layouts: list[RecordLayout]
+) -> None:
+    """A compiled layout yields exactly what get_field does for each spec."""
+    line = next(
+        line
+        for line in (FIXTURES / fixture).read_text().splitlines()
+        if line.startswith(record_type)
+    )
+
+    for layout in layouts:
+        expected = {
+            name: get_field(line, start, length, *rest)
+            for name, start, length, *rest in layout.fields
+        }
+        assert layout.decode(line) == expected
+
+
+@pytest.mark.fast
+def test_layout_decodes_blank_and_short_records() -> None:
+    """Blank fields, and fields past the end of the line, decode to None."""
+    layout = RecordLayout([("a", 1, 3), ("b", 4, 2, "int"), ("c", 10, 5, "bool")])
+
+    assert layout.decode("XY  7") == {"a": "XY", "b": 7, "c": None}
+    assert layout.decode("") == {"a": None, "b": None, "c": None}
+
+
+@pytest.mark.fast
+def test_layout_rejects_bad_specs() -> None:
+    """Unknown var_types and repeated names fail when the layout is built."""
+    with pytest.raises(ValueError, match="Unknown var_type"):
+        RecordLayout([("a", 1, 3, "decimal")])
+    with pytest.raises(ValueError, match="appears twice"):
+        RecordLayout([("a", 1, 3), ("a", 4, 3)])
+
+
+NASR_DATES = [
+    "10/30/2025",
+    "04/04/2017",
+    "02/29/2024",
+    "12/31/1999",
+    "04/1949",
+    "02/1949",
+    "12/2000",
+    # Not NASR formats; these go through the dateutil fallback.
+    "1/2/2003",
+    "13/05/2017",
+    "2017-04-04",
+    "04/04/17",
+]
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("value", NASR_DATES)
+def test_date_fields_match_dateutil(value: str) -> None:
+    """The fast date decoder returns exactly what dateutil would."""
+    from dateutil import parser as dateparser
+
+    decoded = get_field(value, 1, len(value), "date")
+
+    assert decoded == dateparser.parse(value)
+    assert type(decoded) is datetime.datetime
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("day", [1, 28, 30, 31])
+def test_month_year_dates_take_the_day_from_today(day: int) -> None:
+    """MM/YYYY uses today's day, clipped to the month, as dateutil does."""
+    from dateutil import parser as dateparser
+
+    from aeroinfo.parsers.utils import _decode_date
+
+    today = datetime.date(2026, 1, day)
+    default = datetime.datetime(2026, 1, day)
+    for value in ("02/1949", "02/2024", "04/1949", "12/2000"):
+        assert _decode_date(value, today) == dateparser.parse(value, default=default)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("value", ["02/30/2020", "00/10/2020", "LS", "0ASPH-G"])
+def test_bad_dates_raise_like_dateutil(value: str) -> None:
+    """Values dateutil rejects are still rejected."""
+    from dateutil.parser import ParserError
+
+    with pytest.raises(ParserError):
+        get_field(value, 1, len(value), "date")
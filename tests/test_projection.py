@@ -0,0 +1,70 @@
+"""Tests for loading only the columns the requested include groups need."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import inspect
+
+INCLUDES = ([], ["demographic"], ["geographic", "runways"], ["all", "remarks"])
+
+
+@pytest.fixture
+def project(db: object, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Turn column projection on (AEROINFO_PROJECT_COLUMNS=1)."""
+    monkeypatch.setattr(db, "_PROJECT_COLUMNS", True)
+
+
+@pytest.mark.fast
+def test_full_rows_are_loaded_by_default(db: object) -> None:
+    """Without AEROINFO_PROJECT_COLUMNS, detached airports carry every column."""
+    airport = db.find_airport("ADK", use_cache=False)  # type: ignore[attr-defined]
+
+    assert not inspect(airport).unloaded - {
+        "remarks",
+        "runways",
+        "attendance_schedules",
+    }
+    assert airport.city == "ADAK ISLAND"
+
+
+@pytest.mark.fast
+@pytest.mark.usefixtures("project")
+def test_only_requested_groups_are_loaded(db: object) -> None:
+    """Columns outside the include groups are left unloaded."""
+    airport = db.find_airport("ADK", include=["demographic", "runways"])  # type: ignore[attr-defined]
+
+    unloaded = inspect(airport).unloaded
+    assert {"faa_id", "region", "city", "runways"}.isdisjoint(unloaded)
+    assert {"owners_name", "latitude_secs", "fuel_available"} <= unloaded
+    assert "length_source" in inspect(airport.runways[0]).unloaded
+    assert "length" not in inspect(airport.runways[0]).unloaded
+
+
+@pytest.mark.fast
+@pytest.mark.usefixtures("project")
+@pytest.mark.parametrize("include", INCLUDES)
+def test_projected_to_dict_matches_full_load(
+    db: object, monkeypatch: pytest.MonkeyPatch, include: list[str]
+) -> None:
+    """to_dict() returns the same payload with or without projection."""
+    projected = db.find_airport("ADK", include, use_cache=False)  # type: ignore[attr-defined]
+    monkeypatch.setattr(db, "_PROJECT_COLUMNS", False)
+    full = db.find_airport("ADK", include, use_cache=False)  # type: ignore[attr-defined]
+
+    assert not inspect(full).unloaded - {"remarks", "runways", "attendance_schedules"}
+    assert projected.to_dict(include=include) == full.to_dict(include=include)
+
+
+@pytest.mark.fast
+@pytest.mark.usefixtures("project")
+def test_runway_and_end_lookups_project_and_load_on_access(db: object) -> None:
+    """Runway lookups project too; deferred columns load while the session is open."""
+    with db.session_scope() as session:  # type: ignore[attr-defined]
+        runway = db.find_runway("05/23", "ADK", session=session)  # type: ignore[attr-defined]
+        end = db.find_runway_end("05", runway, ["lighting"], session=session)  # type: ignore[attr-defined]
+
+        assert "length_source" in inspect(runway).unloaded
+        assert "visual_glide_slope_indicators" not in inspect(end).unloaded
+        assert "arresting_gear" in inspect(end).unloaded
+        _ = runway.length_source
+        assert "length_source" not in inspect(runway).unloaded
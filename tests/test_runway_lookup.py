@@ -0,0 +1,75 @@
+"""Tests for resolving runways and runway ends by exact, indexed matches."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from sqlalchemy.engine import Engine as SAEngine
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("name", ["05/23", "05", "23", " 23 "])
+def test_runway_resolves_by_name_or_end_id(db: object, name: str) -> None:
+    """A runway is found by its full name or by either end's ID."""
+    runway = db.find_runway(name, "ADK")  # type: ignore[attr-defined]
+
+    assert runway is not None
+    assert runway.name == "05/23"
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("name", ["5", "0", "5/2", "23/05"])
+def test_runway_does_not_match_substrings(db: object, name: str) -> None:
+    """Partial names no longer match a runway that merely contains them."""
+    assert db.find_runway(name, "ADK") is None  # type: ignore[attr-defined]
+
+
+@pytest.mark.fast
+def test_runway_lookup_by_identifier_is_one_query(
+    db: object, record_queries: Callable[[SAEngine], list[str]]
+) -> None:
+    """An airport identifier is resolved inside the runway query."""
+    statements = record_queries(db.Engine)  # type: ignore[attr-defined]
+    runway = db.find_runway("23", "PADK")  # type: ignore[attr-defined]
+
+    assert runway is not None
+    assert len(statements) == 1
+    assert "LIKE" not in statements[0]
+    assert db.find_runway("23", "NONE") is None  # type: ignore[attr-defined]
+
+
+@pytest.mark.fast
+def test_runway_end_from_tuple_is_one_query(
+    db: object, record_queries: Callable[[SAEngine], list[str]]
+) -> None:
+    """(runway, airport) tuples resolve the runway end in a single query."""
+    airport = db.find_airport("ADK", use_cache=False)  # type: ignore[attr-defined]
+    statements = record_queries(db.Engine)  # type: ignore[attr-defined]
+
+    end = db.find_runway_end("23", ("05", "ADK"))  # type: ignore[attr-defined]
+    assert end is not None
+    assert (end.runway_name, end.id) == ("05/23", "23")
+    assert db.find_runway_end("05", ("05/23", airport)).id == "05"  # type: ignore[attr-defined]
+    assert len(statements) == 2
+    assert db.find_runway_end("23", ("5", "ADK")) is None  # type: ignore[attr-defined]
+
+
+@pytest.mark.fast
+def test_runway_end_lookup_uses_index(db: object) -> None:
+    """SQLite plans the end ID lookup on the runway end index."""
+    from sqlalchemy.dialects import sqlite
+
+    compiled = db._runway_stmt("23", "ADK", frozenset()).compile(  # type: ignore[attr-defined]
+        dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    with db.Engine.connect() as connection:  # type: ignore[attr-defined]
+        plan = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").all()
+
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_runway_ends_facility_id_name" in details
+    assert "SCAN runways" not in details
@@ -0,0 +1,87 @@
+"""Tests for the compiled to_dict field plans."""
+
+from __future__ import annotations
+
+import datetime
+import importlib
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from aeroinfo.database import enums
+from aeroinfo.database.models.apt import Airport, RunwayEnd
+from aeroinfo.database.serializers import compile_fields
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+@pytest.mark.fast
+def test_plans_are_compiled_once_per_include_set() -> None:
+    """The same model and groups share one plan; "all" selects every group."""
+    plan = compile_fields(Airport, frozenset({"demographic", "geographic"}))
+    assert compile_fields(Airport, frozenset({"geographic", "demographic"})) is plan
+    assert plan.names[: len(Airport._dict_attrs)] == Airport._dict_attrs
+    assert "region" in plan.names
+    assert "owners_name" not in plan.names
+
+    everything = compile_fields(Airport, frozenset({"all"})).names
+    assert len(everything) == len(Airport._dict_attrs) + sum(
+        len(attrs) for attrs in Airport._dict_groups.values()
+    )
+
+
+@pytest.mark.fast
+def test_to_dict_converts_by_column_type() -> None:
+    """Enums become descriptions, dates ISO strings, unset attributes None."""
+    airport = Airport(
+        facility_site_number="1",
+        faa_id="TST",
+        region=enums.FAARegionEnum.AGL,
+        effective_date=datetime.date(2024, 1, 25),
+        activation_date=datetime.date(1950, 6, 1),
+    )
+    payload = airport.to_dict(include=["demographic", "fedstatus"])
+
+    assert list(payload)[:6] == list(Airport._dict_attrs)
+    assert payload["region"] == "GREAT LAKES"
+    assert payload["effective_date"] == "2024-01-25"
+    assert payload["activation_date"] == "1950-06-01"
+    assert payload["name"] is None
+    assert RunwayEnd(id="09").to_dict() == {
+        "id": "09",
+        **dict.fromkeys(RunwayEnd._dict_attrs[1:]),
+    }
+
+
+@pytest.mark.fast
+def test_to_dict_passes_raw_enum_codes_through() -> None:
+    """Enum columns holding the raw code string are returned unchanged."""
+    airport = Airport(facility_site_number="1", region="AGL")
+
+    assert airport.to_dict(include=["all"])["region"] == "AGL"
+
+
+@pytest.mark.fast
+def test_to_dict_loads_expired_attributes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Attributes missing from an instance's state are loaded, not skipped."""
+    import aeroinfo.database as db
+    from aeroinfo.database.base import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'serializers.db'}")
+    monkeypatch.setattr(db, "Engine", engine)
+    Base.metadata.create_all(engine)
+    importlib.reload(importlib.import_module("aeroinfo.parsers.apt")).parse(
+        str(FIXTURES / "APT_min.txt")
+    )
+
+    with Session(engine) as session:
+        airport = session.execute(select(Airport)).scalars().one()
+        expected = airport.to_dict(include=["all"])
+        session.expire(airport, ["name", "region"])
+
+        assert airport.to_dict(include=["all"]) == expected
+        assert expected["faa_id"] == "ADK"
@@ -0,0 +1,165 @@
+"""Tests for the cross-process shared lookup cache."""
+
+from __future__ import annotations
+
+import importlib
+import multiprocessing
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from aeroinfo.database.cache import MISSING
+from aeroinfo.database.shared_cache import SharedCache
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _bump_generation(path: Path) -> None:
+    SharedCache(path).bump_generation()
+
+
+def _bump_in_subprocess(path: Path) -> None:
+    # A fresh interpreter, so nothing is inherited from this process.
+    worker = multiprocessing.get_context("spawn").Process(
+        target=_bump_generation, args=(path,)
+    )
+    worker.start()
+    worker.join()
+    assert worker.exitcode == 0
+
+
+def _import_without_fcntl() -> None:
+    import sys
+
+    # Loading this module already imported aeroinfo; import it afresh.
+    for name in [name for name in sys.modules if name.startswith("aeroinfo")]:
+        del sys.modules[name]
+    sys.modules["fcntl"] = None  # type: ignore[assignment]
+    import aeroinfo.database as db
+    from aeroinfo.database.shared_cache import SharedCache
+
+    assert db.cache_stats()["shared"] is None
+    try:
+        SharedCache("unused.cache")
+    except RuntimeError:
+        return
+    raise AssertionError
+
+
+def _put_from_child(cache: SharedCache) -> None:
+    cache.put("child", {"pid": "forked"}, cache.generation)
+
+
+@pytest.mark.fast
+def test_round_trip_and_oversize(tmp_path: Path) -> None:
+    """Payloads come back as stored; ones bigger than a slot aren't kept."""
+    cache = SharedCache(tmp_path / "shared.cache", slots=8, slot_size=256)
+    generation = cache.generation
+    payload = {"faa_id": "ADK", "runways": [{"name": "05/23"}], "elevation": None}
+
+    assert cache.get("ADK") is MISSING
+    assert cache.put("ADK", payload, generation)
+    assert not cache.put("big", {"name": "x" * 1000}, generation)
+    assert cache.get("ADK") == payload
+    assert cache.get("big") is MISSING
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["stores"]) == (1, 2, 1)
+    assert stats["oversize"] == 1
+    cache.close()
+
+
+@pytest.mark.fast
+def test_generation_bump_in_another_process(tmp_path: Path) -> None:
+    """Bumping the generation anywhere invalidates entries everywhere."""
+    path = tmp_path / "shared.cache"
+    cache = SharedCache(path, slots=8, slot_size=256)
+    generation = cache.generation
+    cache.put("ADK", {"faa_id": "ADK"}, generation)
+
+    _bump_in_subprocess(path)
+
+    assert cache.generation == generation + 1
+    assert cache.get("ADK") is MISSING
+    # A payload built before the bump isn't stored under the new generation.
+    assert not cache.put("ADK", {"faa_id": "ADK"}, generation)
+    cache.close()
+
+
+@pytest.mark.fast
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="needs fork"
+)
+def test_forked_child_shares_entries(tmp_path: Path) -> None:
+    """A forked child reopens the file and its entries reach the parent."""
+    cache = SharedCache(tmp_path / "shared.cache", slots=8, slot_size=256)
+    assert cache.get("child") is MISSING
+
+    child = multiprocessing.get_context("fork").Process(
+        target=_put_from_child, args=(cache,)
+    )
+    child.start()
+    child.join()
+
+    assert child.exitcode == 0
+    assert cache.get("child") == {"pid": "forked"}
+    cache.close()
+
+
+@pytest.mark.fast
+def test_find_airport_payload_uses_shared_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Payloads are served from the shared cache until another process invalidates."""
+    import aeroinfo.database as db
+    from aeroinfo.database.base import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'shared.db'}")
+    monkeypatch.setattr(db, "Engine", engine)
+    monkeypatch.setattr(db, "SessionLocal", sessionmaker(bind=engine))
+    Base.metadata.create_all(engine)
+    importlib.reload(importlib.import_module("aeroinfo.parsers.apt")).parse(
+        str(FIXTURES / "APT_min.txt")
+    )
+    path = tmp_path / "shared.cache"
+    db.configure_shared_cache(path, slots=64, slot_size=1 << 16)
+    try:
+        payload = db.find_airport_payload("adk", include=["runways"])
+        assert payload is not None
+        assert payload["icao_id"] == "PADK"
+        assert payload["runways"][0]["name"] == "05/23"
+        airport = db.find_airport("ADK")
+
+        calls = []
+        fetch = db.fetch_airport_payload
+        monkeypatch.setattr(
+            db,
+            "fetch_airport_payload",
+            lambda *a, **kw: calls.append(a) or fetch(*a, **kw),
+        )
+        assert db.find_airport_payload("ADK", include=["runways"]) == payload
+        assert calls == []
+
+        _bump_in_subprocess(path)
+
+        assert db.find_airport_payload("ADK", include=["runways"]) == payload
+        assert len(calls) == 1
+        # The in-process ORM cache was retired by the other process too.
+        assert db.find_airport("ADK") is not airport
+        stats = db.cache_stats()["shared"]
+    finally:
+        db.configure_shared_cache(None)
+        db.invalidate_caches()
+
+    assert (stats["hits"], stats["misses"], stats["stores"]) == (1, 2, 2)
+
+
+@pytest.mark.fast
+def test_package_imports_without_fcntl() -> None:
+    """Without fcntl the package still imports; only the shared cache is refused."""
+    worker = multiprocessing.get_context("spawn").Process(target=_import_without_fcntl)
+    worker.start()
+    worker.join()
+    assert worker.exitcode == 0
@@ -0,0 +1,92 @@
+"""Tests for the read-only SQLite snapshot export."""
+
+from __future__ import annotations
+
+import datetime
+import importlib
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+FIXTURES = Path(__file__).parent / "fixtures"
+SITE = "50009.*A"
+
+
+def _source(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> object:
+    """Load the fixtures twice over, with one airport superseded by a newer one."""
+    import aeroinfo.database as db
+    from aeroinfo.database.base import Base
+    from aeroinfo.database.models.apt import Airport
+
+    apt_path = tmp_path / "APT.txt"
+    facility = (FIXTURES / "APT_min.txt").read_text().splitlines()
+    apt_path.write_text(
+        "".join(
+            line.replace(SITE, site) + "\n"
+            for site in ("50001.*A", "50002.*A")
+            for line in facility
+        )
+    )
+    engine = create_engine(f"sqlite:///{tmp_path / 'source.db'}")
+    monkeypatch.setattr(db, "Engine", engine)
+    Base.metadata.create_all(engine)
+    apt = importlib.reload(importlib.import_module("aeroinfo.parsers.apt"))
+    nav = importlib.reload(importlib.import_module("aeroinfo.parsers.nav"))
+    apt.parse(str(apt_path), bulk=True)
+    nav.parse(str(FIXTURES / "NAV_min.txt"), bulk=True)
+    with engine.begin() as connection:
+        connection.execute(
+            update(Airport)
+            .where(Airport.facility_site_number == "50001.*A")
+            .values(effective_date=datetime.date(2001, 1, 1))
+        )
+    return engine
+
+
+@pytest.mark.fast
+def test_snapshot_serves_latest_facilities(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Query helpers read the newest records from an immutable snapshot."""
+    import aeroinfo.database as db
+
+    source = _source(monkeypatch, tmp_path)
+    exporter = importlib.import_module("aeroinfo.export_snapshot")
+    destination = tmp_path / "snapshot.db"
+    rows = exporter.export_snapshot(destination, source)
+
+    assert rows > 0
+    assert not destination.with_name("snapshot.db.tmp").exists()
+    tables = inspect(create_engine(f"sqlite:///{destination}")).get_table_names()
+    assert "facility_fingerprints" not in tables
+
+    monkeypatch.setenv("DB_RDBM", db.SNAPSHOT_RDBM)
+    monkeypatch.setenv("DB_HOST", str(destination))
+    assert "immutable=1" in db.get_db_url()
+    engine = db._LazyEngine()
+    monkeypatch.setattr(db, "Engine", engine)
+    monkeypatch.setattr(db, "SessionLocal", sessionmaker(bind=engine))
+
+    airport = db.find_airport("ADK", use_cache=False)
+    assert airport is not None
+    assert airport.facility_site_number == "50002.*A"
+    with db.get_session() as session:
+        assert session.query(db.Airport).count() == 1
+    assert db.find_navaid("BER", "TACAN", use_cache=False) is not None
+    with engine.connect() as connection, pytest.raises(OperationalError):
+        connection.exec_driver_sql("DELETE FROM airports")
+    engine.dispose()
+
+
+@pytest.mark.fast
+def test_snapshot_mode_requires_a_file(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Snapshot mode needs DB_HOST to name the snapshot."""
+    import aeroinfo.database as db
+
+    monkeypatch.setenv("DB_RDBM", db.SNAPSHOT_RDBM)
+    monkeypatch.delenv("DB_HOST", raising=False)
+    with pytest.raises(RuntimeError, match="snapshot file"):
+        db.get_db_url()
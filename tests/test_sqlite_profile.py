@@ -0,0 +1,65 @@
+"""Tests for the SQLite load and read profiles."""
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+
+import pytest
+
+
+def _pragmas(engine: object, *names: str) -> dict[str, object]:
+    with engine.connect() as connection:  # type: ignore[attr-defined]
+        return {
+            name: connection.exec_driver_sql(f"PRAGMA {name}").scalar_one()
+            for name in names
+        }
+
+
+@pytest.mark.fast
+def test_load_profile_sets_pragmas(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Every connection of a load-profile engine gets the bulk-load PRAGMAs."""
+    import aeroinfo.database as db
+
+    monkeypatch.setenv("DB_RDBM", "sqlite")
+    monkeypatch.setenv("DB_HOST", f"/{tmp_path / 'load.db'}")
+    engine = db._create_engine_safely({"sqlite_profile": "load"})
+
+    assert _pragmas(engine, "journal_mode", "synchronous", "temp_store") == {
+        "journal_mode": "memory",
+        "synchronous": 0,
+        "temp_store": 2,
+    }
+    with pytest.raises(RuntimeError, match="Unknown SQLite profile"):
+        db._create_engine_safely({"sqlite_profile": "turbo"})
+
+
+@pytest.mark.fast
+def test_optimize_sqlite_switches_to_wal(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """A loaded database is analyzed, vacuumed and left in WAL mode."""
+    import aeroinfo.database as db
+    from aeroinfo.database.base import Base
+
+    monkeypatch.setenv("DB_RDBM", "sqlite")
+    monkeypatch.setenv("DB_HOST", f"/{tmp_path / 'snapshot.db'}")
+    engine = db._create_engine_safely({"sqlite_profile": "load"})
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(db, "Engine", engine)
+    parser = importlib.reload(importlib.import_module("aeroinfo.parsers.nav"))
+    parser.parse(str(Path(__file__).parent / "fixtures" / "NAV_min.txt"), bulk=True)
+    engine.dispose()
+
+    db.optimize_sqlite(db._create_engine_safely({"sqlite_profile": "read"}))
+
+    reader = db._create_engine_safely({"sqlite_profile": "read"})
+    assert _pragmas(reader, "journal_mode", "synchronous") == {
+        "journal_mode": "wal",
+        "synchronous": 1,
+    }
+    with reader.connect() as connection:
+        stats = connection.exec_driver_sql("SELECT count(*) FROM sqlite_stat1")
+        assert stats.scalar_one() > 0
@@ -0,0 +1,217 @@
+"""Tests for swap imports through shadow tables."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import event, inspect
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import ModuleType
+
+    from sqlalchemy.engine import Engine as SAEngine
+
+FIXTURES = Path(__file__).parent / "fixtures"
+SITE = "50009.*A"
+REMARK = "RMK" + SITE.ljust(11) + "AK" + "A110-1".ljust(13) + "REMARK"
+
+
+def _schema(engine: SAEngine) -> dict[str, object]:
+    """Describe every table the way a migration tool would compare them."""
+    inspector = inspect(engine)
+    return {
+        name: (
+            [
+                (c["name"], str(c["type"]), c["nullable"])
+                for c in inspector.get_columns(name)
+            ],
+            inspector.get_pk_constraint(name),
+            sorted(
+                (fk["referred_table"], fk["constrained_columns"])
+                for fk in inspector.get_foreign_keys(name)
+            ),
+            sorted(
+                (ix["name"], ix["column_names"]) for ix in inspector.get_indexes(name)
+            ),
+        )
+        for name in sorted(inspector.get_table_names())
+    }
+
+
+@pytest.mark.fast
+def test_swap_import_replaces_live_tables(
+    make_engine: Callable[..., SAEngine],
+    reload_parsers: Callable[[], tuple[ModuleType, ModuleType]],
+    write_apt: Callable[..., Path],
+    dump_tables: Callable[..., dict[str, list[tuple[object, ...]]]],
+    tmp_path: Path,
+) -> None:
+    """A swap import leaves the data and schema a fresh import would."""
+    old = write_apt(tmp_path / "old.txt", ["50001.*A", "50002.*A"], [REMARK])
+    new = write_apt(tmp_path / "new.txt", ["50002.*A", "50003.*A"], [REMARK])
+    nav_path = FIXTURES / "NAV_min.txt"
+
+    engine = make_engine(tmp_path / "swap.db")
+    apt, nav = reload_parsers()
+    apt.parse(str(old))
+    before = _schema(engine)
+
+    apt.parse(str(new), swap=True)
+    nav.parse(str(nav_path), swap=True)
+
+    assert _schema(engine) == before
+    swapped = dump_tables(engine)
+    assert sorted(row[0] for row in swapped["airports"]) == ["50002.*A", "50003.*A"]
+
+    fresh = make_engine(tmp_path / "fresh.db")
+    apt, nav = reload_parsers()
+    apt.parse(str(new), bulk=True)
+    nav.parse(str(nav_path), bulk=True)
+    assert swapped == dump_tables(fresh)
+
+
+@pytest.mark.fast
+def test_failed_swap_import_keeps_live_tables(
+    monkeypatch: pytest.MonkeyPatch,
+    make_engine: Callable[..., SAEngine],
+    reload_parsers: Callable[[], tuple[ModuleType, ModuleType]],
+    write_apt: Callable[..., Path],
+    dump_tables: Callable[..., dict[str, list[tuple[object, ...]]]],
+    tmp_path: Path,
+) -> None:
+    """If loading fails the shadow tables go away and the live data stays."""
+    engine = make_engine(tmp_path / "swap.db")
+    apt, _ = reload_parsers()
+    apt.parse(str(write_apt(tmp_path / "old.txt", ["50001.*A"], [REMARK])))
+    before = (_schema(engine), dump_tables(engine))
+
+    def broken(*_args: object) -> None:
+        msg = "disk full"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(apt, "_parse_lines", broken)
+    with pytest.raises(RuntimeError, match="disk full"):
+        apt.parse(
+            str(write_apt(tmp_path / "new.txt", ["50002.*A"], [REMARK])), swap=True
+        )
+
+    assert (_schema(engine), dump_tables(engine)) == before
+
+
+@pytest.mark.fast
+def test_swap_and_incremental_are_exclusive(
+    make_engine: Callable[..., SAEngine],
+    reload_parsers: Callable[[], tuple[ModuleType, ModuleType]],
+    tmp_path: Path,
+) -> None:
+    """An incremental import can't also be swapped in."""
+    make_engine(tmp_path / "swap.db")
+    apt, nav = reload_parsers()
+    with pytest.raises(RuntimeError, match="swapped in"):
+        apt.parse(str(FIXTURES / "APT_min.txt"), swap=True, incremental=True)
+    with pytest.raises(RuntimeError, match="swapped in"):
+        nav.parse(str(FIXTURES / "NAV_min.txt"), swap=True, incremental=True)
+
+
+def _live_only_schema(engine: SAEngine) -> None:
+    """Give the airports table a column and an index the models don't have."""
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "ALTER TABLE airports ADD COLUMN source VARCHAR(8) NOT NULL DEFAULT 'NASR'"
+        )
+        connection.exec_driver_sql(
+            "CREATE INDEX ix_airports_source_name ON airports (source, name DESC)"
+        )
+
+
+def _index_sql(engine: SAEngine) -> list[tuple[str, str]]:
+    # Renaming a table quotes its name in the index DDL SQLite keeps.
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+            " ORDER BY name"
+        )
+        return [(name, sql.replace('"', "")) for name, sql in rows]
+
+
+@pytest.mark.fast
+def test_swap_keeps_the_live_schema(
+    make_engine: Callable[..., SAEngine],
+    reload_parsers: Callable[[], tuple[ModuleType, ModuleType]],
+    write_apt: Callable[..., Path],
+    tmp_path: Path,
+) -> None:
+    """The shadow tables copy the live tables, not the models."""
+    engine = make_engine(tmp_path / "swap.db")
+    apt, _ = reload_parsers()
+    apt.parse(str(write_apt(tmp_path / "old.txt", ["50001.*A"], [REMARK])))
+    _live_only_schema(engine)
+    before = (_schema(engine), _index_sql(engine))
+
+    statements: list[str] = []
+    event.listen(engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    apt.parse(str(write_apt(tmp_path / "new.txt", ["50002.*A"], [REMARK])), swap=True)
+
+    assert (_schema(engine), _index_sql(engine)) == before
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("SELECT source FROM airports").all() == [
+            ("NASR",)
+        ]
+    # The indexes are built before the swap takes the write lock.
+    renames = [n for n, sql in enumerate(statements) if "RENAME TO" in sql]
+    creates = [n for n, sql in enumerate(statements) if "CREATE INDEX" in sql]
+    assert creates
+    assert max(creates) < min(renames)
+
+
+@pytest.mark.fast
+def test_failed_swap_restores_live_indexes(
+    monkeypatch: pytest.MonkeyPatch,
+    make_engine: Callable[..., SAEngine],
+    reload_parsers: Callable[[], tuple[ModuleType, ModuleType]],
+    write_apt: Callable[..., Path],
+    dump_tables: Callable[..., dict[str, list[tuple[object, ...]]]],
+    tmp_path: Path,
+) -> None:
+    """A swap failing after the shadow indexes are built leaves the live ones."""
+    from aeroinfo.parsers.shadow import ShadowTables
+
+    engine = make_engine(tmp_path / "swap.db")
+    apt, _ = reload_parsers()
+    apt.parse(str(write_apt(tmp_path / "old.txt", ["50001.*A"], [REMARK])))
+    _live_only_schema(engine)
+    before = (_schema(engine), _index_sql(engine), dump_tables(engine))
+
+    def broken(*_args: object) -> None:
+        msg = "database is locked"
+        raise RuntimeError(msg)
+
+    monkeypatch.setattr(ShadowTables, "swap", broken)
+    with pytest.raises(RuntimeError, match="locked"):
+        apt.parse(
+            str(write_apt(tmp_path / "new.txt", ["50002.*A"], [REMARK])), swap=True
+        )
+
+    assert (_schema(engine), _index_sql(engine), dump_tables(engine)) == before
+
+
+@pytest.mark.fast
+@pytest.mark.filterwarnings("ignore:Skipped unsupported reflection")
+def test_swap_refuses_expression_indexes(
+    make_engine: Callable[..., SAEngine],
+    reload_parsers: Callable[[], tuple[ModuleType, ModuleType]],
+    tmp_path: Path,
+) -> None:
+    """Indexes that can't be copied faithfully stop the import up front."""
+    engine = make_engine(tmp_path / "swap.db")
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "CREATE INDEX ix_airports_lower_name ON airports (lower(name))"
+        )
+    apt, _ = reload_parsers()
+    with pytest.raises(RuntimeError, match="ix_airports_lower_name"):
+        apt.parse(str(FIXTURES / "APT_min.txt"), swap=True)
+    assert not [name for name in inspect(engine).get_table_names() if "__" in name]
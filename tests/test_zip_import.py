@@ -0,0 +1,90 @@
+"""Tests for reading NASR records straight from the subscription zip."""
+
+from __future__ import annotations
+
+import io
+import zipfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import ModuleType
+
+    from sqlalchemy.engine import Engine as SAEngine
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _nasr_zip(tmp_path: Path) -> Path:
+    """Build a zip with APT.txt at the top and NAV.txt in a nested zip."""
+    inner = io.BytesIO()
+    with zipfile.ZipFile(inner, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.write(FIXTURES / "NAV_min.txt", "NAV.txt")
+
+    path = tmp_path / "28DaySubscription.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.write(FIXTURES / "APT_min.txt", "APT.txt")
+        zf.writestr("Additional_Data/NAV_DATA.zip", inner.getvalue())
+    return path
+
+
+@pytest.fixture
+def parse_into_fresh_db(
+    make_engine: Callable[..., SAEngine],
+    reload_parsers: Callable[[], tuple[ModuleType, ModuleType]],
+) -> Callable[[object, object], SAEngine]:
+    """Return a function parsing APT and NAV sources into a fresh in-memory DB."""
+
+    def run(apt_source: object, nav_source: object) -> SAEngine:
+        engine = make_engine()
+        apt, nav = reload_parsers()
+        apt.parse(apt_source)
+        nav.parse(nav_source)
+        return engine
+
+    return run
+
+
+@pytest.mark.fast
+def test_zip_members_parse_like_extracted_files(
+    parse_into_fresh_db: Callable[[object, object], SAEngine],
+    dump_tables: Callable[..., dict[str, list[tuple[object, ...]]]],
+    tmp_path: Path,
+) -> None:
+    """Records decoded from the zip, nested or not, match the plain files."""
+    from aeroinfo.parsers.utils import open_zip_member
+
+    archive = _nasr_zip(tmp_path)
+    extracted = dump_tables(
+        parse_into_fresh_db(
+            str(FIXTURES / "APT_min.txt"), str(FIXTURES / "NAV_min.txt")
+        )
+    )
+
+    with (
+        open_zip_member(archive, "APT.txt") as apt_stream,
+        open_zip_member(archive, "NAV.txt") as nav_stream,
+    ):
+        streamed = dump_tables(parse_into_fresh_db(apt_stream, nav_stream))
+    assert streamed == extracted
+    assert streamed["navaids"]
+
+    with open_zip_member(archive, "NAV.txt") as nav_stream:
+        member_path = zipfile.Path(archive, "APT.txt")
+        by_member = dump_tables(parse_into_fresh_db(member_path, nav_stream))
+    assert by_member == extracted
+
+
+@pytest.mark.fast
+def test_missing_zip_member_raises(tmp_path: Path) -> None:
+    """Asking for a file the archive doesn't hold fails clearly."""
+    from aeroinfo.parsers.utils import open_zip_member
+
+    with (
+        pytest.raises(FileNotFoundError, match=r"FIX\.txt"),
+        open_zip_member(_nasr_zip(tmp_path), "FIX.txt"),
+    ):
+        pass